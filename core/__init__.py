@@ -3,12 +3,23 @@ Vajra.Stream Core Package
 Core audio, visual, and database systems
 """
 
-# Conditional imports to avoid hard dependencies. The `audio_generator`
-# module imports `sounddevice` which can raise BOTH ImportError (package
-# missing) and OSError (PortAudio native lib missing), so we catch both.
-try:
-    from .audio_generator import BLESSING_FREQUENCIES, INTENTION_TO_FREQUENCY, ScalarWaveGenerator
+# Names re-exported from `audio_generator`. They resolve on first access so
+# that importing a light submodule (e.g. `core.healing_systems`) does not pay
+# for numpy/sounddevice. `audio_generator` imports `sounddevice`, which can
+# raise BOTH ImportError (package missing) and OSError (PortAudio native lib
+# missing), so we catch both.
+_AUDIO_EXPORTS = ("ScalarWaveGenerator", "BLESSING_FREQUENCIES", "INTENTION_TO_FREQUENCY")
 
-    __all__ = ["ScalarWaveGenerator", "BLESSING_FREQUENCIES", "INTENTION_TO_FREQUENCY"]
-except (ImportError, OSError):
-    __all__ = []
+
+def __getattr__(name):
+    if name == "__all__" or name in _AUDIO_EXPORTS:
+        try:
+            from . import audio_generator
+        except (ImportError, OSError) as exc:
+            if name == "__all__":
+                return []
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from exc
+        if name == "__all__":
+            return list(_AUDIO_EXPORTS)
+        return getattr(audio_generator, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
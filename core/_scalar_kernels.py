@@ -0,0 +1,96 @@
+"""
+Compiled kernels for the sequential scalar-wave methods.
+
+Lorenz, Rössler, cellular automata and Kuramoto steps depend on the previous
+step, so NumPy can only vectorize within a step. numba is not a dependency of
+the project; it is only probed for at import. When it is installed these
+loops compile to native code (``nogil`` so they can run beside the printing
+thread); without it they remain plain Python and are only used by the tests,
+``advanced_scalar_waves`` keeps its NumPy path instead.
+
+Each kernel fills ``out`` in place and advances the state array it is given.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Identity stand-in for ``numba.njit`` when numba is not installed."""
+
+        def decorate(func):
+            return func
+
+        return decorate
+
+
+@njit(cache=True, nogil=True)
+def lorenz_stream(state, sigma, rho, beta, dt, out):
+    """Integrate the Lorenz system ``out.size`` steps from ``state`` (x, y, z), writing normalized x."""
+    x, y, z = state[0], state[1], state[2]
+    for i in range(out.shape[0]):
+        x, y, z = (
+            x + sigma * (y - x) * dt,
+            y + (x * (rho - z) - y) * dt,
+            z + (x * y - beta * z) * dt,
+        )
+        out[i] = (math.sin(x * 0.1) + 1) / 2.0
+    state[0], state[1], state[2] = x, y, z
+
+
+@njit(cache=True, nogil=True)
+def rossler_stream(state, a, b, c, dt, out):
+    """Integrate the Rössler system ``out.size`` steps from ``state`` (x, y, z), writing normalized y."""
+    x, y, z = state[0], state[1], state[2]
+    for i in range(out.shape[0]):
+        x, y, z = (
+            x + (-y - z) * dt,
+            y + (x + a * y) * dt,
+            z + (b + z * (x - c)) * dt,
+        )
+        out[i] = (math.sin(y * 0.2) + 1) / 2.0
+    state[0], state[1], state[2] = x, y, z
+
+
+@njit(cache=True, nogil=True)
+def ca_entropy_stream(cells, rule_table, out):
+    """Evolve a wrapping 1D automaton ``out.size`` generations, writing each generation's entropy."""
+    size = cells.shape[0]
+    nxt = np.empty_like(cells)
+    for i in range(out.shape[0]):
+        ones = 0
+        for j in range(size):
+            index = (cells[j - 1] << 2) | (cells[j] << 1) | cells[(j + 1) % size]
+            nxt[j] = rule_table[index]
+            ones += nxt[j]
+        cells[:] = nxt
+        if ones == 0 or ones == size:
+            out[i] = 0.0
+        else:
+            p = ones / size
+            out[i] = -p * math.log2(p) - (1 - p) * math.log2(1 - p)
+
+
+@njit(cache=True, nogil=True)
+def kuramoto_order_stream(theta, omega_dt, k_dt, out):
+    """Advance coupled oscillators ``out.size`` steps, writing the order parameter after each step."""
+    n = theta.shape[0]
+    sin_t = np.sin(theta)
+    cos_t = np.cos(theta)
+    for i in range(out.shape[0]):
+        sin_sum = sin_t.sum()
+        cos_sum = cos_t.sum()
+        for j in range(n):
+            # Σ_k sin(θ_k - θ_j) = cos θ_j · Σ sin θ_k - sin θ_j · Σ cos θ_k
+            coupling = cos_t[j] * sin_sum - sin_t[j] * cos_sum
+            theta[j] = (theta[j] + omega_dt[j] + coupling * k_dt) % (2 * math.pi)
+            sin_t[j] = math.sin(theta[j])
+            cos_t[j] = math.cos(theta[j])
+        out[i] = math.hypot(cos_t.sum(), sin_t.sum()) / n
@@ -30,18 +30,30 @@ from enum import Enum
 
 # Try to import optimization libraries
 try:
-    import numpy as np  # noqa: F401 — availability probe; HAS_NUMPY is the runtime flag
+    import numpy as np
 
     HAS_NUMPY = True
 except ImportError:
     HAS_NUMPY = False
     print("Note: numpy not available - using pure Python (slower but works!)")
 
+# Compiled kernels for the sequential methods (needs numba on top of numpy)
+try:
+    from core import _scalar_kernels
+
+    HAS_NUMBA = _scalar_kernels.HAS_NUMBA
+except ImportError:
+    HAS_NUMBA = False
+
 
 # ============================================================================
 # CONFIGURATION & TYPES
 # ============================================================================
 
+# Mixing weights of the seven methods in the hybrid stream: quantum, Lorenz,
+# Rössler, cellular automata, Kuramoto, crypto, primes (sums to 1.0)
+HYBRID_WEIGHTS = (0.20, 0.15, 0.15, 0.15, 0.15, 0.10, 0.10)
+
 
 class WaveMethod(Enum):
     """Available scalar wave generation methods.
@@ -179,6 +191,11 @@ class QuantumRNG:
 
         return results
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate`: ``count`` values in [0, 1] drawn in one entropy read"""
+        ints = np.frombuffer(secrets.token_bytes(8 * count), dtype=np.uint64)
+        return ints / 2**64
+
     def generate_int(self, min_val: int, max_val: int) -> int:
         """Generate random integer in range"""
         float_val = self.generate(1)[0]
@@ -235,6 +252,27 @@ class LorenzAttractor:
             values.append(value)
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: the integration stays sequential, the normalization is one ufunc"""
+        if HAS_NUMBA:
+            state, out = np.array([self.x, self.y, self.z]), np.empty(count)
+            _scalar_kernels.lorenz_stream(state, self.sigma, self.rho, self.beta, self.dt, out)
+            self.x, self.y, self.z = state.tolist()
+            return out
+
+        sigma, rho, beta, dt = self.sigma, self.rho, self.beta, self.dt
+        x, y, z = self.x, self.y, self.z
+        xs = [0.0] * count
+        for i in range(count):
+            x, y, z = (
+                x + sigma * (y - x) * dt,
+                y + (x * (rho - z) - y) * dt,
+                z + (x * y - beta * z) * dt,
+            )
+            xs[i] = x
+        self.x, self.y, self.z = x, y, z
+        return (np.sin(np.array(xs) * 0.1) + 1) / 2.0
+
 
 class RosslerAttractor:
     """
@@ -279,6 +317,27 @@ class RosslerAttractor:
             values.append(value)
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: the integration stays sequential, the normalization is one ufunc"""
+        if HAS_NUMBA:
+            state, out = np.array([self.x, self.y, self.z]), np.empty(count)
+            _scalar_kernels.rossler_stream(state, self.a, self.b, self.c, self.dt, out)
+            self.x, self.y, self.z = state.tolist()
+            return out
+
+        a, b, c, dt = self.a, self.b, self.c, self.dt
+        x, y, z = self.x, self.y, self.z
+        ys = [0.0] * count
+        for i in range(count):
+            x, y, z = (
+                x + (-y - z) * dt,
+                y + (x + a * y) * dt,
+                z + (b + z * (x - c)) * dt,
+            )
+            ys[i] = y
+        self.x, self.y, self.z = x, y, z
+        return (np.sin(np.array(ys) * 0.2) + 1) / 2.0
+
 
 # ============================================================================
 # METHOD 3: CELLULAR AUTOMATA
@@ -333,6 +392,30 @@ class CellularAutomata1D:
             values.append(self.get_entropy())
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: each generation updates the whole grid at once"""
+        cells = np.array(self.cells, dtype=np.uint8)
+        rule_table = np.array(self.rule_table, dtype=np.uint8)
+        if HAS_NUMBA:
+            out = np.empty(count)
+            _scalar_kernels.ca_entropy_stream(cells, rule_table, out)
+            self.cells = cells.tolist()
+            return out
+
+        ones = np.empty(count)
+        for i in range(count):
+            # Neighbourhood index (left, center, right) for every cell, wrapping at the edges
+            ring = np.concatenate((cells[-1:], cells, cells[:1]))
+            cells = rule_table[(ring[:-2] << 2) | (cells << 1) | ring[2:]]
+            ones[i] = cells.sum()
+        self.cells = cells.tolist()
+
+        # Binary entropy of the live-cell fraction; uniform grids have none
+        p = ones / self.size
+        mixed = (p > 0.0) & (p < 1.0)
+        q = np.where(mixed, p, 0.5)
+        return np.where(mixed, -q * np.log2(q) - (1 - q) * np.log2(1 - q), 0.0)
+
 
 # ============================================================================
 # METHOD 4: NEURAL OSCILLATORS
@@ -397,6 +480,27 @@ class KuramotoOscillator:
             values.append(self.get_order_parameter())
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: all pairwise couplings of a step in one ufunc call"""
+        theta = np.array(self.theta)
+        omega_dt = np.array(self.omega) * self.dt
+        k_dt = self.K / self.n * self.dt
+        order = np.empty(count)
+        if HAS_NUMBA:
+            _scalar_kernels.kuramoto_order_stream(theta, omega_dt, k_dt, order)
+            self.theta = theta.tolist()
+            return order
+
+        sin_t, cos_t = np.sin(theta), np.cos(theta)
+        for i in range(count):
+            # Σ_j sin(θ_j - θ_i) = cos θ_i · Σ sin θ_j - sin θ_i · Σ cos θ_j
+            coupling = cos_t * sin_t.sum() - sin_t * cos_t.sum()
+            theta = (theta + omega_dt + coupling * k_dt) % (2 * math.pi)
+            sin_t, cos_t = np.sin(theta), np.cos(theta)
+            order[i] = math.hypot(cos_t.sum(), sin_t.sum()) / self.n
+        self.theta = theta.tolist()
+        return order
+
 
 # ============================================================================
 # METHOD 5: CRYPTOGRAPHIC MIXING
@@ -438,6 +542,11 @@ class CryptoMixer:
             values.append(float_val)
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: hashing stays sequential, the conversion is one buffer read"""
+        heads = b"".join(self.mix()[:8] for _ in range(count))
+        return np.frombuffer(heads, dtype=np.uint64) / 2**64
+
 
 # ============================================================================
 # METHOD 6: PRIME HARMONICS
@@ -485,6 +594,14 @@ class PrimeHarmonics:
 
         return values
 
+    def generate_array(self, count: int) -> "np.ndarray":
+        """Vectorized :meth:`generate_stream`: consecutive-prime ratios gathered in one step"""
+        primes = np.asarray(self.primes, dtype=np.float64)
+        index = (self.index + np.arange(count)) % len(primes)
+        ratio = primes[(index + 1) % len(primes)] / primes[index]
+        self.index += count
+        return np.clip((ratio - 1.0) / 0.5, 0.0, 1.0)
+
 
 # ============================================================================
 # HYBRID SYNTHESIS ENGINE
@@ -554,6 +671,37 @@ class HybridScalarWaveGenerator:
 
         return combined
 
+    def generate_hybrid_stream_np(self, count: int, out: "np.ndarray | None" = None) -> "np.ndarray":
+        """
+        NumPy form of :meth:`generate_hybrid_stream` for large batches.
+        Each method fills one array and the weighted mix is a single dot product.
+        The mix is float32: the methods integrate in float64, but the [0, 1]
+        output needs no more precision and the batch is half the size.
+
+        With ``out`` (float32, at least ``count`` long) the mix is written into
+        its leading samples and that view is returned instead of a new array.
+        """
+        self.thermal.update()
+        actual_count = max(1, int(count * self.thermal.get_throttle_factor()))
+
+        sources = np.stack(
+            (
+                self.qrng.generate_array(actual_count),
+                self.lorenz.generate_array(actual_count),
+                self.rossler.generate_array(actual_count),
+                self.ca.generate_array(actual_count),
+                self.kuramoto.generate_array(actual_count),
+                self.crypto.generate_array(actual_count),
+                self.primes.generate_array(actual_count),
+            ),
+            dtype=np.float32,
+        )
+        weights = np.asarray(HYBRID_WEIGHTS, dtype=np.float32)
+        combined = weights @ sources if out is None else np.matmul(weights, sources, out=out[:actual_count])
+
+        self.total_ops += 7 * actual_count
+        return combined
+
     def benchmark(self, duration_seconds: float = 10.0) -> MOPSMetrics:
         """
         Run benchmark to measure MOPS.
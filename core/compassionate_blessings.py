@@ -33,6 +33,28 @@ from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+# Shared by the single and batched dedication paths so their bookkeeping cannot drift apart
+_INSERT_DEDICATION_SQL = """
+    INSERT INTO mantra_dedications
+    (target_identifier, session_id, mantra_type, mantras_count,
+     dedication_date, dedicator, notes)
+    VALUES (?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Parameters: mantras, rotations, dedication timestamp, update timestamp, identifier
+_UPDATE_BLESSING_COUNT_SQL = """
+    UPDATE blessing_targets
+    SET mantras_dedicated = mantras_dedicated + ?,
+        prayer_wheel_rotations = prayer_wheel_rotations + ?,
+        dedication_sessions_json = json_insert(
+            COALESCE(dedication_sessions_json, '[]'),
+            '$[#]',
+            ?
+        ),
+        last_updated = ?
+    WHERE identifier = ?
+"""
+
 
 class BlessingCategory(Enum):
     """Categories of beings receiving blessings."""
@@ -406,21 +428,7 @@ class BlessingDatabase:
 
         # Append the new dedication timestamp to the JSON array (or start one)
         now_iso = datetime.now().isoformat()
-        cursor.execute(
-            """
-            UPDATE blessing_targets
-            SET mantras_dedicated = mantras_dedicated + ?,
-                prayer_wheel_rotations = prayer_wheel_rotations + ?,
-                dedication_sessions_json = json_insert(
-                    COALESCE(dedication_sessions_json, '[]'),
-                    '$[#]',
-                    ?
-                ),
-                last_updated = ?
-            WHERE identifier = ?
-        """,
-            (mantras, rotations, now_iso, now_iso, identifier),
-        )
+        cursor.execute(_UPDATE_BLESSING_COUNT_SQL, (mantras, rotations, now_iso, now_iso, identifier))
         conn.commit()
         conn.close()
 
@@ -477,12 +485,7 @@ class BlessingDatabase:
         cursor = conn.cursor()
 
         cursor.execute(
-            """
-            INSERT INTO mantra_dedications
-            (target_identifier, session_id, mantra_type, mantras_count,
-             dedication_date, dedicator, notes)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """,
+            _INSERT_DEDICATION_SQL,
             (target_identifier, session_id, mantra_type, mantras_count, datetime.now().isoformat(), dedicator, notes),
         )
 
@@ -492,6 +495,39 @@ class BlessingDatabase:
         # Update target counts
         self.update_blessing_count(target_identifier, mantras=mantras_count)
 
+    def record_dedications_batch(
+        self,
+        target_identifiers: list[str],
+        session_id: int,
+        mantra_type: str,
+        mantras_count: int,
+        dedicator: str = "",
+        notes: str = "",
+    ):
+        """Record the same dedication to many targets in one transaction.
+
+        Equivalent to calling :meth:`record_dedication` per target, but with a
+        single connection and commit instead of two per target.
+        """
+        now_iso = datetime.now().isoformat()
+        conn = sqlite3.connect(self.db_path)
+        try:
+            with conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    _INSERT_DEDICATION_SQL,
+                    [
+                        (identifier, session_id, mantra_type, mantras_count, now_iso, dedicator, notes)
+                        for identifier in target_identifiers
+                    ],
+                )
+                cursor.executemany(
+                    _UPDATE_BLESSING_COUNT_SQL,
+                    [(mantras_count, 0, now_iso, now_iso, identifier) for identifier in target_identifiers],
+                )
+        finally:
+            conn.close()
+
     def get_statistics(self) -> dict:
         """Get overall blessing statistics."""
         conn = sqlite3.connect(self.db_path)
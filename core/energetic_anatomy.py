@@ -12,8 +12,27 @@ and integration with audio/visual/radionics systems.
 """
 
 import json
+import re
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Word tokenizer for the keyword index
+_WORD_RE = re.compile(r"\w+")
+
+
+def _empty_search_result() -> dict[str, list]:
+    """Fresh result buckets for search_by_keyword"""
+    return {"meridians": [], "chakras": [], "tibetan_chakras": [], "winds": [], "dantians": []}
+
 
 # ============================================================================
 # ENUMERATIONS
@@ -576,6 +595,15 @@ class EnergeticAnatomyDatabase:
         # Cross-system
         self.correspondences: dict[str, SystemCorrespondence] = {}
 
+        # Lookup indexes (built once the systems are populated)
+        self._keyword_index: dict[str, dict[str, list]] = {}
+        self._search_text: dict[str, list[tuple[Any, str]]] = {}
+        self._corr_by_element_id: dict[str, SystemCorrespondence] = {}
+        self._by_element: dict[Element, list[Meridian | Chakra | TibetanChakra]] = {}
+        self._meridians_by_element: dict[Element, list[Meridian]] = {}
+        self._meridians_by_element_yy: dict[tuple[Element, YinYang | None], list[Meridian]] = {}
+        self._chakra_lookup: dict[str, Chakra] = {}
+
         # Initialize with default data
         self._initialize_systems()
 
@@ -585,6 +613,7 @@ class EnergeticAnatomyDatabase:
         self._init_tibetan_system()
         self._init_hindu_system()
         self._init_correspondences()
+        self._init_indexes()
 
     def _init_taoist_system(self):
         """Initialize Taoist meridians and dantians"""
@@ -1362,6 +1391,59 @@ class EnergeticAnatomyDatabase:
             confidence=0.95,
         )
 
+        # Reverse map: element id -> first correspondence that references it
+        self._corr_by_element_id = {}
+        for corr in self.correspondences.values():
+            for elem in (corr.taoist_element, corr.tibetan_element, corr.hindu_element):
+                if elem is not None:
+                    self._corr_by_element_id.setdefault(elem.id, corr)
+
+    def _search_fields(self) -> dict[str, tuple[dict, Callable[[Any], tuple[str, ...]]]]:
+        """Searchable text fields per search_by_keyword category"""
+        return {
+            "meridians": (self.meridians, lambda m: (m.name, m.description, m.organ)),
+            "chakras": (self.chakras, lambda c: (c.name, c.sanskrit_name, c.description)),
+            "tibetan_chakras": (self.tibetan_chakras, lambda tc: (tc.name, tc.description)),
+            "winds": (self.winds, lambda w: (w.name, w.description)),
+            "dantians": (self.dantians, lambda d: (d.name, d.description)),
+        }
+
+    def _init_indexes(self):
+        """Build lookup indexes over the populated systems"""
+        # One lowercased search blob per object, so a substring query is a
+        # single `in` test. Fields are joined with NUL so a keyword can't
+        # match across a field boundary.
+        self._search_text = {
+            category: [(obj, "\0".join(fields(obj)).lower()) for obj in items.values()]
+            for category, (items, fields) in self._search_fields().items()
+        }
+
+        # Inverted word index: lowercased word -> category -> objects
+        self._keyword_index = {}
+        for category, entries in self._search_text.items():
+            for obj, blob in entries:
+                for word in set(_WORD_RE.findall(blob)):
+                    buckets = self._keyword_index.setdefault(word, _empty_search_result())
+                    buckets[category].append(obj)
+
+        # Element index, in meridian -> chakra -> Tibetan chakra order
+        self._by_element = {}
+        for obj in (*self.meridians.values(), *self.chakras.values(), *self.tibetan_chakras.values()):
+            if obj.element is not None:
+                self._by_element.setdefault(obj.element, []).append(obj)
+
+        self._meridians_by_element = {}
+        self._meridians_by_element_yy = {}
+        for m in self.meridians.values():
+            self._meridians_by_element.setdefault(m.element, []).append(m)
+            self._meridians_by_element_yy.setdefault((m.element, m.yin_yang), []).append(m)
+
+        # Exact chakra names: id, English name, Sanskrit name (all lowercased)
+        self._chakra_lookup = {}
+        for c in self.chakras.values():
+            for key in (c.id, c.name.lower(), c.sanskrit_name.lower()):
+                self._chakra_lookup.setdefault(key, c)
+
     # Query methods
     def get_all_chakras(self) -> list[Chakra]:
         """Get all Hindu chakras"""
@@ -1377,68 +1459,32 @@ class EnergeticAnatomyDatabase:
 
     def get_element_points(self, element: Element) -> list[Meridian | Chakra | TibetanChakra]:
         """Get all points associated with a specific element"""
-        points = []
-
-        # Check meridians
-        for meridian in self.meridians.values():
-            if meridian.element == element:
-                points.append(meridian)
-
-        # Check chakras
-        for chakra in self.chakras.values():
-            if chakra.element == element:
-                points.append(chakra)
-
-        # Check Tibetan chakras
-        for tchakra in self.tibetan_chakras.values():
-            if tchakra.element == element:
-                points.append(tchakra)
-
-        return points
+        return list(self._by_element.get(element, ()))
 
     def get_correspondence(self, element_id: str) -> SystemCorrespondence | None:
         """Get cross-system correspondence for an element"""
-        # Search all correspondences
-        for corr in self.correspondences.values():
-            if corr.taoist_element and corr.taoist_element.id == element_id:
-                return corr
-            if corr.tibetan_element and corr.tibetan_element.id == element_id:
-                return corr
-            if corr.hindu_element and corr.hindu_element.id == element_id:
-                return corr
-        return None
-
-    def search_by_keyword(self, keyword: str) -> dict[str, list]:
-        """Search all systems for keyword"""
-        keyword = keyword.lower()
-        results = {"meridians": [], "chakras": [], "tibetan_chakras": [], "winds": [], "dantians": []}
+        return self._corr_by_element_id.get(element_id)
 
-        # Search meridians
-        for m in self.meridians.values():
-            if keyword in m.name.lower() or keyword in m.description.lower() or keyword in m.organ.lower():
-                results["meridians"].append(m)
-
-        # Search chakras
-        for c in self.chakras.values():
-            if keyword in c.name.lower() or keyword in c.sanskrit_name.lower() or keyword in c.description.lower():
-                results["chakras"].append(c)
-
-        # Search Tibetan chakras
-        for tc in self.tibetan_chakras.values():
-            if keyword in tc.name.lower() or keyword in tc.description.lower():
-                results["tibetan_chakras"].append(tc)
+    def search_by_keyword(self, keyword: str, substring: bool = False) -> dict[str, list]:
+        """
+        Search all systems for keyword.
 
-        # Search winds
-        for w in self.winds.values():
-            if keyword in w.name.lower() or keyword in w.description.lower():
-                results["winds"].append(w)
+        Whole words are served from the prebuilt word index. Pass
+        ``substring=True`` (or a multi-word keyword) to scan the text fields
+        for partial matches instead.
+        """
+        keyword = keyword.lower()
 
-        # Search dantians
-        for d in self.dantians.values():
-            if keyword in d.name.lower() or keyword in d.description.lower():
-                results["dantians"].append(d)
+        if not substring and _WORD_RE.fullmatch(keyword):
+            hits = self._keyword_index.get(keyword)
+            if hits is None:
+                return _empty_search_result()
+            return {category: list(objs) for category, objs in hits.items()}
 
-        return results
+        return {
+            category: [obj for obj, blob in entries if keyword in blob]
+            for category, entries in self._search_text.items()
+        }
 
     def export_to_json(self, filepath: str):
         """Export entire database to JSON"""
@@ -1463,8 +1509,12 @@ class EnergeticAnatomyDatabase:
             "correspondences": {k: v.to_dict() for k, v in self.correspondences.items()},
         }
 
-        with open(filepath, "w") as f:
-            json.dump(data, f, indent=2)
+        if HAS_ORJSON:
+            with open(filepath, "wb") as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filepath, "w") as f:
+                json.dump(data, f, indent=2)
 
 
 # ============================================================================
@@ -1475,8 +1525,13 @@ class EnergeticAnatomyDatabase:
 def get_chakra_by_name(db: EnergeticAnatomyDatabase, name: str) -> Chakra | None:
     """Get Hindu chakra by name or sanskrit name"""
     name_lower = name.lower()
+    chakra = db._chakra_lookup.get(name_lower)
+    if chakra is not None:
+        return chakra
+
+    # Partial names ("heart", "solar plexus") fall back to a substring scan
     for chakra in db.chakras.values():
-        if name_lower in chakra.name.lower() or name_lower in chakra.sanskrit_name.lower() or chakra.id == name_lower:
+        if name_lower in chakra.name.lower() or name_lower in chakra.sanskrit_name.lower():
             return chakra
     return None
 
@@ -1485,12 +1540,9 @@ def get_meridian_by_element(
     db: EnergeticAnatomyDatabase, element: Element, yin_yang: YinYang | None = None
 ) -> list[Meridian]:
     """Get meridians by element and optionally yin/yang"""
-    results = []
-    for meridian in db.meridians.values():
-        if meridian.element == element:
-            if yin_yang is None or meridian.yin_yang == yin_yang:
-                results.append(meridian)
-    return results
+    if yin_yang is None:
+        return list(db._meridians_by_element.get(element, ()))
+    return list(db._meridians_by_element_yy.get((element, yin_yang), ()))
 
 
 # Example usage
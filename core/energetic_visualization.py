@@ -12,11 +12,13 @@ Multi-modal visualization system supporting:
 Renders beautiful, meaningful visualizations for practice and contemplation.
 """
 
+import contextlib
 import math
-import random
 from dataclasses import dataclass
 from enum import Enum
+from functools import lru_cache
 
+import numpy as np
 from PIL import Image, ImageDraw, ImageFilter, ImageFont
 
 try:
@@ -79,6 +81,27 @@ PLANET_COLORS = {
 }
 
 
+# Opacity used when compositing a Rothko field onto the canvas (0.95 * 255)
+FIELD_ALPHA = 242
+
+
+# Gaussian blur radius (px) for the soft glow around sacred geometry outlines
+GLOW_RADIUS = 8
+
+
+# Font used for chakra labels
+LABEL_FONT_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@lru_cache(maxsize=16)
+def _get_font(path: str, size: int) -> ImageFont.FreeTypeFont | ImageFont.ImageFont:
+    """Load a TrueType font once per (path, size), falling back to the default font"""
+    try:
+        return ImageFont.truetype(path, size)
+    except Exception:
+        return ImageFont.load_default()
+
+
 # ============================================================================
 # ENUMS
 # ============================================================================
@@ -106,6 +129,34 @@ class RothkoLayout(Enum):
     FOUR_GRID = "four_grid"  # 2x2 grid
 
 
+# Field placement per layout: (palette color index, position, size), all as
+# canvas fractions. Indices wrap around palettes with fewer colors.
+ROTHKO_LAYOUTS: dict[RothkoLayout, list[tuple[int, tuple[float, float], tuple[float, float]]]] = {
+    RothkoLayout.SINGLE: [
+        (0, (0.1, 0.1), (0.8, 0.8)),
+    ],
+    RothkoLayout.TWO_HORIZONTAL: [
+        (0, (0.1, 0.1), (0.8, 0.35)),
+        (1, (0.1, 0.55), (0.8, 0.35)),
+    ],
+    RothkoLayout.THREE_HORIZONTAL: [
+        (0, (0.1, 0.08), (0.8, 0.25)),
+        (1, (0.1, 0.38), (0.8, 0.25)),
+        (2, (0.1, 0.68), (0.8, 0.25)),
+    ],
+    RothkoLayout.TWO_VERTICAL: [
+        (0, (0.1, 0.1), (0.35, 0.8)),
+        (1, (0.55, 0.1), (0.35, 0.8)),
+    ],
+    RothkoLayout.FOUR_GRID: [
+        (0, (0.1, 0.1), (0.35, 0.35)),
+        (1, (0.55, 0.1), (0.35, 0.35)),
+        (2, (0.1, 0.55), (0.35, 0.35)),
+        (0, (0.55, 0.55), (0.35, 0.35)),
+    ],
+}
+
+
 # ============================================================================
 # DATA CLASSES
 # ============================================================================
@@ -125,10 +176,10 @@ class ColorField:
 
     def add_color_variation(self, amount: float = 0.05) -> "ColorField":
         """Create slight color variation"""
-        r, g, b = self.color
-        r = int(max(0, min(255, r + random.randint(-int(255 * amount), int(255 * amount)))))
-        g = int(max(0, min(255, g + random.randint(-int(255 * amount), int(255 * amount)))))
-        b = int(max(0, min(255, b + random.randint(-int(255 * amount), int(255 * amount)))))
+        spread = int(255 * amount)
+        # One draw covers all three channels
+        varied = np.clip(np.add(self.color, np.random.randint(-spread, spread + 1, 3)), 0, 255)
+        r, g, b = (int(c) for c in varied)
         return ColorField(
             color=(r, g, b),
             position=self.position,
@@ -140,6 +191,52 @@ class ColorField:
         )
 
 
+# ============================================================================
+# FIELD TILES
+# ============================================================================
+
+
+def _render_field_tile(
+    color: tuple[int, int, int], w: int, h: int, radius: int, add_variation: bool = True
+) -> Image.Image:
+    """
+    Render one blurred RGBA field tile.
+
+    The tile is padded by three blur sigmas (where the Gaussian tail reaches
+    zero), so the blur and composite only touch the region the field can
+    actually reach. The padding carries the field color at zero alpha; the
+    soft edge comes from the blurred alpha.
+    """
+    pad = 3 * radius
+    tile = np.zeros((h + 1 + 2 * pad, w + 1 + 2 * pad, 4), dtype=np.int16)
+    tile[..., :3] = color
+    rect = tile[pad : pad + h + 1, pad : pad + w + 1]
+    rect[..., 3] = FIELD_ALPHA
+
+    # Add subtle texture variations (int16 so noise can't wrap)
+    if add_variation:
+        rgb = rect[..., :3]
+        rgb += np.random.randint(-8, 9, rgb.shape, dtype=np.int16)
+        np.clip(rgb, 0, 255, out=rgb)
+
+    field_tile = Image.fromarray(tile.astype(np.uint8))
+
+    # Apply edge blur for soft transitions (one pass over color and alpha)
+    if radius > 0:
+        field_tile = field_tile.filter(ImageFilter.GaussianBlur(radius=radius))
+
+    return field_tile
+
+
+# A near-full-canvas tile is several MB, and the cache lives as long as the
+# process, so it keeps only enough tiles for a few compositions (each has a
+# handful of fields)
+@lru_cache(maxsize=16)
+def _cached_field_tile(color: tuple[int, int, int], w: int, h: int, radius: int) -> Image.Image:
+    """Noise-free field tile, shared across renders. Callers must not mutate it."""
+    return _render_field_tile(color, w, h, radius, add_variation=False)
+
+
 # ============================================================================
 # BASE VISUALIZER
 # ============================================================================
@@ -165,12 +262,18 @@ class BaseVisualizer:
         self.background = background
         self.dpi = dpi
         self.canvas = Image.new("RGB", (width, height), background)
-        self.draw = ImageDraw.Draw(self.canvas)
+        self._draw: ImageDraw.ImageDraw | None = None
+
+    @property
+    def draw(self) -> ImageDraw.ImageDraw:
+        """Drawing context for the canvas, created on first use"""
+        if self._draw is None:
+            self._draw = ImageDraw.Draw(self.canvas)
+        return self._draw
 
     def clear(self):
-        """Clear canvas to background color"""
-        self.canvas = Image.new("RGB", (self.width, self.height), self.background)
-        self.draw = ImageDraw.Draw(self.canvas)
+        """Clear canvas to background color, reusing its pixel buffer"""
+        self.canvas.paste(self.background, (0, 0, self.width, self.height))
 
     def save(self, filepath: str, format: str | None = None):
         """Save image to file"""
@@ -195,15 +298,11 @@ class BaseVisualizer:
 
     def add_texture(self, strength: float = 0.1):
         """Add subtle texture to entire canvas"""
-        pixels = self.canvas.load()
-        for x in range(self.width):
-            for y in range(self.height):
-                r, g, b = pixels[x, y]
-                variation = int(random.randint(-10, 10) * strength)
-                r = max(0, min(255, r + variation))
-                g = max(0, min(255, g + variation))
-                b = max(0, min(255, b + variation))
-                pixels[x, y] = (r, g, b)
+        # One brightness offset per pixel, shared by all three channels
+        variation = (np.random.randint(-10, 11, (self.height, self.width, 1)) * strength).astype(np.int16)
+        arr = np.asarray(self.canvas, dtype=np.int16) + variation
+        np.clip(arr, 0, 255, out=arr)
+        self.canvas.paste(Image.fromarray(arr.astype(np.uint8)))
 
 
 # ============================================================================
@@ -253,6 +352,20 @@ class RothkoVisualizer(BaseVisualizer):
         self.fields.append(field)
         return field
 
+    def _field_rect(self, field: ColorField) -> tuple[int, int, int, int]:
+        """Pixel (x, y, w, h) of a field on this canvas"""
+        x = int(field.position[0] * self.width)
+        y = int(field.position[1] * self.height)
+        w = int(field.size[0] * self.width)
+        h = int(field.size[1] * self.height)
+        return x, y, w, h
+
+    def _field_color(self, field: ColorField) -> tuple[int, int, int]:
+        """Field color with luminosity applied (Q8.8 fixed point, clamped to 255)"""
+        lum_q = round(field.luminosity * 256)
+        r, g, b = (min(255, (c * lum_q) >> 8) for c in field.color)
+        return (r, g, b)
+
     def render_field(self, field: ColorField, add_variation: bool = True):
         """
         Render a single color field onto canvas.
@@ -261,52 +374,24 @@ class RothkoVisualizer(BaseVisualizer):
             field: ColorField to render
             add_variation: Add subtle color variations
         """
-        # Calculate pixel coordinates
-        x = int(field.position[0] * self.width)
-        y = int(field.position[1] * self.height)
-        w = int(field.size[0] * self.width)
-        h = int(field.size[1] * self.height)
-
-        # Create field on separate layer for blending
-        field_layer = Image.new("RGB", (self.width, self.height), self.background)
-        field_draw = ImageDraw.Draw(field_layer)
+        x, y, w, h = self._field_rect(field)
+        field_color = self._field_color(field)
+        radius = max(0, field.edge_blur)
 
-        # Apply luminosity
-        r, g, b = field.color
-        r = int(min(255, r * field.luminosity))
-        g = int(min(255, g * field.luminosity))
-        b = int(min(255, b * field.luminosity))
-        field_color = (r, g, b)
+        # Noise-free tiles are deterministic, so identical fields share one
+        if add_variation:
+            field_tile = _render_field_tile(field_color, w, h, radius, add_variation=True)
+        else:
+            field_tile = _cached_field_tile(field_color, w, h, radius)
 
-        # Draw rectangle
-        field_draw.rectangle([(x, y), (x + w, y + h)], fill=field_color)
+        # Composite onto canvas through the tile's own alpha
+        pad = 3 * radius
+        self.canvas.paste(field_tile, (x - pad, y - pad), field_tile)
 
-        # Add subtle texture variations
-        if add_variation:
-            pixels = field_layer.load()
-            for px in range(x, x + w):
-                for py in range(y, y + h):
-                    if 0 <= px < self.width and 0 <= py < self.height:
-                        cr, cg, cb = pixels[px, py]
-                        if cr == r and cg == g and cb == b:  # Only modify field pixels
-                            variation = random.randint(-8, 8)
-                            cr = max(0, min(255, cr + variation))
-                            cg = max(0, min(255, cg + variation))
-                            cb = max(0, min(255, cb + variation))
-                            pixels[px, py] = (cr, cg, cb)
-
-        # Apply edge blur for soft transitions
-        if field.edge_blur > 0:
-            field_layer = field_layer.filter(ImageFilter.GaussianBlur(radius=field.edge_blur))
-
-        # Composite onto canvas
-        self.canvas = Image.blend(self.canvas, field_layer, alpha=0.95)
-        self.draw = ImageDraw.Draw(self.canvas)
-
-    def render_all_fields(self):
+    def render_all_fields(self, add_variation: bool = True):
         """Render all fields in order"""
         for field in self.fields:
-            self.render_field(field)
+            self.render_field(field, add_variation=add_variation)
 
     def create_from_palette(self, palette_name: str, layout: RothkoLayout = RothkoLayout.THREE_HORIZONTAL):
         """
@@ -322,28 +407,8 @@ class RothkoVisualizer(BaseVisualizer):
         colors = ROTHKO_PALETTES[palette_name]
         self.fields = []
 
-        if layout == RothkoLayout.SINGLE:
-            self.create_field(colors[0], (0.1, 0.1), (0.8, 0.8))
-
-        elif layout == RothkoLayout.TWO_HORIZONTAL:
-            self.create_field(colors[0], (0.1, 0.1), (0.8, 0.35))
-            self.create_field(colors[1], (0.1, 0.55), (0.8, 0.35))
-
-        elif layout == RothkoLayout.THREE_HORIZONTAL:
-            self.create_field(colors[0], (0.1, 0.08), (0.8, 0.25))
-            self.create_field(colors[1], (0.1, 0.38), (0.8, 0.25))
-            if len(colors) > 2:
-                self.create_field(colors[2], (0.1, 0.68), (0.8, 0.25))
-
-        elif layout == RothkoLayout.TWO_VERTICAL:
-            self.create_field(colors[0], (0.1, 0.1), (0.35, 0.8))
-            self.create_field(colors[1], (0.55, 0.1), (0.35, 0.8))
-
-        elif layout == RothkoLayout.FOUR_GRID:
-            self.create_field(colors[0], (0.1, 0.1), (0.35, 0.35))
-            self.create_field(colors[1 % len(colors)], (0.55, 0.1), (0.35, 0.35))
-            self.create_field(colors[2 % len(colors)], (0.1, 0.55), (0.35, 0.35))
-            self.create_field(colors[0], (0.55, 0.55), (0.35, 0.35))
+        for color_idx, position, size in ROTHKO_LAYOUTS[layout]:
+            self.create_field(colors[color_idx % len(colors)], position, size)
 
         self.render_all_fields()
 
@@ -375,11 +440,7 @@ class RothkoVisualizer(BaseVisualizer):
 
         # Optionally add label
         if include_label:
-            # Try to load a font, fall back to default
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 48)
-            except Exception:
-                font = ImageFont.load_default()
+            font = _get_font(LABEL_FONT_PATH, 48)
 
             # Add chakra name at bottom
             label = chakra_name.upper()
@@ -403,6 +464,7 @@ class RothkoVisualizer(BaseVisualizer):
                      If False, arrange horizontally.
         """
         chakras = ["muladhara", "svadhisthana", "manipura", "anahata", "vishuddha", "ajna", "sahasrara"]
+        edge_blur = 30
 
         self.fields = []
 
@@ -413,7 +475,11 @@ class RothkoVisualizer(BaseVisualizer):
                 color = CHAKRA_COLORS[chakra_name]
                 y_pos = i * segment_height
                 self.create_field(
-                    color=color, position=(0.0, y_pos), size=(1.0, segment_height), edge_blur=30, name=chakra_name
+                    color=color,
+                    position=(0.0, y_pos),
+                    size=(1.0, segment_height),
+                    edge_blur=edge_blur,
+                    name=chakra_name,
                 )
         else:
             # Arrange horizontally
@@ -422,10 +488,25 @@ class RothkoVisualizer(BaseVisualizer):
                 color = CHAKRA_COLORS[chakra_name]
                 x_pos = i * segment_width
                 self.create_field(
-                    color=color, position=(x_pos, 0.0), size=(segment_width, 1.0), edge_blur=30, name=chakra_name
+                    color=color, position=(x_pos, 0.0), size=(segment_width, 1.0), edge_blur=edge_blur, name=chakra_name
                 )
 
-        self.render_all_fields()
+        # The stripes tile the whole canvas, so paint them onto one scratch
+        # image and soften every seam with a single blur instead of seven
+        # layer passes
+        scratch = Image.new("RGB", (self.width, self.height), self.background)
+        scratch_draw = ImageDraw.Draw(scratch)
+        for field in self.fields:
+            x, y, w, h = self._field_rect(field)
+            scratch_draw.rectangle([(x, y), (x + w, y + h)], fill=self._field_color(field))
+
+        # Add subtle texture variations (int16 so noise can't wrap)
+        layer = np.asarray(scratch, dtype=np.int16)
+        layer += np.random.randint(-8, 9, layer.shape, dtype=np.int16)
+        np.clip(layer, 0, 255, out=layer)
+
+        stripes = Image.fromarray(layer.astype(np.uint8)).filter(ImageFilter.GaussianBlur(radius=edge_blur))
+        self.canvas.paste(stripes)
 
     def create_element_field(self, element_name: str):
         """
@@ -458,6 +539,10 @@ class RothkoVisualizer(BaseVisualizer):
 # SACRED GEOMETRY VISUALIZER
 # ============================================================================
 
+# Unit directions (cos, sin) of the hexagonal rings: 6 steps of 60 and 12 of 30 degrees
+HEX_DIRECTIONS = np.column_stack([np.cos(np.deg2rad(np.arange(6) * 60)), np.sin(np.deg2rad(np.arange(6) * 60))])
+DODECA_DIRECTIONS = np.column_stack([np.cos(np.deg2rad(np.arange(12) * 30)), np.sin(np.deg2rad(np.arange(12) * 30))])
+
 
 class SacredGeometryVisualizer(BaseVisualizer):
     """
@@ -470,6 +555,15 @@ class SacredGeometryVisualizer(BaseVisualizer):
         """Initialize with dark background for luminous effect"""
         super().__init__(width, height, background)
         self.center = (width // 2, height // 2)
+        # Pending glow outlines per color, blurred and composited by apply_glow()
+        self._glow_masks: dict[tuple[int, int, int], tuple[Image.Image, ImageDraw.ImageDraw]] = {}
+        # True inside _glow_batch(), where glow is deferred to one apply_glow() at the end
+        self._batching_glow = False
+
+    def clear(self):
+        """Clear canvas to background color and drop pending glow"""
+        super().clear()
+        self._glow_masks.clear()
 
     def draw_circle_outline(
         self,
@@ -479,22 +573,53 @@ class SacredGeometryVisualizer(BaseVisualizer):
         width: int = 2,
         glow: bool = False,
     ):
-        """Draw a circle outline, optionally with glow"""
+        """Draw a circle outline, optionally with glow (deferred to the end of a pattern's batch)"""
+        bbox = [center[0] - radius, center[1] - radius, center[0] + radius, center[1] + radius]
         if glow:
-            # Draw multiple circles with decreasing opacity for glow effect
-            for i in range(10, 0, -1):
-                alpha = int(255 * (i / 10) * 0.3)
-                glow_color = (*color, alpha)
-                self.draw.ellipse(
-                    [center[0] - radius - i, center[1] - radius - i, center[0] + radius + i, center[1] + radius + i],
-                    outline=glow_color,
-                    width=1,
-                )
+            # Outline onto this color's glow mask; the blur happens once for all circles
+            if color not in self._glow_masks:
+                mask = Image.new("L", self.canvas.size, 0)
+                self._glow_masks[color] = (mask, ImageDraw.Draw(mask))
+            self._glow_masks[color][1].ellipse(bbox, outline=255, width=width + 2)
+            if not self._batching_glow:
+                self.apply_glow()
 
         # Draw main circle
-        self.draw.ellipse(
-            [center[0] - radius, center[1] - radius, center[0] + radius, center[1] + radius], outline=color, width=width
-        )
+        self.draw.ellipse(bbox, outline=color, width=width)
+
+    @contextlib.contextmanager
+    def _glow_batch(self):
+        """Collect glow from the circles drawn inside the block and blur it once on exit"""
+        outer = self._batching_glow
+        self._batching_glow = True
+        try:
+            yield
+        finally:
+            self._batching_glow = outer
+        if not outer:
+            self.apply_glow()
+
+    def apply_glow(self, radius: int = GLOW_RADIUS):
+        """Blur pending glow outlines in one pass per color and blend them into the canvas"""
+        for color, (mask, _) in self._glow_masks.items():
+            outlines = mask.getbbox()
+            if outlines is None:
+                continue
+            # Only blur the tile around the outlines (the blur fades out within
+            # ~3 radii); the corner is kept even so the 2x grid matches the canvas
+            pad = 3 * radius
+            left, top = max(0, outlines[0] - pad) & ~1, max(0, outlines[1] - pad) & ~1
+            box = (left, top, min(mask.width, outlines[2] + pad), min(mask.height, outlines[3] + pad))
+            tile = mask.crop(box)
+            # A blurred mask has no fine detail, so blurring at half resolution
+            # and scaling back up is indistinguishable and ~2x cheaper
+            glow = tile.reduce(2).filter(ImageFilter.GaussianBlur(radius / 2)).resize(tile.size, Image.BILINEAR)
+            self.canvas.paste(color, box, glow)
+        self._glow_masks.clear()
+
+    def _ring_centers(self, distance: float, directions: np.ndarray) -> list[list[int]]:
+        """Integer circle centers at ``distance`` from the canvas center along each direction"""
+        return (np.array(self.center) + (distance * directions).astype(int)).tolist()
 
     def create_flower_of_life(self, radius: int = 200, color: tuple[int, int, int] = (255, 215, 0), glow: bool = True):
         """
@@ -502,25 +627,17 @@ class SacredGeometryVisualizer(BaseVisualizer):
 
         19 overlapping circles in hexagonal pattern.
         """
-        # Central circle
-        self.draw_circle_outline(self.center, radius, color, width=3, glow=glow)
-
-        # Six circles around center (first ring)
-        for i in range(6):
-            angle = i * 60  # 60 degrees apart
-            rad = math.radians(angle)
-            x = self.center[0] + int(radius * math.cos(rad))
-            y = self.center[1] + int(radius * math.sin(rad))
-            self.draw_circle_outline((x, y), radius, color, width=2, glow=glow)
-
-        # Twelve circles in second ring
-        for i in range(12):
-            angle = i * 30  # 30 degrees apart
-            rad = math.radians(angle)
-            distance = radius * math.sqrt(3)  # Distance to second ring
-            x = self.center[0] + int(distance * math.cos(rad))
-            y = self.center[1] + int(distance * math.sin(rad))
-            self.draw_circle_outline((x, y), radius, color, width=2, glow=glow)
+        with self._glow_batch():
+            # Central circle
+            self.draw_circle_outline(self.center, radius, color, width=3, glow=glow)
+
+            # Six circles around center (first ring), 60 degrees apart
+            for x, y in self._ring_centers(radius, HEX_DIRECTIONS):
+                self.draw_circle_outline((x, y), radius, color, width=2, glow=glow)
+
+            # Twelve circles in second ring, 30 degrees apart
+            for x, y in self._ring_centers(radius * math.sqrt(3), DODECA_DIRECTIONS):
+                self.draw_circle_outline((x, y), radius, color, width=2, glow=glow)
 
     def create_seed_of_life(self, radius: int = 200, color: tuple[int, int, int] = (147, 112, 219), glow: bool = True):
         """
@@ -528,16 +645,13 @@ class SacredGeometryVisualizer(BaseVisualizer):
 
         7 overlapping circles (central + 6 surrounding).
         """
-        # Central circle
-        self.draw_circle_outline(self.center, radius, color, width=3, glow=glow)
+        with self._glow_batch():
+            # Central circle
+            self.draw_circle_outline(self.center, radius, color, width=3, glow=glow)
 
-        # Six circles around center
-        for i in range(6):
-            angle = i * 60
-            rad = math.radians(angle)
-            x = self.center[0] + int(radius * math.cos(rad))
-            y = self.center[1] + int(radius * math.sin(rad))
-            self.draw_circle_outline((x, y), radius, color, width=3, glow=glow)
+            # Six circles around center
+            for x, y in self._ring_centers(radius, HEX_DIRECTIONS):
+                self.draw_circle_outline((x, y), radius, color, width=3, glow=glow)
 
     def create_sri_yantra_simple(self, size: int = 400, color: tuple[int, int, int] = (255, 100, 100)):
         """
@@ -548,25 +662,18 @@ class SacredGeometryVisualizer(BaseVisualizer):
         # This is a simplified version - full Sri Yantra is extremely complex
         half = size // 2
 
-        # Upward pointing triangles (Shiva - masculine)
-        for i in range(5):
-            offset = i * 40
-            points = [
-                (self.center[0], self.center[1] - half + offset),  # Top
-                (self.center[0] - half + offset, self.center[1] + half - offset),  # Bottom left
-                (self.center[0] + half - offset, self.center[1] + half - offset),  # Bottom right
-            ]
-            self.draw.polygon(points, outline=color, width=2)
-
-        # Downward pointing triangles (Shakti - feminine)
-        for i in range(4):
-            offset = i * 40 + 20
-            points = [
-                (self.center[0], self.center[1] + half - offset),  # Bottom
-                (self.center[0] - half + offset, self.center[1] - half + offset),  # Top left
-                (self.center[0] + half - offset, self.center[1] - half + offset),  # Top right
-            ]
-            self.draw.polygon(points, outline=color, width=2)
+        # Upward pointing triangles (Shiva - masculine) and downward pointing
+        # triangles (Shakti - feminine, the upward ones mirrored vertically),
+        # each shrinking by its offset: vertices = base + offset * step
+        base = np.array([[0, -half], [-half, half], [half, half]])  # Top, bottom left, bottom right
+        step = np.array([[0, 1], [1, -1], [-1, -1]])
+        mirror = np.array([1, -1])
+        up = base + (np.arange(5) * 40)[:, None, None] * step
+        down = (base + (np.arange(4) * 40 + 20)[:, None, None] * step) * mirror
+        triangles = np.concatenate([up, down]) + np.array(self.center)
+
+        for triangle in triangles.tolist():
+            self.draw.polygon([tuple(point) for point in triangle], outline=color, width=2)
 
         # Central bindu (point)
         bindu_radius = 8
@@ -614,7 +721,8 @@ def create_chakra_meditation(
     if save_path:
         viz.save(save_path)
 
-    return viz.get_image()
+    # viz is discarded here, so hand over its canvas rather than copying it
+    return viz.canvas
 
 
 def create_seven_chakras_composition(
@@ -627,7 +735,8 @@ def create_seven_chakras_composition(
     if save_path:
         viz.save(save_path)
 
-    return viz.get_image()
+    # viz is discarded here, so hand over its canvas rather than copying it
+    return viz.canvas
 
 
 def create_flower_of_life(
@@ -640,54 +749,77 @@ def create_flower_of_life(
     if save_path:
         viz.save(save_path)
 
-    return viz.get_image()
+    # viz is discarded here, so hand over its canvas rather than copying it
+    return viz.canvas
 
 
 # Example usage
+# Each example is a module-level function so a process pool can pickle it.
+
+
+def _example_heart_rothko() -> str:
+    viz = RothkoVisualizer(1920, 1080)
+    viz.create_chakra_field("anahata", include_label=True)
+    viz.save("/tmp/heart_chakra_rothko.png")
+    return "/tmp/heart_chakra_rothko.png"
+
+
+def _example_seven_chakras() -> str:
+    viz = RothkoVisualizer(1080, 1920)  # Portrait orientation
+    viz.create_seven_chakras(vertical=True)
+    viz.save("/tmp/seven_chakras.png")
+    return "/tmp/seven_chakras.png"
+
+
+def _example_rothko_palette() -> str:
+    viz = RothkoVisualizer(1920, 1080)
+    viz.create_from_palette("meditative", RothkoLayout.THREE_HORIZONTAL)
+    viz.save("/tmp/rothko_meditative.png")
+    return "/tmp/rothko_meditative.png"
+
+
+def _example_flower_of_life() -> str:
+    viz = SacredGeometryVisualizer(1920, 1920)  # Square
+    viz.create_flower_of_life(radius=400, color=(255, 215, 0), glow=True)
+    viz.save("/tmp/flower_of_life.png")
+    return "/tmp/flower_of_life.png"
+
+
+def _example_seed_of_life() -> str:
+    viz = SacredGeometryVisualizer(1920, 1920)
+    viz.create_seed_of_life(radius=350, color=(147, 112, 219), glow=True)
+    viz.save("/tmp/seed_of_life.png")
+    return "/tmp/seed_of_life.png"
+
+
+def _example_water_element() -> str:
+    viz = RothkoVisualizer(1920, 1080)
+    viz.create_element_field("water")
+    viz.save("/tmp/element_water.png")
+    return "/tmp/element_water.png"
+
+
+_EXAMPLES = {
+    "Heart chakra Rothko field": _example_heart_rothko,
+    "Seven chakras vertical composition": _example_seven_chakras,
+    "Rothko 'meditative' palette": _example_rothko_palette,
+    "Flower of Life sacred geometry": _example_flower_of_life,
+    "Seed of Life sacred geometry": _example_seed_of_life,
+    "Water element Rothko field": _example_water_element,
+}
+
+
 if __name__ == "__main__":
+    from concurrent.futures import ProcessPoolExecutor
+
     print("Energetic Visualization System - Core Engine\n")
 
-    # Example 1: Rothko-style chakra field
-    print("Creating heart chakra Rothko field...")
-    viz1 = RothkoVisualizer(1920, 1080)
-    viz1.create_chakra_field("anahata", include_label=True)
-    viz1.save("/tmp/heart_chakra_rothko.png")
-    print("  → Saved to /tmp/heart_chakra_rothko.png")
-
-    # Example 2: Seven chakras composition
-    print("\nCreating seven chakras vertical composition...")
-    viz2 = RothkoVisualizer(1080, 1920)  # Portrait orientation
-    viz2.create_seven_chakras(vertical=True)
-    viz2.save("/tmp/seven_chakras.png")
-    print("  → Saved to /tmp/seven_chakras.png")
-
-    # Example 3: Rothko palette
-    print("\nCreating Rothko 'meditative' palette...")
-    viz3 = RothkoVisualizer(1920, 1080)
-    viz3.create_from_palette("meditative", RothkoLayout.THREE_HORIZONTAL)
-    viz3.save("/tmp/rothko_meditative.png")
-    print("  → Saved to /tmp/rothko_meditative.png")
-
-    # Example 4: Flower of Life
-    print("\nCreating Flower of Life sacred geometry...")
-    viz4 = SacredGeometryVisualizer(1920, 1920)  # Square
-    viz4.create_flower_of_life(radius=400, color=(255, 215, 0), glow=True)
-    viz4.save("/tmp/flower_of_life.png")
-    print("  → Saved to /tmp/flower_of_life.png")
-
-    # Example 5: Seed of Life
-    print("\nCreating Seed of Life sacred geometry...")
-    viz5 = SacredGeometryVisualizer(1920, 1920)
-    viz5.create_seed_of_life(radius=350, color=(147, 112, 219), glow=True)
-    viz5.save("/tmp/seed_of_life.png")
-    print("  → Saved to /tmp/seed_of_life.png")
-
-    # Example 6: Element field (Water)
-    print("\nCreating Water element Rothko field...")
-    viz6 = RothkoVisualizer(1920, 1080)
-    viz6.create_element_field("water")
-    viz6.save("/tmp/element_water.png")
-    print("  → Saved to /tmp/element_water.png")
+    # The examples share no state, so render them side by side in separate processes
+    with ProcessPoolExecutor() as pool:
+        futures = {name: pool.submit(example) for name, example in _EXAMPLES.items()}
+        for name, future in futures.items():
+            print(f"Created {name}")
+            print(f"  → Saved to {future.result()}")
 
     print("\n✨ All visualizations created successfully! ✨")
     print("\nExamples demonstrate:")
@@ -12,6 +12,7 @@ Dependencies:
 
 Exports:
     EnhancedAudioGenerator — main synthesis class (aliased as ``PrayerBowlGenerator``).
+    BowlStream — block-by-block prayer bowl synthesis for streamed playback.
 
 Typical usage:
     >>> gen = EnhancedAudioGenerator()
@@ -19,8 +20,15 @@ Typical usage:
     >>> gen.play(wave)
 """
 
+import contextlib
+import hashlib
 import logging
+import os
 import sys
+import tempfile
+import threading
+from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
@@ -45,6 +53,308 @@ except ImportError:
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Conventional directory for memoized chakra and blessing renders; the disk
+# cache is opt-in, pass this (or any directory) as ``cache_dir`` to enable it
+AUDIO_CACHE_DIR = Path(tempfile.gettempdir()) / "vajra_cache"
+# Part of every cache key; bump whenever the synthesis output changes
+AUDIO_CACHE_VERSION = 3
+
+# Samples per block for phasor synthesis: a partial's phasor over the whole
+# tone is the outer product of its block-start and in-block rotations
+PHASOR_BLOCK = 4096
+
+
+# Longest tone whose time vector and amplitude curve are kept in the shared
+# caches (one minute at 44.1 kHz, ~10 MB of float32 each); longer tones build
+# theirs per call so a few long sessions cannot pin hundreds of MB
+SHARED_BUFFER_MAX_SAMPLES = 60 * 44100
+
+# Samples per callback block when streaming a tone to the audio device
+STREAM_BLOCK = 1024
+
+# Largest vibrato phase (radians) mixed in with the small-angle expansion;
+# the truncation error stays below phi**3 / 6 ~= 1.7e-4
+SMALL_ANGLE = 0.1
+
+
+def _phasor_sum(cycles_per_sample: "np.ndarray", amplitudes: "np.ndarray", blocks: int, block: int) -> "np.ndarray":
+    """Return ``sum(a * exp(2j*pi*f*n))`` over all partials, laid out as a ``(blocks, block)`` matrix.
+
+    Uses ``e^{iw(kB + j)} = e^{iwkB} * e^{iwj}`` (the angle-sum form of the
+    oscillator recurrence): with ``S[k, h] = a_h * e^{iw_h kB}`` and
+    ``E[h, j] = e^{iw_h j}`` the whole sum is the single complex matrix
+    product ``S @ E``. Only ``blocks + block`` exponentials are evaluated
+    per partial and no error accumulates along the tone.
+    """
+    omega = 2 * np.pi * np.asarray(cycles_per_sample, dtype=np.float64)
+    starts = np.asarray(amplitudes) * np.exp(1j * np.outer(block * np.arange(blocks), omega))
+    offsets = np.exp(1j * np.outer(omega, np.arange(block)))
+    return starts.astype(np.complex64) @ offsets.astype(np.complex64)
+
+
+def _phasor_shape(total_samples: int) -> tuple[int, int]:
+    """Return the ``(blocks, block)`` phasor layout covering ``total_samples``."""
+    block = max(1, min(PHASOR_BLOCK, total_samples))
+    return -(-total_samples // block), block
+
+
+def _time_vector(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Return the read-only float32 sample times ``n / sample_rate``.
+
+    Shared across calls up to ``SHARED_BUFFER_MAX_SAMPLES``; longer vectors are built fresh.
+    """
+    if total_samples > SHARED_BUFFER_MAX_SAMPLES:
+        return _build_time_vector(sample_rate, total_samples)
+    return _shared_time_vector(sample_rate, total_samples)
+
+
+@lru_cache(maxsize=4)
+def _shared_time_vector(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Cached :func:`_build_time_vector` for tones up to ``SHARED_BUFFER_MAX_SAMPLES``."""
+    return _build_time_vector(sample_rate, total_samples)
+
+
+def _build_time_vector(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Compute the read-only float32 sample times ``n / sample_rate``."""
+    t = (np.arange(total_samples) / sample_rate).astype(np.float32)
+    t.flags.writeable = False
+    return t
+
+
+def _normalize_inplace(wave: "np.ndarray", peak: float = 1.0) -> None:
+    """Scale ``wave`` in place so its largest absolute sample equals ``peak``.
+
+    ``max``/``-min`` find the peak without the full-length ``np.abs``
+    temporary; silent input is left untouched.
+    """
+    max_val = max(float(wave.max(initial=0.0)), -float(wave.min(initial=0.0)))
+    if max_val > 0:
+        wave *= peak / max_val
+
+
+# Prayer bowl partials from the config, built once at import. Harmonic
+# overtones based on real bowl measurements fall off as 1/n; the quieter
+# inharmonic metallic partials as 0.3/n. Ratios stay float64 because they set
+# the phase of tones that run for minutes.
+_HARM_RATIOS = np.asarray(PRAYER_BOWL_CONFIG["harmonic_ratios"], dtype=np.float64)
+_HARM_AMPS = 1.0 / (np.arange(len(_HARM_RATIOS), dtype=np.float32) + 1)
+_INH_RATIOS = np.asarray(PRAYER_BOWL_CONFIG["inharmonic_partials"], dtype=np.float64)
+_INH_AMPS = 0.3 / (np.arange(len(_INH_RATIOS), dtype=np.float32) + 1)
+# All partials in synthesis order (harmonics first), shared read-only
+_BOWL_RATIOS = np.concatenate([_HARM_RATIOS, _INH_RATIOS])
+_BOWL_AMPS = np.concatenate([_HARM_AMPS, _INH_AMPS])
+for _partials in (_HARM_RATIOS, _HARM_AMPS, _INH_RATIOS, _INH_AMPS, _BOWL_RATIOS, _BOWL_AMPS):
+    _partials.flags.writeable = False
+del _partials
+
+
+def _adsr_samples(sample_rate: int) -> tuple[int, int, float, int]:
+    """Return the configured ``(attack, decay, sustain_level, release)`` with times in samples."""
+    attack_time = PRAYER_BOWL_CONFIG.get("attack", 1.5)
+    decay_time = PRAYER_BOWL_CONFIG.get("decay", 0.8)
+    sustain_level = PRAYER_BOWL_CONFIG.get("sustain", 0.6)
+    release_time = PRAYER_BOWL_CONFIG.get("release", 2.0)
+    return (
+        int(attack_time * sample_rate),
+        int(decay_time * sample_rate),
+        sustain_level,
+        int(release_time * sample_rate),
+    )
+
+
+def _adsr_window(
+    out: "np.ndarray",
+    start: int,
+    total_samples: int,
+    attack_samples: int,
+    decay_samples: int,
+    sustain_level: float,
+    release_samples: int,
+    ramp: "np.ndarray",
+) -> None:
+    """Fill ``out`` with ADSR envelope samples ``start .. start + len(out)`` of a ``total_samples`` tone.
+
+    Every segment is an exponential of the shared sample ``ramp`` (at least
+    as long as the longest segment), written straight into its slice of
+    ``out``; the stretch between decay and release is left at full level.
+    """
+    out.fill(1.0)
+    stop = start + out.size
+    decay_end = min(attack_samples + decay_samples, total_samples)
+    release_start = max(total_samples - release_samples, 0)
+
+    segments = (
+        # Attack - exponential rise
+        (0, attack_samples, attack_samples, -1.0, 1.0),
+        # Decay - exponential fall to sustain level
+        (attack_samples, decay_end, decay_samples, 1 - sustain_level, sustain_level),
+        # Release - exponential fade at end
+        (release_start, total_samples, release_samples, sustain_level, 0.0),
+    )
+    for seg_start, seg_end, samples, scale, offset in segments:
+        lo, hi = max(seg_start, start), min(seg_end, stop)
+        if hi > lo:
+            # offset + scale * exp(-3 * n / samples), n counted from the segment start
+            seg = out[lo - start : hi - start]
+            np.multiply(ramp[lo - seg_start : hi - seg_start], -3.0 / samples, out=seg)
+            np.exp(seg, out=seg)
+            seg *= scale
+            seg += offset
+
+
+def _adsr_envelope(
+    total_samples: int, attack_samples: int, decay_samples: int, sustain_level: float, release_samples: int
+) -> "np.ndarray":
+    """Return the float32 ADSR envelope for a whole tone."""
+    envelope = np.empty(total_samples, dtype=np.float32)
+    ramp = np.arange(max(attack_samples, decay_samples, release_samples, 0), dtype=np.float32)
+    _adsr_window(envelope, 0, total_samples, attack_samples, decay_samples, sustain_level, release_samples, ramp)
+    return envelope
+
+
+def _tremolo(t: "np.ndarray", out: "np.ndarray") -> "np.ndarray":
+    """Write the slow breathing LFO ``1 + depth * sin(2*pi*rate*t)`` into ``out`` and return it."""
+    lfo_rate = PRAYER_BOWL_CONFIG.get("tremolo_rate", 0.15)  # Very slow breathing
+    lfo_depth = PRAYER_BOWL_CONFIG.get("tremolo_depth", 0.15)
+    np.multiply(t, 2 * np.pi * lfo_rate, out=out)
+    np.sin(out, out=out)
+    out *= lfo_depth
+    out += 1
+    return out
+
+
+def _bowl_amplitude(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Return the read-only float32 ADSR envelope times the tremolo LFO.
+
+    Both depend only on the sample rate and length, so tones of the same length skip
+    the LFO sweep and apply their whole amplitude shape in one multiply. Shared across
+    calls up to ``SHARED_BUFFER_MAX_SAMPLES``; longer curves are built fresh.
+    """
+    if total_samples > SHARED_BUFFER_MAX_SAMPLES:
+        return _build_bowl_amplitude(sample_rate, total_samples)
+    return _shared_bowl_amplitude(sample_rate, total_samples)
+
+
+@lru_cache(maxsize=4)
+def _shared_bowl_amplitude(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Cached :func:`_build_bowl_amplitude` for tones up to ``SHARED_BUFFER_MAX_SAMPLES``."""
+    return _build_bowl_amplitude(sample_rate, total_samples)
+
+
+def _build_bowl_amplitude(sample_rate: int, total_samples: int) -> "np.ndarray":
+    """Compute the read-only ADSR envelope times tremolo curve for a tone."""
+    amplitude = _adsr_envelope(total_samples, *_adsr_samples(sample_rate))
+    amplitude *= _tremolo(_time_vector(sample_rate, total_samples), np.empty(total_samples, dtype=np.float32))
+    amplitude.flags.writeable = False
+    return amplitude
+
+
+def _shape_bowl(phasors: "np.ndarray", t: "np.ndarray", amplitude: "np.ndarray") -> "np.ndarray":
+    """Turn summed partial phasors into the bowl waveform: vibrato, then the ADSR and LFO ``amplitude``.
+
+    Works in place on two float32 buffers (the output and one scratch), so
+    no temporaries the length of the tone are allocated.
+    """
+    scratch = np.empty(len(t), dtype=np.float32)
+
+    # Subtle vibrato (pitch modulation) folded into every partial's phase:
+    # 0.7*sin(x) + 0.3*sin(x + phi) ~= sin(x + 0.3*phi) for the tiny phi used
+    # here, and sin(x + phi) = Im(e^{i*phi} * e^{ix}) applies it to all the
+    # summed partials at once (single-sideband phase modulation)
+    vibrato_rate = PRAYER_BOWL_CONFIG.get("vibrato_rate", 0.05)
+    vibrato_depth = PRAYER_BOWL_CONFIG.get("vibrato_depth", 0.02)
+    vibrato_peak = 0.3 * 2 * np.pi * vibrato_depth
+    np.multiply(t, 2 * np.pi * vibrato_rate, out=scratch)
+    np.sin(scratch, out=scratch)
+    scratch *= vibrato_peak
+
+    if vibrato_peak <= SMALL_ANGLE:
+        # sin(phi) ~= phi and cos(phi) ~= 1 - phi**2 / 2, saving two
+        # full-length transcendental sweeps
+        wave = np.multiply(phasors.real, scratch)
+        scratch *= scratch
+        scratch *= -0.5
+        scratch += 1
+    else:
+        wave = np.sin(scratch)
+        wave *= phasors.real
+        np.cos(scratch, out=scratch)
+    scratch *= phasors.imag
+    wave += scratch
+
+    # Apply ADSR envelope for natural bowl sound, with subtle LFO modulation
+    # for natural breathing effect
+    wave *= amplitude
+
+    return wave
+
+
+class BowlStream:
+    """A prayer bowl tone synthesized block by block for a ``sounddevice`` output stream.
+
+    Produces the same partials, vibrato, ADSR envelope and LFO as
+    :meth:`EnhancedAudioGenerator.generate_prayer_bowl_tone`, but only one
+    block at a time: memory stays at one block and sound starts after the
+    first one instead of after the whole tone. Each block's partials are
+    the phasors ``a * e^{iwn}`` at the block start times the in-block
+    rotations, so nothing drifts however long the tone plays.
+
+    The peak of the whole tone is unknown while streaming, so instead of
+    normalizing the tone is scaled by the bound on its peak, which keeps it
+    at or below the 30% of :meth:`~EnhancedAudioGenerator.generate_prayer_bowl_tone`.
+
+    Attributes:
+        sample_rate: Audio sample rate in Hz.
+        total_samples: Length of the tone in samples.
+        position: Index of the next sample to synthesize.
+    """
+
+    def __init__(self, frequency: float, sample_rate: int = 44100, duration: float = 60) -> None:
+        self.sample_rate: int = sample_rate
+        self.total_samples: int = int(sample_rate * duration)
+        self.position: int = 0
+
+        self._amplitudes = _BOWL_AMPS
+        self._omega = 2 * np.pi * _BOWL_RATIOS * (frequency / sample_rate)
+        self._adsr = _adsr_samples(sample_rate)
+        self._ramp = np.arange(max(self._adsr[0], self._adsr[1], self._adsr[3], 0), dtype=np.float32)
+        self._gain = 0.3 / (self._amplitudes.sum() * (1 + PRAYER_BOWL_CONFIG.get("tremolo_depth", 0.15)))
+        # In-block rotations e^{iwj}, rebuilt only when the block size changes
+        self._offsets = np.empty((len(_BOWL_RATIOS), 0), dtype=np.complex64)
+
+    @property
+    def finished(self) -> bool:
+        """True once every sample of the tone has been produced."""
+        return self.position >= self.total_samples
+
+    def read(self, frames: int) -> "np.ndarray":
+        """Synthesize the next ``frames`` samples, zero-padded past the end of the tone."""
+        block = np.zeros(frames, dtype=np.float32)
+        count = min(frames, self.total_samples - self.position)
+        if count <= 0:
+            return block
+
+        start = self.position
+        if self._offsets.shape[1] != count:
+            self._offsets = np.exp(1j * np.outer(self._omega, np.arange(count))).astype(np.complex64)
+        starts = (self._amplitudes * np.exp(1j * self._omega * start)).astype(np.complex64)
+
+        t = ((start + np.arange(count)) / self.sample_rate).astype(np.float32)
+        amplitude = np.empty(count, dtype=np.float32)
+        _adsr_window(amplitude, start, self.total_samples, *self._adsr, self._ramp)
+        amplitude *= _tremolo(t, np.empty(count, dtype=np.float32))
+
+        block[:count] = _shape_bowl(starts @ self._offsets, t, amplitude)
+        block[:count] *= self._gain
+        self.position += count
+        return block
+
+    def __call__(self, outdata: "np.ndarray", frames: int, time, status) -> None:
+        """``sounddevice`` output callback: fill ``outdata`` and stop after the last block."""
+        outdata[:, 0] = self.read(frames)
+        if self.finished:
+            raise sd.CallbackStop
+
 
 class EnhancedAudioGenerator:
     """Enhanced audio synthesis with prayer bowl tones and LFO modulation.
@@ -54,12 +364,59 @@ class EnhancedAudioGenerator:
     for attack/decay/sustain/release), breathing LFO, dedicated chakra healing
     tones, and a 5-channel blessing preset.
 
+    All generation methods return float32 arrays, the format ``sounddevice``
+    plays natively.
+
     Attributes:
         sample_rate: Audio sample rate in Hz (default 44100).
+        cache_dir: Directory where chakra healing and blessing renders are
+            memoized as ``.npy`` files (e.g. :data:`AUDIO_CACHE_DIR`), or
+            None (the default) to always re-synthesize. Nothing is evicted,
+            so the caller owns the directory's size.
     """
 
-    def __init__(self, sample_rate: int = 44100) -> None:
+    def __init__(self, sample_rate: int = 44100, cache_dir: "str | Path | None" = None) -> None:
         self.sample_rate: int = sample_rate
+        self.cache_dir: Path | None = Path(cache_dir) if cache_dir is not None else None
+
+    def _cached_render(self, key: tuple, render: Callable[[], "np.ndarray"]) -> "np.ndarray":
+        """Return ``render()``, memoized on disk under a hash of ``key`` and the synthesis config.
+
+        Cache hits are loaded into an ordinary writable array, so replaying a
+        long session costs one file read instead of a full re-synthesis and
+        callers may still scale the result in place. Cache IO errors only
+        cost the memoization, never the render.
+        """
+        if self.cache_dir is None:
+            return render()
+
+        config = sorted((name, repr(value)) for name, value in PRAYER_BOWL_CONFIG.items())
+        digest = hashlib.sha256(repr((AUDIO_CACHE_VERSION, self.sample_rate, key, config)).encode()).hexdigest()
+        path = self.cache_dir / f"{digest[:32]}.npy"
+
+        if path.exists():
+            try:
+                return np.load(path)
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable audio cache {path}: {e}")
+
+        wave = render()
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write a private partial file then rename, so concurrent readers never
+            # see a partial file and concurrent writers never share one
+            fd, partial = tempfile.mkstemp(prefix=f".{path.stem}.", suffix=".tmp", dir=self.cache_dir)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    np.save(f, wave)
+                os.replace(partial, path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    os.unlink(partial)
+                raise
+        except OSError as e:
+            logger.warning(f"Could not write audio cache {path}: {e}")
+        return wave
 
     def generate_prayer_bowl_tone(self, frequency: float, duration: int = 60, pure_sine: bool = False) -> "np.ndarray":
         """
@@ -73,98 +430,25 @@ class EnhancedAudioGenerator:
         Returns:
             numpy array: Generated audio
         """
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
+        total_samples = int(self.sample_rate * duration)
+        blocks, block = _phasor_shape(total_samples)
 
         if pure_sine:
             # Simple sine wave for backward compatibility
-            return np.sin(2 * np.pi * frequency * t)
-
-        # Prayer bowl synthesis with harmonics
-        wave = np.zeros_like(t)
-
-        # Add harmonic overtones based on real bowl measurements
-        for i, ratio in enumerate(PRAYER_BOWL_CONFIG["harmonic_ratios"]):
-            harmonic_freq = frequency * ratio
-            # Decrease amplitude for higher harmonics
-            amplitude = 1.0 / (i + 1)
-            wave += amplitude * np.sin(2 * np.pi * harmonic_freq * t)
-
-        # Add inharmonic metallic partials
-        for i, ratio in enumerate(PRAYER_BOWL_CONFIG["inharmonic_partials"]):
-            inharmonic_freq = frequency * ratio
-            # Lower amplitude for metallic character
-            amplitude = 0.3 / (i + 1)
-            wave += amplitude * np.sin(2 * np.pi * inharmonic_freq * t)
-
-        # Apply ADSR envelope for natural bowl sound
-        attack_time = PRAYER_BOWL_CONFIG.get("attack", 1.5)
-        decay_time = PRAYER_BOWL_CONFIG.get("decay", 0.8)
-        sustain_level = PRAYER_BOWL_CONFIG.get("sustain", 0.6)
-        release_time = PRAYER_BOWL_CONFIG.get("release", 2.0)
-
-        # Create envelope
-        attack_samples = int(attack_time * self.sample_rate)
-        decay_samples = int(decay_time * self.sample_rate)
-        release_samples = int(release_time * self.sample_rate)
-        total_samples = len(t)
-
-        envelope = np.ones_like(t)
-
-        # Attack - exponential rise
-        attack_indices = np.arange(min(attack_samples, total_samples))
-        envelope[attack_indices] = 1 - np.exp(-3 * attack_indices / attack_samples)
-
-        # Decay - exponential fall to sustain level
-        decay_start = attack_samples
-        decay_end = min(decay_start + decay_samples, total_samples)
-        decay_indices = np.arange(decay_start, decay_end)
-        envelope[decay_indices] = 1 - (1 - sustain_level) * (
-            1 - np.exp(-3 * (decay_indices - decay_start) / decay_samples)
-        )
-
-        # Release - exponential fade at end
-        release_start = max(total_samples - release_samples, 0)
-        release_indices = np.arange(release_start, total_samples)
-        envelope[release_indices] = sustain_level * np.exp(-3 * (release_indices - release_start) / release_samples)
+            return _phasor_sum([frequency / self.sample_rate], [1.0], blocks, block).imag.ravel()[:total_samples]
 
-        # Apply envelope
-        wave = wave * envelope
+        # float32 is ample for the slow LFO and vibrato sweeps; the audio-rate
+        # partials take their phase from the phasors instead
+        t = _time_vector(self.sample_rate, total_samples)
 
-        # Add subtle LFO modulation for natural breathing effect
-        lfo_rate = PRAYER_BOWL_CONFIG.get("tremolo_rate", 0.15)  # Very slow breathing
-        lfo_depth = PRAYER_BOWL_CONFIG.get("tremolo_depth", 0.15)
+        # Prayer bowl synthesis with harmonics, all partials summed as phasors
+        phasors = _phasor_sum(_BOWL_RATIOS * (frequency / self.sample_rate), _BOWL_AMPS, blocks, block)
 
-        # Create LFO modulation
-        lfo = lfo_depth * np.sin(2 * np.pi * lfo_rate * t)
-
-        # Apply LFO to create natural volume pulsing
-        wave = wave * (1 + lfo)
-
-        # Add subtle vibrato (pitch modulation)
-        vibrato_rate = PRAYER_BOWL_CONFIG.get("vibrato_rate", 0.05)
-        vibrato_depth = PRAYER_BOWL_CONFIG.get("vibrato_depth", 0.02)
-
-        # Apply vibrato by phase modulation
-        vibrato_phase = 2 * np.pi * vibrato_depth * np.sin(2 * np.pi * vibrato_rate * t)
-        wave_with_vibrato = np.zeros_like(wave)
-
-        for i, ratio in enumerate(PRAYER_BOWL_CONFIG["harmonic_ratios"]):
-            harmonic_freq = frequency * ratio
-            amplitude = 1.0 / (i + 1)
-            wave_with_vibrato += amplitude * np.sin(2 * np.pi * harmonic_freq * t + vibrato_phase)
-
-        for i, ratio in enumerate(PRAYER_BOWL_CONFIG["inharmonic_partials"]):
-            inharmonic_freq = frequency * ratio
-            amplitude = 0.3 / (i + 1)
-            wave_with_vibrato += amplitude * np.sin(2 * np.pi * inharmonic_freq * t + vibrato_phase)
-
-        # Mix vibrato signal with original
-        wave = 0.7 * wave + 0.3 * wave_with_vibrato
+        amplitude = _bowl_amplitude(self.sample_rate, total_samples)
+        wave = _shape_bowl(phasors.ravel()[:total_samples], t, amplitude)
 
         # Normalize but significantly reduce overall volume for a quiet, ambient drone
-        max_val = np.max(np.abs(wave))
-        if max_val > 0:
-            wave = (wave / max_val) * 0.3  # Reduced to 30% peak amplitude
+        _normalize_inplace(wave, 0.3)  # Reduced to 30% peak amplitude
 
         return wave
 
@@ -173,9 +457,10 @@ class EnhancedAudioGenerator:
     ) -> "np.ndarray":
         """Layer multiple frequencies together into a single waveform.
 
-        Each frequency in the list is generated as a prayer bowl tone (or pure
-        sine if ``pure_sine=True``), scaled by its amplitude, and summed.
-        The result is normalised.
+        Each frequency in the list contributes a full set of prayer bowl
+        partials (or a pure sine if ``pure_sine=True``) scaled by its
+        amplitude; the partials are synthesised together and the result is
+        normalised.
 
         Args:
             frequency_list: List of ``(freq_hz, amplitude)`` tuples.
@@ -186,21 +471,33 @@ class EnhancedAudioGenerator:
         Returns:
             numpy.ndarray: Normalised mono layered waveform.
         """
-        t = np.linspace(0, duration, int(self.sample_rate * duration))
-        wave = np.zeros_like(t)
+        total_samples = int(self.sample_rate * duration)
 
         if pure_sine:
-            # Original implementation for backward compatibility
-            for freq, amplitude in frequency_list:
-                wave += amplitude * np.sin(2 * np.pi * freq * t)
+            # Original implementation for backward compatibility, summed as
+            # phasors so long tones keep exact phase in float32
+            blocks, block = _phasor_shape(total_samples)
+            frequencies, amplitudes = zip(*frequency_list)
+            phasors = _phasor_sum(np.array(frequencies) / self.sample_rate, amplitudes, blocks, block)
+            wave = phasors.imag.ravel()[:total_samples]
         else:
-            # Prayer bowl synthesis for each frequency
-            for freq, amplitude in frequency_list:
-                tone = self.generate_prayer_bowl_tone(freq, duration, pure_sine=False)
-                wave += amplitude * tone
+            # Vibrato, envelope and LFO are the same for every tone and linear
+            # in the phasors, so all partials of all tones are summed at once
+            # and shaped as a single prayer bowl
+            blocks, block = _phasor_shape(total_samples)
+            frequencies, amplitudes = (np.array(column, dtype=np.float64) for column in zip(*frequency_list))
+            phasors = _phasor_sum(
+                np.outer(frequencies / self.sample_rate, _BOWL_RATIOS).ravel(),
+                np.outer(amplitudes, _BOWL_AMPS).ravel(),
+                blocks,
+                block,
+            )
+            t = _time_vector(self.sample_rate, total_samples)
+            amplitude = _bowl_amplitude(self.sample_rate, total_samples)
+            wave = _shape_bowl(phasors.ravel()[:total_samples], t, amplitude)
 
         # Normalize
-        wave = wave / np.max(np.abs(wave))
+        _normalize_inplace(wave)
 
         return wave
 
@@ -235,19 +532,16 @@ class EnhancedAudioGenerator:
 
         base_freq = chakra_frequencies.get(chakra, 528)
 
-        # Generate prayer bowl tone for primary frequency
-        primary = self.generate_prayer_bowl_tone(base_freq, duration, pure_sine=False)
-
-        # Add Schumann resonance as supporting frequency
-        schumann = self.generate_prayer_bowl_tone(7.83, duration, pure_sine=False)
+        def render() -> "np.ndarray":
+            # Prayer bowl tone for the primary frequency with the Schumann
+            # resonance as a supporting frequency, synthesised in one pass
+            healing = self.layer_frequencies([(base_freq, 1.0), (7.83, 0.3)], duration)
 
-        # Combine and normalize, keeping amplitude quiet
-        healing = primary + 0.3 * schumann
-        max_val = np.max(np.abs(healing))
-        if max_val > 0:
-            healing = (healing / max_val) * 0.3
+            # Keep amplitude quiet
+            _normalize_inplace(healing, 0.3)
+            return healing
 
-        return healing
+        return self._cached_render(("chakra_healing", base_freq, duration), render)
 
     def generate_5_channel_blessing(self, intention: str, duration: int = 300) -> "np.ndarray":
         """Generate a 5-frequency blessing broadcast.
@@ -278,7 +572,10 @@ class EnhancedAudioGenerator:
             (741, 0.3),  # Intuition/awakening
         ]
 
-        return self.layer_frequencies(frequencies, duration, pure_sine=False)
+        return self._cached_render(
+            ("5_channel_blessing", tuple(frequencies), duration),
+            lambda: self.layer_frequencies(frequencies, duration, pure_sine=False),
+        )
 
     def play(self, wave: "np.ndarray", loop: bool = False) -> None:
         """Play a generated waveform through the default audio device.
@@ -294,13 +591,43 @@ class EnhancedAudioGenerator:
         """
         try:
             if loop:
-                sd.play(wave, self.sample_rate, loop=True)
+                sd.play(wave.astype(np.float32, copy=False), self.sample_rate, loop=True)
             else:
-                sd.play(wave, self.sample_rate)
+                sd.play(wave.astype(np.float32, copy=False), self.sample_rate)
             sd.wait()
         except Exception as e:
             print(f"Error playing audio: {e}")
 
+    def play_stream(self, frequency: float, duration: int = 60) -> None:
+        """Stream a prayer bowl tone to the default audio device as it is synthesized.
+
+        Unlike ``play(generate_prayer_bowl_tone(...))`` the tone is never
+        materialized: a :class:`BowlStream` fills each ``STREAM_BLOCK``-sample
+        buffer on demand, so playback starts immediately and memory stays
+        constant however long the tone is. Blocks until the tone ends.
+
+        Args:
+            frequency: Base frequency in Hz.
+            duration: Duration in seconds (default 60).
+
+        Raises:
+            Prints error message to stdout on playback failure (does not raise).
+        """
+        bowl = BowlStream(frequency, self.sample_rate, duration)
+        done = threading.Event()
+        try:
+            with sd.OutputStream(
+                samplerate=self.sample_rate,
+                blocksize=STREAM_BLOCK,
+                channels=1,
+                dtype="float32",
+                callback=bowl,
+                finished_callback=done.set,
+            ):
+                done.wait()
+        except Exception as e:
+            print(f"Error playing audio: {e}")
+
 
 # Add alias for backward compatibility
 PrayerBowlGenerator = EnhancedAudioGenerator
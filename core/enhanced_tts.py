@@ -4,21 +4,159 @@ Enhanced Text-to-Speech Engine for Vajra.Stream
 Supports both cloud APIs and local open-source TTS systems
 """
 
+import asyncio
+import base64
+import contextlib
+import hashlib
+import io
+import json
 import os
+import queue
+import re
+import shutil
+import subprocess
 import sys
 import tempfile
+import threading
 import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
-# Base imports
+# Default directory for cached synthesized speech
+TTS_CACHE_DIR = Path(tempfile.gettempdir()) / "vajra_tts_cache"
+# Byte budget of the speech cache; least recently used clips are evicted past it
+TTS_CACHE_BYTES = 100 * 1024 * 1024
+
+# ElevenLabs websocket endpoint that takes text incrementally and streams audio back
+ELEVENLABS_STREAM_URL = "wss://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream-input?model_id={model}"
+# Voice settings sent with the opening message of every ElevenLabs stream
+ELEVENLABS_VOICE_SETTINGS = {"stability": 0.5, "similarity_boost": 0.75}
+
+# Azure streaming playback: raw 16-bit mono PCM at this rate, read in chunks of this many bytes
+AZURE_STREAM_RATE = 24000
+AZURE_STREAM_CHUNK = 16 * 1024
+
+# Bytes of raw PCM read from piper's stdout per audio device write (~90 ms at 22.05 kHz)
+PIPER_STREAM_CHUNK = 4096
+
+# OpenAI "pcm" responses are raw 16-bit mono at this rate; streamed in chunks of this many bytes
+OPENAI_PCM_RATE = 24000
+OPENAI_STREAM_CHUNK = 8192
+
+# Coqui requests arriving within this many seconds of each other form one batch, up to this size
+COQUI_BATCH_WINDOW = 0.02
+COQUI_MAX_BATCH = 8
+# Reduced precision for Coqui inference on CUDA; float16 (unlike bfloat16) converts straight to numpy
+COQUI_AUTOCAST_DTYPE = "float16"
+
+# Consecutive failures that put a provider on cooldown, and how long it sits out (seconds)
+TTS_FAILURE_THRESHOLD = 3
+TTS_COOLDOWN_SECONDS = 60.0
+# Weight of the newest sample in each provider's moving-average synthesis latency
+TTS_LATENCY_ALPHA = 0.3
+# Providers averaging slower synthesis than this (ms) are tried after the healthy ones
+TTS_DEGRADED_LATENCY_MS = 8000.0
+
+# Fallback sentence break without pysbd: whitespace after sentence-ending
+# punctuation, when the next sentence starts with a capital (so "3.14" stays whole)
+_SENTENCE_BREAK = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"'”’)]))\s+(?=[\"'“‘(]?[A-Z])")
+
+# pygame mixer settings for speech playback; the small buffer starts sound sooner
+MIXER_FREQUENCY = 24000
+MIXER_BUFFER = 512
+
+# Cached clips kept decoded in memory per engine, so repeated playback skips decoding
+PCM_CLIPS = 8
+
+# Set once the pygame mixer is open; it is shared by every playback in the process
+_mixer_ready = False
+_mixer_lock = threading.Lock()
+
+
+def _ensure_mixer():
+    """Open the pygame mixer on first use and return ``pygame.mixer`` (ImportError without pygame)."""
+    global _mixer_ready
+    import pygame
+
+    if not _mixer_ready:
+        with _mixer_lock:
+            if not _mixer_ready:
+                pygame.mixer.init(frequency=MIXER_FREQUENCY, channels=1, buffer=MIXER_BUFFER)
+                _mixer_ready = True
+    return pygame.mixer
+
+
+@lru_cache(maxsize=1)
+def _sentence_segmenter():
+    """pysbd's English segmenter (handles abbreviations like "Dr."), or None without pysbd"""
+    try:
+        import pysbd
+    except ImportError:
+        return None
+    return pysbd.Segmenter(language="en", clean=False)
+
+
+def _split_sentences(text: str) -> list[str]:
+    """Split text into sentences, keeping their punctuation and dropping blank ones"""
+    segmenter = _sentence_segmenter()
+    parts = segmenter.segment(text) if segmenter is not None else _SENTENCE_BREAK.split(text)
+    return [sentence for part in parts if (sentence := part.strip())]
+
+
+def _play_audio_file(path: str):
+    """Play audio file (blocking) with pygame, else in-process through sounddevice, else the system player"""
+    try:
+        mixer = _ensure_mixer()
+    except ImportError:
+        clip = _decode_pcm(path)
+        if clip is None or not _play_pcm(*clip):
+            _play_with_system_player(path)
+        return
+
+    mixer.music.load(path)
+    mixer.music.play()
+    while mixer.music.get_busy():
+        time.sleep(0.1)
+
+
+def _play_with_system_player(path: str):
+    """Play audio file (blocking) with afplay/aplay; the path is passed as an argument, never through a shell"""
+    player = "afplay" if sys.platform == "darwin" else "aplay"
+    try:
+        subprocess.run([player, path], check=False, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    except FileNotFoundError:
+        print(f"No audio playback available ({player} not found)")
+
+
+def _play_audio_bytes(audio: bytes, suffix: str):
+    """Play encoded audio (blocking) from memory; ``suffix`` names its format, e.g. ``".mp3"``"""
+    try:
+        mixer = _ensure_mixer()
+    except ImportError:
+        # The system player needs a file
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, f"speech{suffix}")
+            with open(path, "wb") as f:
+                f.write(audio)
+            _play_audio_file(path)
+        return
+
+    mixer.music.load(io.BytesIO(audio), suffix.lstrip("."))
+    mixer.music.play()
+    while mixer.music.get_busy():
+        time.sleep(0.1)
 
 
 class TTSProvider:
     """Abstract base for text-to-speech providers.
 
     Defines the interface that all TTS backends must implement:
-    availability checking, blocking speech, and audio file generation.
+    availability checking, blocking speech, and audio generation to a file
+    or to bytes.
     Concrete providers (:class:`ElevenLabsTTS`, :class:`OpenAITTS`,
     :class:`EdgeTTS`, :class:`Pyttsx3TTS`) inherit from this.
 
@@ -26,12 +164,28 @@ class TTSProvider:
         name: Human-readable provider name.
         available: Whether the provider passed its availability check.
         error_msg: Reason for unavailability (None if available).
+        audio_suffix: File extension of the audio this provider writes.
+        init_in_caller_thread: Whether the provider must be built on the
+            thread that will use it, rather than during concurrent setup.
+        warm_up_on_select: Whether the engine warms the provider up in the
+            background when it is selected (remote services only).
+        failure_count: Consecutive failed ``speak`` calls through the engine.
+        cooldown_until: ``time.monotonic()`` before which the engine skips
+            this provider.
+        ewma_latency_ms: Moving average of synthesis time (None until measured).
     """
 
+    audio_suffix = ".mp3"
+    init_in_caller_thread = False
+    warm_up_on_select = False
+
     def __init__(self, name: str):
         self.name = name
         self.available = False
         self.error_msg = None
+        self.failure_count = 0
+        self.cooldown_until = 0.0
+        self.ewma_latency_ms: float | None = None
 
     def check_availability(self) -> bool:
         """Check if this provider is available.
@@ -63,8 +217,103 @@ class TTSProvider:
         self.error_msg = self.error_msg or "TTSProvider base class cannot generate audio"
         return False
 
+    def warm_up(self):
+        """Make a throwaway request, so the first real one finds the connection already open"""
+        self.generate_bytes(" ")
+
+    def generate_bytes(self, text: str, **kwargs) -> bytes | None:
+        """Synthesize text to encoded audio (``audio_suffix`` format) in memory; None on failure.
+
+        Default implementation goes through :meth:`generate_audio_file` and a
+        temporary file. Providers whose API returns bytes override this.
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            path = os.path.join(tmp_dir, f"speech{self.audio_suffix}")
+            if not self.generate_audio_file(text, path, **kwargs):
+                return None
+            with open(path, "rb") as f:
+                return f.read()
+
+
+def _decode_pcm(path: str) -> tuple[bytes, int, int] | None:
+    """Decode an audio file to 16-bit ``(pcm, sample_rate, channels)``, or None if it cannot be decoded"""
+    try:
+        from pydub import AudioSegment
+
+        segment = AudioSegment.from_file(path).set_sample_width(2)
+        return segment.raw_data, segment.frame_rate, segment.channels
+    except Exception:
+        # pydub missing, or no decoder (ffmpeg) for this format
+        return None
+
+
+def _play_pcm(pcm: bytes, sample_rate: int, channels: int, repetitions: int = 1, gap: float = 0.0) -> bool:
+    """Play 16-bit PCM (blocking) on the audio device; False if sounddevice is unavailable
+
+    With ``repetitions`` the clip is played that many times on one stream,
+    separated by ``gap`` seconds of silence.
+    """
+    try:
+        import sounddevice as sd
+    except (ImportError, OSError):
+        return False
+
+    silence = bytes(round(gap * sample_rate) * channels * 2)
+    with sd.RawOutputStream(samplerate=sample_rate, channels=channels, dtype="int16") as output:
+        for i in range(repetitions):
+            if i and silence:
+                output.write(silence)
+            output.write(pcm)
+    return True
+
+
+class _AudioFileProvider(TTSProvider):
+    """Base for providers that synthesize encoded audio, which ``speak`` then plays."""
+
+    def speak(self, text: str, **kwargs) -> bool:
+        """Generate and play audio"""
+        audio = self.generate_bytes(text, **kwargs)
+        if audio is None:
+            return False
+        self._play_audio_bytes(audio)
+        return True
+
+    def _play_audio_bytes(self, audio: bytes):
+        """Play audio held in memory"""
+        _play_audio_bytes(audio, self.audio_suffix)
+
+    def _play_audio_file(self, path: str):
+        """Play audio file"""
+        _play_audio_file(path)
+
+
+class StreamingTTSProvider(TTSProvider):
+    """Base for providers that can play speech while it is still being synthesized.
+
+    :meth:`EnhancedTTSEngine.speak` prefers :meth:`speak_stream` for these
+    providers when the clip is not cached, so the first audio plays after
+    the first chunk arrives instead of after the whole utterance.
+    """
+
+    def speak_stream(self, text: str, **kwargs) -> bool:
+        """Speak text while it is synthesized.
 
-class ElevenLabsTTS(TTSProvider):
+        Default base implementation: falls back to the blocking ``speak``.
+        Concrete subclasses override this.
+        """
+        return self.speak(text, **kwargs)
+
+    @staticmethod
+    def _output_stream(sample_rate: int):
+        """Return a raw 16-bit mono ``sounddevice`` output stream, or None without sounddevice/PortAudio"""
+        try:
+            import sounddevice as sd
+        except (ImportError, OSError):
+            return None
+        return sd.RawOutputStream(samplerate=sample_rate, channels=1, dtype="int16")
+
+
+class ElevenLabsTTS(_AudioFileProvider):
     """ElevenLabs cloud TTS — premium neural voices via REST API.
 
     Requires ``ELEVENLABS_API_KEY`` environment variable and the ``elevenlabs``
@@ -75,12 +324,19 @@ class ElevenLabsTTS(TTSProvider):
         client: Initialised after availability check.
         generate_func: Reference to ``elevenlabs.generate``.
         voices_func: Reference to ``elevenlabs.voices``.
+
+    :meth:`speak_stream_async` feeds text to the websocket stream-input API
+    as it is produced and yields audio before the full text is known.
     """
 
+    warm_up_on_select = True
+
     def __init__(self):
         super().__init__("ElevenLabs")
         self.api_key = os.getenv("ELEVENLABS_API_KEY")
         self.client = None
+        # Voice name -> voice id, filled from the account's voice list on first stream
+        self._voice_ids: dict[str, str] = {}
         self.available = self.check_availability()
 
     def check_availability(self) -> bool:
@@ -102,57 +358,93 @@ class ElevenLabsTTS(TTSProvider):
             self.error_msg = f"ElevenLabs initialization error: {str(e)}"
             return False
 
-    def generate_audio_file(self, text: str, output_path: str, voice: str = "Bella", **kwargs) -> bool:
-        """Generate audio file using ElevenLabs"""
+    def generate_bytes(self, text: str, voice: str = "Bella", **kwargs) -> bytes | None:
+        """Generate MP3 audio in memory using ElevenLabs"""
         try:
-            audio = self.generate_func(text=text, voice=voice, model="eleven_monolingual_v1")
-
-            with open(output_path, "wb") as f:
-                f.write(audio)
-
-            return True
+            return self.generate_func(text=text, voice=voice, model="eleven_monolingual_v1")
         except Exception as e:
             self.error_msg = f"ElevenLabs generation error: {str(e)}"
+            return None
+
+    def generate_audio_file(self, text: str, output_path: str, voice: str = "Bella", **kwargs) -> bool:
+        """Generate audio file using ElevenLabs"""
+        audio = self.generate_bytes(text, voice=voice, **kwargs)
+        if audio is None:
             return False
+        with open(output_path, "wb") as f:
+            f.write(audio)
+        return True
 
-    def speak(self, text: str, **kwargs) -> bool:
-        """Generate and play audio"""
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp_path = tmp.name
+    def _voice_id(self, voice: str) -> str:
+        """Resolve a voice name to its ElevenLabs id; anything unrecognised is taken as an id"""
+        if voice not in self._voice_ids:
+            self._voice_ids.update((v.name, v.voice_id) for v in self.voices_func())
+        return self._voice_ids.get(voice, voice)
 
-        try:
-            if self.generate_audio_file(text, tmp_path, **kwargs):
-                # Play using system audio
-                self._play_audio_file(tmp_path)
-                return True
-            return False
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
+    async def speak_stream_async(
+        self, text_iter: AsyncIterator[str], voice: str = "Bella", model: str = "eleven_monolingual_v1"
+    ) -> AsyncIterator[bytes]:
+        """Synthesize text as it is produced (e.g. LLM tokens), yielding audio chunks as they arrive.
 
-    def _play_audio_file(self, path: str):
-        """Play audio file using available player"""
+        The stream ends early on failure; ``error_msg`` then says why.
+        """
         try:
-            import pygame
+            import websockets
+
+            voice_id = await asyncio.to_thread(self._voice_id, voice)
+            url = ELEVENLABS_STREAM_URL.format(voice_id=voice_id, model=model)
+            async with websockets.connect(url) as ws:
+
+                async def send_text():
+                    await ws.send(
+                        json.dumps(
+                            {"text": " ", "voice_settings": ELEVENLABS_VOICE_SETTINGS, "xi_api_key": self.api_key}
+                        )
+                    )
+                    try:
+                        async for token in text_iter:
+                            if token:
+                                await ws.send(json.dumps({"text": token, "try_trigger_generation": True}))
+                    except Exception:
+                        # Stop waiting on audio for text that will never be finished
+                        await ws.close()
+                        raise
+                    # An empty text closes the input; the server flushes what is left
+                    await ws.send(json.dumps({"text": ""}))
+
+                # Text goes up while audio for the earlier text comes back
+                sender = asyncio.create_task(send_text())
+                try:
+                    async for message in ws:
+                        data = json.loads(message)
+                        if data.get("audio"):
+                            yield base64.b64decode(data["audio"])
+                        if data.get("isFinal"):
+                            break
+                    await sender
+                finally:
+                    sender.cancel()
+        except Exception as e:
+            self.error_msg = f"ElevenLabs streaming error: {str(e)}"
 
-            pygame.mixer.init()
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-        except ImportError:
-            # Fallback to system player
-            os.system(f"afplay {path}" if sys.platform == "darwin" else f"aplay {path}")
 
+class AzureTTS(StreamingTTSProvider, _AudioFileProvider):
+    """Azure Cognitive Services TTS - Microsoft cloud TTS
 
-class AzureTTS(TTSProvider):
-    """Azure Cognitive Services TTS - Microsoft cloud TTS"""
+    Synthesizers hold the service connection, so one is kept per voice and
+    output (speaker, in-memory, or raw PCM stream) and reused across calls.
+    """
+
+    audio_suffix = ".wav"
+    warm_up_on_select = True
 
     def __init__(self):
         super().__init__("Azure TTS")
         self.api_key = os.getenv("AZURE_SPEECH_KEY")
         self.region = os.getenv("AZURE_SPEECH_REGION", "eastus")
         self.speech_config = None
+        # (voice, output) -> SpeechSynthesizer
+        self._synthesizers: dict[tuple[str, str], Any] = {}
         self.available = self.check_availability()
 
     def check_availability(self) -> bool:
@@ -173,32 +465,57 @@ class AzureTTS(TTSProvider):
             self.error_msg = f"Azure TTS initialization error: {str(e)}"
             return False
 
-    def generate_audio_file(self, text: str, output_path: str, voice: str = "en-US-JennyNeural", **kwargs) -> bool:
-        """Generate audio file using Azure TTS"""
-        try:
-            self.speech_config.speech_synthesis_voice_name = voice
-
-            audio_config = self.speechsdk.audio.AudioOutputConfig(filename=output_path)
+    def _get_synthesizer(self, voice: str, output: str):
+        """Return the reusable synthesizer for ``voice`` with ``output`` "speaker", "memory" or "stream"."""
+        key = (voice, output)
+        if key not in self._synthesizers:
+            if output == "stream":
+                # Headerless PCM that can go straight to the audio device; a
+                # config of its own keeps file output in the default format
+                config = self.speechsdk.SpeechConfig(subscription=self.api_key, region=self.region)
+                config.set_speech_synthesis_output_format(
+                    self.speechsdk.SpeechSynthesisOutputFormat.Raw24Khz16BitMonoPcm
+                )
+            else:
+                config = self.speech_config
+            # The synthesizer copies the voice from the config when it is built
+            config.speech_synthesis_voice_name = voice
+            if output == "speaker":
+                synthesizer = self.speechsdk.SpeechSynthesizer(speech_config=config)
+            else:
+                synthesizer = self.speechsdk.SpeechSynthesizer(speech_config=config, audio_config=None)
+            self._synthesizers[key] = synthesizer
+        return self._synthesizers[key]
 
-            synthesizer = self.speechsdk.SpeechSynthesizer(speech_config=self.speech_config, audio_config=audio_config)
+    def generate_bytes(self, text: str, voice: str = "en-US-JennyNeural", **kwargs) -> bytes | None:
+        """Generate WAV audio in memory using Azure TTS"""
+        try:
+            synthesizer = self._get_synthesizer(voice, "memory")
 
             result = synthesizer.speak_text_async(text).get()
 
             if result.reason == self.speechsdk.ResultReason.SynthesizingAudioCompleted:
-                return True
+                return result.audio_data
             else:
                 self.error_msg = f"Azure synthesis failed: {result.reason}"
-                return False
+                return None
         except Exception as e:
             self.error_msg = f"Azure generation error: {str(e)}"
+            return None
+
+    def generate_audio_file(self, text: str, output_path: str, voice: str = "en-US-JennyNeural", **kwargs) -> bool:
+        """Generate audio file using Azure TTS"""
+        audio = self.generate_bytes(text, voice=voice, **kwargs)
+        if audio is None:
             return False
+        with open(output_path, "wb") as f:
+            f.write(audio)
+        return True
 
     def speak(self, text: str, voice: str = "en-US-JennyNeural", **kwargs) -> bool:
         """Speak text using Azure TTS"""
         try:
-            self.speech_config.speech_synthesis_voice_name = voice
-
-            synthesizer = self.speechsdk.SpeechSynthesizer(speech_config=self.speech_config)
+            synthesizer = self._get_synthesizer(voice, "speaker")
 
             result = synthesizer.speak_text_async(text).get()
 
@@ -211,10 +528,42 @@ class AzureTTS(TTSProvider):
             self.error_msg = f"Azure speech error: {str(e)}"
             return False
 
+    def warm_up(self):
+        """Open the streaming synthesizer's service connection before the first request"""
+        synthesizer = self._get_synthesizer("en-US-JennyNeural", "stream")
+        self.speechsdk.Connection.from_speech_synthesizer(synthesizer).open(True)
+
+    def speak_stream(self, text: str, voice: str = "en-US-JennyNeural", **kwargs) -> bool:
+        """Speak text while it is synthesized, playing each audio chunk as soon as it arrives"""
+        output = self._output_stream(AZURE_STREAM_RATE)
+        if output is None:
+            # No PortAudio: let the SDK play to the default speaker instead
+            return self.speak(text, voice=voice, **kwargs)
+
+        try:
+            synthesizer = self._get_synthesizer(voice, "stream")
+            result = synthesizer.start_speaking_text_async(text).get()
+            stream = self.speechsdk.AudioDataStream(result)
+
+            chunk = bytes(AZURE_STREAM_CHUNK)
+            with output as device:
+                while filled := stream.read_data(chunk):
+                    device.write(chunk[:filled])
+
+            if stream.status == self.speechsdk.StreamStatus.Canceled:
+                self.error_msg = f"Azure streaming canceled: {stream.cancellation_details.reason}"
+                return False
+            return True
+        except Exception as e:
+            self.error_msg = f"Azure streaming error: {str(e)}"
+            return False
+
 
-class GoogleCloudTTS(TTSProvider):
+class GoogleCloudTTS(_AudioFileProvider):
     """Google Cloud Text-to-Speech"""
 
+    warm_up_on_select = True
+
     def __init__(self):
         super().__init__("Google Cloud TTS")
         self.credentials_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
@@ -239,10 +588,10 @@ class GoogleCloudTTS(TTSProvider):
             self.error_msg = f"Google Cloud TTS initialization error: {str(e)}"
             return False
 
-    def generate_audio_file(
-        self, text: str, output_path: str, voice_name: str = "en-US-Wavenet-D", language_code: str = "en-US", **kwargs
-    ) -> bool:
-        """Generate audio file using Google Cloud TTS"""
+    def generate_bytes(
+        self, text: str, voice_name: str = "en-US-Wavenet-D", language_code: str = "en-US", **kwargs
+    ) -> bytes | None:
+        """Generate MP3 audio in memory using Google Cloud TTS"""
         try:
             synthesis_input = self.texttospeech.SynthesisInput(text=text)
 
@@ -251,44 +600,24 @@ class GoogleCloudTTS(TTSProvider):
             audio_config = self.texttospeech.AudioConfig(audio_encoding=self.texttospeech.AudioEncoding.MP3)
 
             response = self.client.synthesize_speech(input=synthesis_input, voice=voice, audio_config=audio_config)
-
-            with open(output_path, "wb") as f:
-                f.write(response.audio_content)
-
-            return True
+            return response.audio_content
         except Exception as e:
             self.error_msg = f"Google Cloud generation error: {str(e)}"
-            return False
+            return None
 
-    def speak(self, text: str, **kwargs) -> bool:
-        """Generate and play audio"""
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            if self.generate_audio_file(text, tmp_path, **kwargs):
-                self._play_audio_file(tmp_path)
-                return True
+    def generate_audio_file(
+        self, text: str, output_path: str, voice_name: str = "en-US-Wavenet-D", language_code: str = "en-US", **kwargs
+    ) -> bool:
+        """Generate audio file using Google Cloud TTS"""
+        audio = self.generate_bytes(text, voice_name=voice_name, language_code=language_code, **kwargs)
+        if audio is None:
             return False
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-
-    def _play_audio_file(self, path: str):
-        """Play audio file"""
-        try:
-            import pygame
-
-            pygame.mixer.init()
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-        except ImportError:
-            os.system(f"afplay {path}" if sys.platform == "darwin" else f"aplay {path}")
+        with open(output_path, "wb") as f:
+            f.write(audio)
+        return True
 
 
-class OpenAITTS(TTSProvider):
+class OpenAITTS(StreamingTTSProvider, _AudioFileProvider):
     """OpenAI TTS — works with OpenAI and any OpenAI-compatible TTS endpoint.
 
     Uses ``OPENAI_API_KEY``. Optionally set ``OPENAI_BASE_URL`` to point at
@@ -296,6 +625,8 @@ class OpenAITTS(TTSProvider):
     with voice ``nova``.
     """
 
+    warm_up_on_select = True
+
     def __init__(self):
         super().__init__("OpenAI TTS")
         self.api_key = os.getenv("OPENAI_API_KEY")
@@ -340,36 +671,64 @@ class OpenAITTS(TTSProvider):
             self.error_msg = f"OpenAI generation error: {str(e)}"
             return False
 
-    def speak(self, text: str, **kwargs) -> bool:
-        """Generate and play audio"""
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp:
-            tmp_path = tmp.name
+    def generate_bytes(self, text: str, voice: str = "nova", model: str = "tts-1", **kwargs) -> bytes | None:
+        """Generate MP3 audio in memory using OpenAI TTS"""
+        try:
+            return self.client.audio.speech.create(model=model, voice=voice, input=text).content
+        except Exception as e:
+            self.error_msg = f"OpenAI generation error: {str(e)}"
+            return None
+
+    def speak_stream(self, text: str, voice: str = "nova", model: str = "tts-1", **kwargs) -> bool:
+        """Speak text while OpenAI synthesizes it, playing raw PCM chunks as they arrive"""
+        output = self._output_stream(OPENAI_PCM_RATE)
+        if output is None:
+            # No PortAudio: download the MP3 and play that instead
+            return self.speak(text, voice=voice, model=model, **kwargs)
 
         try:
-            if self.generate_audio_file(text, tmp_path, **kwargs):
-                self._play_audio_file(tmp_path)
-                return True
+            # Raw PCM needs no decoding before it can be played
+            with (
+                self.client.audio.speech.with_streaming_response.create(
+                    model=model, voice=voice, input=text, response_format="pcm"
+                ) as response,
+                output as device,
+            ):
+                # An even chunk size keeps every write on a whole 16-bit sample
+                for chunk in response.iter_bytes(OPENAI_STREAM_CHUNK):
+                    device.write(chunk)
+            return True
+        except Exception as e:
+            self.error_msg = f"OpenAI streaming error: {str(e)}"
             return False
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
-    def _play_audio_file(self, path: str):
-        """Play audio file"""
-        try:
-            import pygame
 
-            pygame.mixer.init()
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-        except ImportError:
-            os.system(f"afplay {path}" if sys.platform == "darwin" else f"aplay {path}")
+class CoquiTTS(_AudioFileProvider):
+    """Coqui TTS - Local open-source TTS (continuation of Mozilla TTS)
 
+    The model is loaded on first use and shared by every instance in the
+    process. It is only driven from one worker thread, also shared by every
+    instance. Requests arriving
+    together are collected into a batch, and each distinct text in it is
+    synthesized once, so concurrent callers asking for the same prayer
+    share one model run. On a CUDA machine the acoustic model and vocoder
+    are moved to the GPU, compiled, and run under half-precision autocast.
+    """
 
-class CoquiTTS(TTSProvider):
-    """Coqui TTS - Local open-source TTS (continuation of Mozilla TTS)"""
+    audio_suffix = ".wav"
+    # Use a fast, high-quality model
+    MODEL_NAME = "tts_models/en/ljspeech/tacotron2-DDC"
+
+    # Process-wide model, loaded by the first instance that needs it
+    _model = None
+    _model_lock = threading.Lock()
+    # Whether the shared model runs on CUDA (set when it is loaded)
+    _on_cuda = False
+    # Process-wide (provider, text, output_path, future) requests and the one
+    # worker thread that drives the shared model, started on first use
+    _requests: "queue.Queue[tuple[CoquiTTS, str, str, Future]]" = queue.Queue()
+    _worker: threading.Thread | None = None
+    _worker_lock = threading.Lock()
 
     def __init__(self):
         super().__init__("Coqui TTS")
@@ -380,8 +739,8 @@ class CoquiTTS(TTSProvider):
         try:
             from TTS.api import TTS as CoquiTTSAPI
 
-            # Use a fast, high-quality model
-            self.tts = CoquiTTSAPI("tts_models/en/ljspeech/tacotron2-DDC")
+            # The model itself is only loaded by _ensure_loaded()
+            self._api = CoquiTTSAPI
             return True
         except ImportError:
             self.error_msg = "TTS package not installed (pip install TTS)"
@@ -390,50 +749,116 @@ class CoquiTTS(TTSProvider):
             self.error_msg = f"Coqui TTS initialization error: {str(e)}"
             return False
 
-    def generate_audio_file(self, text: str, output_path: str, **kwargs) -> bool:
-        """Generate audio file using Coqui TTS"""
-        try:
-            self.tts.tts_to_file(text=text, file_path=output_path)
-            return True
-        except Exception as e:
-            self.error_msg = f"Coqui generation error: {str(e)}"
-            return False
-
-    def speak(self, text: str, **kwargs) -> bool:
-        """Generate and play audio"""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        try:
-            if self.generate_audio_file(text, tmp_path, **kwargs):
-                self._play_audio_file(tmp_path)
-                return True
-            return False
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
-
-    def _play_audio_file(self, path: str):
-        """Play audio file"""
+    def _ensure_loaded(self):
+        """Return the shared Coqui model, loading it on first use"""
+        if self.tts is None:
+            with CoquiTTS._model_lock:
+                if CoquiTTS._model is None:
+                    CoquiTTS._model = self._accelerate(self._api(self.MODEL_NAME))
+            self.tts = CoquiTTS._model
+        return self.tts
+
+    @staticmethod
+    def _accelerate(tts):
+        """Move the model to CUDA and compile its networks when a GPU is available"""
         try:
-            import pygame
-
-            pygame.mixer.init()
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
+            import torch
         except ImportError:
-            os.system(f"afplay {path}" if sys.platform == "darwin" else f"aplay {path}")
+            return tts
+        if not torch.cuda.is_available():
+            return tts
 
+        try:
+            tts.to("cuda")
+            synthesizer = tts.synthesizer
+            synthesizer.tts_model = torch.compile(synthesizer.tts_model, mode="reduce-overhead", fullgraph=False)
+            if synthesizer.vocoder_model is not None:
+                synthesizer.vocoder_model = torch.compile(
+                    synthesizer.vocoder_model, mode="reduce-overhead", fullgraph=False
+                )
+            CoquiTTS._on_cuda = True
+        except Exception:
+            # Compilation is an optimisation only; the eager model still works
+            pass
+        return tts
+
+    @staticmethod
+    def _inference_context():
+        """Inference mode with half-precision autocast on CUDA, or a no-op on CPU"""
+        if not CoquiTTS._on_cuda:
+            return contextlib.nullcontext()
+        import torch
+
+        stack = contextlib.ExitStack()
+        stack.enter_context(torch.inference_mode())
+        stack.enter_context(torch.autocast("cuda", dtype=getattr(torch, COQUI_AUTOCAST_DTYPE)))
+        return stack
 
-class PiperTTS(TTSProvider):
+    def generate_audio_file(self, text: str, output_path: str, **kwargs) -> bool:
+        """Generate audio file using Coqui TTS"""
+        with CoquiTTS._worker_lock:
+            if CoquiTTS._worker is None:
+                CoquiTTS._worker = threading.Thread(target=CoquiTTS._run_batches, name="coqui-tts", daemon=True)
+                CoquiTTS._worker.start()
+
+        future: Future = Future()
+        CoquiTTS._requests.put((self, text, output_path, future))
+        return future.result()
+
+    @staticmethod
+    def _run_batches():
+        """Worker loop: collect requests for one batch window, then synthesize each distinct text once."""
+        while True:
+            batch = [CoquiTTS._requests.get()]
+            deadline = time.monotonic() + COQUI_BATCH_WINDOW
+            while len(batch) < COQUI_MAX_BATCH:
+                try:
+                    batch.append(CoquiTTS._requests.get(timeout=max(0.0, deadline - time.monotonic())))
+                except queue.Empty:
+                    break
+
+            by_text: dict[str, list[tuple[CoquiTTS, str, Future]]] = {}
+            for provider, text, output_path, future in batch:
+                by_text.setdefault(text, []).append((provider, output_path, future))
+
+            for text, requests in by_text.items():
+                first, first_path, first_future = requests[0]
+                try:
+                    tts = first._ensure_loaded()
+                    with first._inference_context():
+                        tts.tts_to_file(text=text, file_path=first_path)
+                except Exception as e:
+                    for provider, _, future in requests:
+                        provider.error_msg = f"Coqui generation error: {str(e)}"
+                        future.set_result(False)
+                    continue
+
+                # A failed copy only fails the caller it was for
+                for provider, output_path, future in requests[1:]:
+                    try:
+                        # Callers passing the same path already have the file
+                        if output_path != first_path:
+                            shutil.copyfile(first_path, output_path)
+                    except OSError as e:
+                        provider.error_msg = f"Coqui generation error: {str(e)}"
+                        future.set_result(False)
+                    else:
+                        future.set_result(True)
+                # Resolved last: its caller may remove the file the others are copied from
+                first_future.set_result(True)
+
+
+class PiperTTS(StreamingTTSProvider, _AudioFileProvider):
     """Piper - Fast local TTS optimized for Raspberry Pi"""
 
+    audio_suffix = ".wav"
+
     def __init__(self):
         super().__init__("Piper TTS")
         self.piper_path = None
         self.model_path = None
+        # Output rate of the model, from its config
+        self.sample_rate = 22050
         self.available = self.check_availability()
 
     def check_availability(self) -> bool:
@@ -459,6 +884,7 @@ class PiperTTS(TTSProvider):
                 models = list(model_dir.glob("**/*.onnx"))
                 if models:
                     self.model_path = models[0]
+                    self.sample_rate = self._model_sample_rate(self.model_path)
                     return True
 
         self.error_msg = "No piper models found"
@@ -487,37 +913,51 @@ class PiperTTS(TTSProvider):
             self.error_msg = f"Piper generation error: {str(e)}"
             return False
 
-    def speak(self, text: str, **kwargs) -> bool:
-        """Generate and play audio"""
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-            tmp_path = tmp.name
+    def speak_stream(self, text: str, **kwargs) -> bool:
+        """Speak text while piper synthesizes it, playing its raw PCM output as it arrives"""
+        output = self._output_stream(self.sample_rate)
+        if output is None:
+            # No PortAudio: synthesize to a file and play that instead
+            return self.speak(text, **kwargs)
 
         try:
-            if self.generate_audio_file(text, tmp_path, **kwargs):
-                self._play_audio_file(tmp_path)
+            import subprocess
+
+            cmd = [self.piper_path, "--model", str(self.model_path), "--output-raw"]
+            process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            process.stdin.write(text.encode())
+            process.stdin.close()
+
+            with output as device:
+                while chunk := process.stdout.read(PIPER_STREAM_CHUNK):
+                    device.write(chunk)
+
+            stderr = process.stderr.read()
+            if process.wait() == 0:
                 return True
+            self.error_msg = f"Piper error: {stderr.decode(errors='replace')}"
+            return False
+        except Exception as e:
+            self.error_msg = f"Piper streaming error: {str(e)}"
             return False
-        finally:
-            if os.path.exists(tmp_path):
-                os.unlink(tmp_path)
 
-    def _play_audio_file(self, path: str):
-        """Play audio file"""
+    @staticmethod
+    def _model_sample_rate(model_path: Path) -> int:
+        """Return the sample rate from the model's ``.onnx.json`` config, or 22050 if it cannot be read"""
         try:
-            import pygame
-
-            pygame.mixer.init()
-            pygame.mixer.music.load(path)
-            pygame.mixer.music.play()
-            while pygame.mixer.music.get_busy():
-                time.sleep(0.1)
-        except ImportError:
-            os.system(f"afplay {path}" if sys.platform == "darwin" else f"aplay {path}")
+            with open(f"{model_path}.json") as f:
+                return int(json.load(f)["audio"]["sample_rate"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return 22050
 
 
 class Pyttsx3TTS(TTSProvider):
     """Pyttsx3 - Basic offline TTS (fallback)"""
 
+    audio_suffix = ".wav"
+    # The platform driver (SAPI/COM, NSSpeechSynthesizer) is bound to its creating thread
+    init_in_caller_thread = True
+
     def __init__(self):
         super().__init__("pyttsx3")
         self.engine = None
@@ -559,6 +999,90 @@ class Pyttsx3TTS(TTSProvider):
             return False
 
 
+class _TTSCache:
+    """Least-recently-used store of synthesized speech files under a byte budget.
+
+    Files are named by a content hash of everything that shapes the audio,
+    and their modification time records the last use, so the access order
+    survives restarts. The index is guarded by a lock, since the engine is
+    shared between threads.
+    """
+
+    def __init__(self, cache_dir: Path, max_bytes: int = TTS_CACHE_BYTES):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        # File name -> size in bytes, least recently used first
+        self.entries: OrderedDict[str, int] = OrderedDict()
+        self.total_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.cache_dir.is_dir():
+            # Dot-files are partial writes
+            files = [(path.stat(), path.name) for path in self.cache_dir.iterdir() if not path.name.startswith(".")]
+            for stat, name in sorted(files, key=lambda item: item[0].st_mtime):
+                self.entries[name] = stat.st_size
+                self.total_bytes += stat.st_size
+
+    @staticmethod
+    def key(provider: str, text: str, **kwargs) -> str:
+        """Return the hex cache key for ``text`` spoken by ``provider`` with ``kwargs``."""
+        settings = sorted((name, repr(value)) for name, value in kwargs.items())
+        return hashlib.blake2b(repr((provider, settings, text)).encode(), digest_size=16).hexdigest()
+
+    def get(self, name: str) -> Path | None:
+        """Return the cached file ``name`` and mark it most recently used, or None on a miss."""
+        path = self.cache_dir / name
+        with self._lock:
+            if name not in self.entries:
+                return None
+            try:
+                os.utime(path)
+            except OSError:
+                self._forget(name)
+                return None
+            self.entries.move_to_end(name)
+        return path
+
+    def put(self, name: str, write: Callable[[str], bool]) -> Path | None:
+        """Cache the file ``write(path)`` produces as ``name`` and evict past the budget.
+
+        Returns None, caching nothing, if ``write`` reports failure. Raises
+        ``OSError`` if the cache directory cannot be written.
+        """
+        path = self.cache_dir / name
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write a private partial file then rename, so concurrent readers never see
+        # a partial file and threads caching the same text never share one
+        fd, partial_name = tempfile.mkstemp(prefix=".", suffix=name, dir=self.cache_dir)
+        os.close(fd)
+        partial = Path(partial_name)
+        try:
+            if not write(str(partial)):
+                return None
+            os.replace(partial, path)
+        finally:
+            if partial.exists():
+                partial.unlink()
+
+        with self._lock:
+            self._forget(name)
+            self.entries[name] = path.stat().st_size
+            self.total_bytes += self.entries[name]
+            # The newest clip always stays, even when it alone exceeds the budget
+            while self.total_bytes > self.max_bytes and len(self.entries) > 1:
+                oldest = next(iter(self.entries))
+                self._forget(oldest)
+                try:
+                    os.unlink(self.cache_dir / oldest)
+                except OSError:
+                    pass
+        return path
+
+    def _forget(self, name: str):
+        """Drop ``name`` from the index; the caller holds the lock."""
+        self.total_bytes -= self.entries.pop(name, 0)
+
+
 class EnhancedTTSEngine:
     """
     Enhanced TTS Engine with automatic provider selection
@@ -567,18 +1091,38 @@ class EnhancedTTSEngine:
     1. Cloud APIs (if configured): OpenAI → ElevenLabs → Azure → Google
     2. Local open-source: Coqui → Piper
     3. Fallback: pyttsx3
+
+    Synthesized speech is cached on disk, so repeated prayers and mantra
+    repetitions only reach the provider once. Streaming providers play a
+    cached clip when there is one, but what they stream is not cached.
+
+    If the active provider fails, ``speak`` falls back down the priority
+    list. A provider failing ``TTS_FAILURE_THRESHOLD`` times in a row is
+    skipped for ``TTS_COOLDOWN_SECONDS``, and one whose synthesis has become
+    slow is tried after the healthy ones.
     """
 
-    def __init__(self, prefer_local: bool = False):
+    prefer_local = False
+    cache: _TTSCache | None = None
+
+    def __init__(
+        self, prefer_local: bool = False, cache_dir: Path | None = TTS_CACHE_DIR, cache_bytes: int = TTS_CACHE_BYTES
+    ):
         """
         Initialize TTS engine
 
         Args:
             prefer_local: If True, prefer local TTS over cloud APIs
+            cache_dir: Directory for cached speech; ``None`` disables caching
+            cache_bytes: Byte budget of the speech cache
         """
         self.prefer_local = prefer_local
         self.providers = {}
         self.active_provider = None
+        self.cache = _TTSCache(cache_dir, cache_bytes) if cache_dir is not None else None
+        # Cache file name -> decoded (pcm, sample_rate, channels), or None if it cannot be decoded
+        self._pcm_clips: OrderedDict[str, tuple[bytes, int, int] | None] = OrderedDict()
+        self._pcm_lock = threading.Lock()
 
         # Initialize all providers
         self._initialize_providers()
@@ -587,7 +1131,11 @@ class EnhancedTTSEngine:
         self._select_provider()
 
     def _initialize_providers(self):
-        """Initialize all TTS providers"""
+        """Initialize all TTS providers
+
+        Providers are built concurrently, so SDK imports and handshakes
+        overlap and setup takes about as long as the slowest provider.
+        """
         provider_classes = [
             # Cloud APIs
             OpenAITTS,
@@ -601,18 +1149,30 @@ class EnhancedTTSEngine:
             Pyttsx3TTS,
         ]
 
-        for provider_class in provider_classes:
-            try:
-                provider = provider_class()
-                self.providers[provider.name] = provider
-            except Exception as e:
-                print(f"Failed to initialize {provider_class.__name__}: {e}")
-
-    def _select_provider(self):
-        """Select best available TTS provider"""
+        with ThreadPoolExecutor(max_workers=len(provider_classes), thread_name_prefix="tts-init") as pool:
+            futures = {cls: pool.submit(cls) for cls in provider_classes if not cls.init_in_caller_thread}
+            # Built here while the pool works on the rest
+            for cls in provider_classes:
+                if cls.init_in_caller_thread:
+                    futures[cls] = Future()
+                    try:
+                        futures[cls].set_result(cls())
+                    except Exception as e:
+                        futures[cls].set_exception(e)
+
+            # Registered in priority order, whichever finished first
+            for provider_class in provider_classes:
+                try:
+                    provider = futures[provider_class].result()
+                    self.providers[provider.name] = provider
+                except Exception as e:
+                    print(f"Failed to initialize {provider_class.__name__}: {e}")
+
+    def _priority_order(self) -> list[str]:
+        """Provider names, best first"""
         if self.prefer_local:
             # Try local first
-            priority = [
+            return [
                 "Coqui TTS",
                 "Piper TTS",
                 "OpenAI TTS",
@@ -621,28 +1181,49 @@ class EnhancedTTSEngine:
                 "Google Cloud TTS",
                 "pyttsx3",
             ]
-        else:
-            # Try cloud first
-            priority = [
-                "OpenAI TTS",
-                "ElevenLabs",
-                "Azure TTS",
-                "Google Cloud TTS",
-                "Coqui TTS",
-                "Piper TTS",
-                "pyttsx3",
-            ]
+        # Try cloud first
+        return [
+            "OpenAI TTS",
+            "ElevenLabs",
+            "Azure TTS",
+            "Google Cloud TTS",
+            "Coqui TTS",
+            "Piper TTS",
+            "pyttsx3",
+        ]
 
-        for provider_name in priority:
+    def _select_provider(self):
+        """Select best available TTS provider"""
+        for provider_name in self._priority_order():
             if provider_name in self.providers:
                 provider = self.providers[provider_name]
                 if provider.available:
                     self.active_provider = provider
                     print(f"✓ Selected TTS provider: {provider_name}")
+                    self._start_warm_up(provider)
                     return
 
         raise RuntimeError("No TTS provider available!")
 
+    @staticmethod
+    def _start_warm_up(provider: TTSProvider):
+        """Warm ``provider`` up on a background thread if it talks to a remote service"""
+        if provider.warm_up_on_select:
+            threading.Thread(
+                target=EnhancedTTSEngine._warm_up, args=(provider,), name="tts-warmup", daemon=True
+            ).start()
+
+    @staticmethod
+    def _warm_up(provider: TTSProvider):
+        """Run ``provider.warm_up``; failures are ignored and leave ``error_msg`` untouched"""
+        error_msg = provider.error_msg
+        try:
+            provider.warm_up()
+        except Exception:
+            pass
+        finally:
+            provider.error_msg = error_msg
+
     def list_available_providers(self) -> list[dict[str, Any]]:
         """List all available TTS providers"""
         result = []
@@ -663,6 +1244,7 @@ class EnhancedTTSEngine:
             if provider.available:
                 self.active_provider = provider
                 print(f"✓ Switched to TTS provider: {provider_name}")
+                self._start_warm_up(provider)
                 return True
             else:
                 print(f"✗ Provider '{provider_name}' not available: {provider.error_msg}")
@@ -673,7 +1255,7 @@ class EnhancedTTSEngine:
 
     def speak(self, text: str, **kwargs) -> bool:
         """
-        Speak text using active TTS provider
+        Speak text using active TTS provider, falling back to the next ones if it fails
 
         Args:
             text: Text to speak
@@ -681,13 +1263,125 @@ class EnhancedTTSEngine:
         """
         if not self.active_provider:
             raise RuntimeError("No TTS provider available")
+        return self._speak_first(self._fallback_order(), text, **kwargs)
+
+    def _speak_first(self, providers: list[TTSProvider], text: str, **kwargs) -> bool:
+        """Speak ``text`` with the first of ``providers`` that succeeds, counting failures"""
+        for provider in providers:
+            try:
+                ok = self._speak_with(provider, text, **kwargs)
+            except Exception as e:
+                provider.error_msg = f"{provider.name} speak error: {str(e)}"
+                ok = False
+            if ok:
+                provider.failure_count = 0
+                return True
+            self._record_failure(provider)
+        return False
+
+    def _fallback_order(self) -> list[TTSProvider]:
+        """Providers for ``speak`` to try: the active one first, then the rest by priority.
+
+        Providers on cooldown are left out, and slow ones go after the
+        others. If every provider is on cooldown, the active one is tried anyway.
+        """
+        now = time.monotonic()
+        rest = [self.providers[name] for name in self._priority_order() if name in self.providers]
+        candidates = [
+            provider
+            for provider in dict.fromkeys([self.active_provider, *rest])
+            if provider.available and provider.cooldown_until <= now
+        ]
+        if not candidates:
+            return [self.active_provider]
+        # Stable sort: priority order is kept within the healthy and the slow group
+        return sorted(
+            candidates,
+            key=lambda p: p.ewma_latency_ms is not None and p.ewma_latency_ms > TTS_DEGRADED_LATENCY_MS,
+        )
+
+    @staticmethod
+    def _record_failure(provider: TTSProvider):
+        """Count a failed call, putting ``provider`` on cooldown after too many in a row"""
+        provider.failure_count += 1
+        if provider.failure_count >= TTS_FAILURE_THRESHOLD:
+            provider.failure_count = 0
+            provider.cooldown_until = time.monotonic() + TTS_COOLDOWN_SECONDS
+            print(f"✗ TTS provider '{provider.name}' failing ({provider.error_msg}); skipping it for a while")
+
+    @staticmethod
+    def _generate(provider: TTSProvider, text: str, output_path: str, **kwargs) -> bool:
+        """Synthesize with ``provider``, folding the time taken into its average latency"""
+        start = time.perf_counter()
+        ok = provider.generate_audio_file(text, output_path, **kwargs)
+        if ok:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            previous = provider.ewma_latency_ms
+            provider.ewma_latency_ms = (
+                elapsed_ms if previous is None else (1 - TTS_LATENCY_ALPHA) * previous + TTS_LATENCY_ALPHA * elapsed_ms
+            )
+        return ok
+
+    def _speak_with(self, provider: TTSProvider, text: str, **kwargs) -> bool:
+        """Speak ``text`` with ``provider``, through the cache when it plays audio files"""
+        if isinstance(provider, StreamingTTSProvider):
+            cached = self._cache_hit(provider, text, **kwargs)
+            if cached is not None:
+                self._play_cached(cached, provider)
+                return True
+            # Streaming providers start playing before synthesis finishes
+            return provider.speak_stream(text, **kwargs)
+        if self.cache is None or not hasattr(provider, "_play_audio_file"):
+            return provider.speak(text, **kwargs)
+
+        try:
+            path = self._cached_audio(text, provider=provider, **kwargs)
+        except OSError as e:
+            print(f"TTS cache unavailable ({e}); speaking uncached")
+            return provider.speak(text, **kwargs)
+        if path is None:
+            return False
+        self._play_cached(path, provider)
+        return True
 
-        return self.active_provider.speak(text, **kwargs)
+    def _cache_hit(self, provider: TTSProvider, text: str, **kwargs) -> Path | None:
+        """Return the cached clip of ``text`` spoken by ``provider``, or None; never synthesizes"""
+        if self.cache is None or not hasattr(provider, "_play_audio_file"):
+            return None
+        return self.cache.get(_TTSCache.key(provider.name, text, **kwargs) + provider.audio_suffix)
+
+    def _play_cached(self, path: Path, provider: TTSProvider):
+        """Play a cached clip, decoding it only the first time it is played"""
+        clip = self._decoded_clip(path)
+        if clip is None or not _play_pcm(*clip):
+            provider._play_audio_file(str(path))
+
+    def _decoded_clip(self, path: Path) -> tuple[bytes, int, int] | None:
+        """Decoded PCM of a cached clip, kept for the most recently played ones"""
+        name = path.name
+        with self._pcm_lock:
+            if name in self._pcm_clips:
+                self._pcm_clips.move_to_end(name)
+                return self._pcm_clips[name]
+        # Decode outside the lock; two threads decoding one clip just store it twice
+        clip = _decode_pcm(str(path))
+        with self._pcm_lock:
+            self._pcm_clips[name] = clip
+            while len(self._pcm_clips) > PCM_CLIPS:
+                self._pcm_clips.popitem(last=False)
+        return clip
 
     def speak_slowly(self, text: str, pause_duration: float = 1.0, **kwargs) -> bool:
-        """Speak text with contemplative pacing"""
-        sentences = text.replace("?", ".").replace("!", ".").split(".")
-        sentences = [s.strip() for s in sentences if s.strip()]
+        """Speak text with contemplative pacing
+
+        For providers that play audio files, the next sentence is synthesized
+        while the current one plays.
+        """
+        sentences = _split_sentences(text)
+
+        provider = self.active_provider
+        if hasattr(provider, "_play_audio_file") and not isinstance(provider, StreamingTTSProvider):
+            return self._speak_pipelined(sentences, pause_duration, **kwargs)
 
         for sentence in sentences:
             if not self.speak(sentence, **kwargs):
@@ -696,10 +1390,112 @@ class EnhancedTTSEngine:
 
         return True
 
+    def _speak_pipelined(self, sentences: list[str], pause_duration: float, **kwargs) -> bool:
+        """Play ``sentences`` in order while a producer thread synthesizes the ones after them"""
+        # (path, temporary, provider) per sentence, or None once synthesis fails
+        clips: queue.Queue[tuple[Path, bool, TTSProvider] | None] = queue.Queue(maxsize=2)
+        stop = threading.Event()
+
+        def produce():
+            for sentence in sentences:
+                if stop.is_set():
+                    return
+                clip = self._synthesize_clip(sentence, **kwargs)
+                while True:
+                    try:
+                        clips.put(clip, timeout=0.1)
+                        break
+                    except queue.Full:
+                        if stop.is_set():
+                            self._discard_clip(clip)
+                            return
+                if clip is None:
+                    return
+
+        producer = threading.Thread(target=produce, name="tts-producer", daemon=True)
+        producer.start()
+        try:
+            for _ in sentences:
+                clip = clips.get()
+                if clip is None:
+                    return False
+                try:
+                    clip[2]._play_audio_file(str(clip[0]))
+                finally:
+                    self._discard_clip(clip)
+                time.sleep(pause_duration)
+            return True
+        finally:
+            stop.set()
+            producer.join()
+            while not clips.empty():
+                self._discard_clip(clips.get_nowait())
+
+    def _synthesize_clip(self, text: str, **kwargs) -> tuple[Path, bool, TTSProvider] | None:
+        """Return ``(path, temporary, provider)`` of ``text`` from the first file provider that succeeds.
+
+        Providers are tried in :meth:`_fallback_order`, with failures counted
+        toward their cooldown as in :meth:`speak`. Returns None if all fail.
+        """
+        for provider in self._fallback_order():
+            if not hasattr(provider, "_play_audio_file"):
+                continue
+            try:
+                clip = self._clip_from(provider, text, **kwargs)
+            except Exception as e:
+                provider.error_msg = f"{provider.name} synthesis error: {str(e)}"
+                clip = None
+            if clip is not None:
+                provider.failure_count = 0
+                return (*clip, provider)
+            self._record_failure(provider)
+        return None
+
+    def _clip_from(self, provider: TTSProvider, text: str, **kwargs) -> tuple[Path, bool] | None:
+        """Return ``(path, temporary)`` of ``text`` spoken by ``provider``, or None on failure"""
+        if self.cache is not None:
+            try:
+                path = self._cached_audio(text, provider=provider, **kwargs)
+                return (path, False) if path is not None else None
+            except OSError as e:
+                print(f"TTS cache unavailable ({e}); generating uncached")
+
+        with tempfile.NamedTemporaryFile(suffix=provider.audio_suffix, delete=False) as tmp:
+            path = Path(tmp.name)
+        if self._generate(provider, text, str(path), **kwargs):
+            return path, True
+        path.unlink(missing_ok=True)
+        return None
+
+    @staticmethod
+    def _discard_clip(clip: tuple[Path, bool, TTSProvider] | None):
+        """Delete ``clip``'s file if it is a temporary one."""
+        if clip is not None and clip[1]:
+            clip[0].unlink(missing_ok=True)
+
     def speak_mantra(self, mantra: str, repetitions: int = 108, pause_duration: float = 2.0, **kwargs) -> bool:
-        """Speak a mantra with repetitions"""
+        """Speak a mantra with repetitions
+
+        Providers that write audio files synthesize the mantra once and every
+        repetition replays that clip, on one audio stream when it can be decoded.
+        """
+        files_failed = False
+        if repetitions > 0 and hasattr(self.active_provider, "_play_audio_file"):
+            clip = self._synthesize_clip(mantra, **kwargs)
+            if clip is not None:
+                try:
+                    self._repeat_clip(clip, repetitions, pause_duration)
+                finally:
+                    self._discard_clip(clip)
+                return True
+            files_failed = True
+
         for i in range(repetitions):
-            if not self.speak(mantra, **kwargs):
+            providers = self._fallback_order()
+            if files_failed:
+                # Every file provider already failed (and was counted); only the others are left
+                providers = [p for p in providers if not hasattr(p, "_play_audio_file")]
+            if not self._speak_first(providers, mantra, **kwargs):
                 return False
 
             # Pause between repetitions
@@ -708,6 +1504,18 @@ class EnhancedTTSEngine:
 
         return True
 
+    def _repeat_clip(self, clip: tuple[Path, bool, TTSProvider], repetitions: int, pause_duration: float):
+        """Play ``clip`` ``repetitions`` times, ``pause_duration`` seconds apart"""
+        path, temporary, provider = clip
+        pcm = _decode_pcm(str(path)) if temporary else self._decoded_clip(path)
+        if pcm is not None and _play_pcm(*pcm, repetitions=repetitions, gap=pause_duration):
+            return
+
+        for i in range(repetitions):
+            provider._play_audio_file(str(path))
+            if i < repetitions - 1:
+                time.sleep(pause_duration)
+
     def generate_audio_file(self, text: str, output_path: str, **kwargs) -> bool:
         """
         Generate audio file from text
@@ -720,7 +1528,32 @@ class EnhancedTTSEngine:
         if not self.active_provider:
             raise RuntimeError("No TTS provider available")
 
-        return self.active_provider.generate_audio_file(text, output_path, **kwargs)
+        if self.cache is None:
+            return self._generate(self.active_provider, text, output_path, **kwargs)
+
+        try:
+            path = self._cached_audio(text, Path(output_path).suffix, **kwargs)
+        except OSError as e:
+            print(f"TTS cache unavailable ({e}); generating uncached")
+            return self._generate(self.active_provider, text, output_path, **kwargs)
+        if path is None:
+            return False
+        shutil.copyfile(path, output_path)
+        return True
+
+    def _cached_audio(
+        self, text: str, suffix: str | None = None, provider: TTSProvider | None = None, **kwargs
+    ) -> Path | None:
+        """Return a cached file of ``text`` spoken by ``provider`` (default: active), synthesizing it on a miss.
+
+        Returns None if synthesis fails (the reason is in the provider's
+        ``error_msg``) and raises ``OSError`` if the cache cannot be written.
+        """
+        provider = provider or self.active_provider
+        suffix = suffix or provider.audio_suffix
+        name = _TTSCache.key(provider.name, text, **kwargs) + suffix
+
+        return self.cache.get(name) or self.cache.put(name, lambda path: self._generate(provider, text, path, **kwargs))
 
     def get_current_provider(self) -> str:
         """Get name of currently active provider"""
@@ -728,22 +1561,38 @@ class EnhancedTTSEngine:
 
 
 # Convenience functions
+
+# Engines built by the convenience functions, keyed by prefer_local, so
+# provider setup happens once per process
+_engines: dict[bool, EnhancedTTSEngine] = {}
+_engines_lock = threading.Lock()
+
+
+def _shared_engine(prefer_local: bool) -> EnhancedTTSEngine:
+    """Return the process-wide engine for ``prefer_local``, creating it on first use."""
+    engine = _engines.get(prefer_local)
+    if engine is None:
+        # Concurrent first calls would otherwise each set up every provider
+        with _engines_lock:
+            engine = _engines.get(prefer_local)
+            if engine is None:
+                engine = _engines[prefer_local] = EnhancedTTSEngine(prefer_local=prefer_local)
+    return engine
+
+
 def speak(text: str, prefer_local: bool = False, **kwargs) -> bool:
     """Quick speak function"""
-    engine = EnhancedTTSEngine(prefer_local=prefer_local)
-    return engine.speak(text, **kwargs)
+    return _shared_engine(prefer_local).speak(text, **kwargs)
 
 
 def speak_prayer(text: str, prefer_local: bool = False, **kwargs) -> bool:
     """Speak prayer with contemplative pacing"""
-    engine = EnhancedTTSEngine(prefer_local=prefer_local)
-    return engine.speak_slowly(text, pause_duration=1.5, **kwargs)
+    return _shared_engine(prefer_local).speak_slowly(text, pause_duration=1.5, **kwargs)
 
 
 def speak_mantra(mantra: str, repetitions: int = 108, prefer_local: bool = False, **kwargs) -> bool:
     """Speak mantra with repetitions"""
-    engine = EnhancedTTSEngine(prefer_local=prefer_local)
-    return engine.speak_mantra(mantra, repetitions=repetitions, **kwargs)
+    return _shared_engine(prefer_local).speak_mantra(mantra, repetitions=repetitions, **kwargs)
 
 
 if __name__ == "__main__":
@@ -15,6 +15,8 @@ are marked for offline research completion per the development roadmap.
 
 Exports:
     ChakraSystem, MeridianSystem, TibetanChannelSystem — individual system models.
+    ChakraRecord, MeridianRecord — immutable per-chakra / per-meridian records.
+    ChakraFlag — bitmask of chakras for constant-time membership tests.
     IntegratedHealingProtocol — cross-system protocol generator.
 
 Typical usage:
@@ -23,6 +25,341 @@ Typical usage:
     >>> print(protocol["frequencies"])  # [639]
 """
 
+import sys
+from collections.abc import Iterable, Mapping
+from enum import IntFlag
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively turn dicts into read-only mappings (with interned string keys) and lists into tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType(
+            {sys.intern(key) if isinstance(key, str) else key: _freeze(item) for key, item in value.items()}
+        )
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class ChakraRecord(NamedTuple):
+    """Static correspondences of one chakra."""
+
+    name: str
+    english: str
+    location: str
+    element: str
+    color: str
+    seed_mantra: str
+    petals: int
+    frequency: int
+    physical_associations: tuple[str, ...]
+    emotional_qualities: tuple[str, ...]
+    imbalances: tuple[str, ...]
+    healing_practices: tuple[str, ...]
+    # TO BE FILLED: Add more detailed correspondences
+    deities: tuple[str, ...] | None = None
+    sounds: tuple[str, ...] | None = None
+    gems: tuple[str, ...] | None = None
+
+
+class MeridianRecord(NamedTuple):
+    """Static correspondences of one primary meridian."""
+
+    chinese: str
+    pinyin: str
+    english: str
+    yin_yang: str
+    element: str
+    organ: str
+    paired_organ: str
+    time_active: str
+    pathway: str
+    num_points: int
+    key_functions: tuple[str, ...]
+    imbalances: tuple[str, ...] | None
+    key_points: tuple[str, ...] | None
+    associated_emotions: tuple[str, ...]
+    season: str
+
+
+class ChakraFlag(IntFlag):
+    """One bit per chakra, root to crown, for set-style membership tests on conditions."""
+
+    MULADHARA = 1
+    SVADHISTHANA = 2
+    MANIPURA = 4
+    ANAHATA = 8
+    VISHUDDHA = 16
+    AJNA = 32
+    SAHASRARA = 64
+
+    @classmethod
+    def from_names(cls, names: Iterable[str]) -> "ChakraFlag":
+        """Mask with the bit of each named chakra set."""
+        flags = cls(0)
+        for name in names:
+            flags |= cls[name.upper()]
+        return flags
+
+    def as_names(self) -> list[str]:
+        """Chakra names (``_CHAKRAS`` keys) set in this mask, root to crown."""
+        return [member.name.lower() for member in ChakraFlag if member in self]
+
+
+def _records(record_type: type, table: dict) -> Mapping[str, Any]:
+    """Freeze a literal table of rows into a read-only mapping of ``record_type`` instances."""
+    return MappingProxyType({name: record_type(**row) for name, row in _freeze(table).items()})
+
+
+# Separators that users type in place of the underscores used by the condition keys
+_CONDITION_KEY = str.maketrans({" ": "_", "-": "_"})
+
+
+def _condition_key(condition: str) -> str:
+    """Normalize a free-form condition name ("Lower back pain") to its table key."""
+    return condition.strip().lower().translate(_CONDITION_KEY)
+
+
+# Primary 7 chakras (classic system)
+_CHAKRAS: Mapping[str, ChakraRecord] = _records(
+    ChakraRecord,
+    {
+        "muladhara": {
+            "name": "Muladhara",
+            "english": "Root Chakra",
+            "location": "Base of spine, perineum",
+            "element": "Earth",
+            "color": "Red",
+            "seed_mantra": "LAM",
+            "petals": 4,
+            "frequency": 396,  # Solfeggio
+            "physical_associations": ["Legs", "Feet", "Bones", "Large intestine", "Adrenal glands", "Spine base"],
+            "emotional_qualities": ["Grounding", "Security", "Survival", "Stability"],
+            "imbalances": [
+                "Fear",
+                "Insecurity",
+                "Lower back pain",
+                "Constipation",
+                "Fatigue",
+                "Disconnection from body",
+            ],
+            "healing_practices": [
+                "Standing postures",
+                "Walking barefoot",
+                "Root vegetable diet",
+                "Red color therapy",
+            ],
+            # TO BE FILLED: Add more detailed correspondences
+            "deities": None,  # e.g., Ganesha, Brahma
+            "sounds": None,  # Beyond mantra
+            "gems": None,  # e.g., Ruby, Garnet
+        },
+        "svadhisthana": {
+            "name": "Svadhisthana",
+            "english": "Sacral Chakra",
+            "location": "Lower abdomen, 2 inches below navel",
+            "element": "Water",
+            "color": "Orange",
+            "seed_mantra": "VAM",
+            "petals": 6,
+            "frequency": 417,
+            "physical_associations": [
+                "Reproductive organs",
+                "Kidneys",
+                "Bladder",
+                "Circulatory system",
+                "Lower abdomen",
+            ],
+            "emotional_qualities": ["Creativity", "Pleasure", "Sexuality", "Flow"],
+            "imbalances": [
+                "Creative blocks",
+                "Emotional instability",
+                "Sexual dysfunction",
+                "Urinary issues",
+                "Lower back pain",
+            ],
+            "healing_practices": ["Hip openers", "Water therapy", "Creative expression", "Orange foods"],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+        "manipura": {
+            "name": "Manipura",
+            "english": "Solar Plexus Chakra",
+            "location": "Upper abdomen, below sternum",
+            "element": "Fire",
+            "color": "Yellow",
+            "seed_mantra": "RAM",
+            "petals": 10,
+            "frequency": 528,
+            "physical_associations": ["Digestive system", "Pancreas", "Liver", "Stomach", "Spleen", "Gallbladder"],
+            "emotional_qualities": ["Personal power", "Will", "Confidence", "Transformation"],
+            "imbalances": ["Low self-esteem", "Digestive issues", "Anger", "Perfectionism", "Control issues"],
+            "healing_practices": ["Core strengthening", "Breath of fire", "Solar practice", "Yellow foods"],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+        "anahata": {
+            "name": "Anahata",
+            "english": "Heart Chakra",
+            "location": "Center of chest",
+            "element": "Air",
+            "color": "Green/Pink",
+            "seed_mantra": "YAM",
+            "petals": 12,
+            "frequency": 639,
+            "physical_associations": ["Heart", "Lungs", "Circulatory system", "Thymus", "Arms", "Hands"],
+            "emotional_qualities": ["Love", "Compassion", "Forgiveness", "Connection"],
+            "imbalances": ["Heart disease", "Asthma", "Inability to love", "Jealousy", "Loneliness", "Grief"],
+            "healing_practices": [
+                "Loving-kindness meditation",
+                "Heart openers",
+                "Green leafy vegetables",
+                "Pranayama",
+            ],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+        "vishuddha": {
+            "name": "Vishuddha",
+            "english": "Throat Chakra",
+            "location": "Throat",
+            "element": "Ether/Space",
+            "color": "Blue",
+            "seed_mantra": "HAM",
+            "petals": 16,
+            "frequency": 741,
+            "physical_associations": ["Throat", "Thyroid", "Parathyroid", "Neck", "Jaw", "Mouth", "Ears"],
+            "emotional_qualities": ["Communication", "Truth", "Expression", "Listening"],
+            "imbalances": [
+                "Thyroid issues",
+                "Sore throat",
+                "Inability to speak truth",
+                "Fear of speaking",
+                "Hearing problems",
+            ],
+            "healing_practices": ["Chanting", "Singing", "Neck stretches", "Blue foods", "Truthful communication"],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+        "ajna": {
+            "name": "Ajna",
+            "english": "Third Eye Chakra",
+            "location": "Between eyebrows",
+            "element": "Light",
+            "color": "Indigo/Purple",
+            "seed_mantra": "OM",
+            "petals": 2,
+            "frequency": 852,
+            "physical_associations": ["Pituitary gland", "Eyes", "Brain", "Neurological system", "Sinuses"],
+            "emotional_qualities": ["Intuition", "Wisdom", "Imagination", "Insight"],
+            "imbalances": [
+                "Headaches",
+                "Vision problems",
+                "Nightmares",
+                "Lack of intuition",
+                "Confusion",
+                "Delusion",
+            ],
+            "healing_practices": [
+                "Meditation",
+                "Visualization",
+                "Trataka (candle gazing)",
+                "Indigo foods",
+                "Dream work",
+            ],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+        "sahasrara": {
+            "name": "Sahasrara",
+            "english": "Crown Chakra",
+            "location": "Top of head",
+            "element": "Consciousness/Beyond elements",
+            "color": "Violet/White",
+            "seed_mantra": "AH/Silence",
+            "petals": 1000,
+            "frequency": 963,
+            "physical_associations": ["Pineal gland", "Cerebral cortex", "Central nervous system", "Upper skull"],
+            "emotional_qualities": ["Unity", "Enlightenment", "Divine connection", "Transcendence"],
+            "imbalances": ["Disconnection from spirit", "Cynicism", "Depression", "Confusion", "Closed-mindedness"],
+            "healing_practices": ["Meditation", "Prayer", "Silence", "Fasting", "Violet foods", "Crown breathing"],
+            "deities": None,
+            "sounds": None,
+            "gems": None,
+        },
+    },
+)
+
+
+# Column view of _CHAKRAS for reading one field across chakras: each chakra's
+# position, then one tuple per field in that order (derived, _CHAKRAS stays the source)
+_CHAKRA_INDEX: Mapping[str, int] = MappingProxyType({name: i for i, name in enumerate(_CHAKRAS)})
+_FREQUENCIES: tuple[int, ...] = tuple(chakra.frequency for chakra in _CHAKRAS.values())
+_MANTRAS: tuple[str, ...] = tuple(chakra.seed_mantra for chakra in _CHAKRAS.values())
+_COLORS: tuple[str, ...] = tuple(chakra.color for chakra in _CHAKRAS.values())
+_ELEMENTS: tuple[str, ...] = tuple(chakra.element for chakra in _CHAKRAS.values())
+_PRACTICES: tuple[tuple[str, ...], ...] = tuple(chakra.healing_practices for chakra in _CHAKRAS.values())
+
+
+@lru_cache(maxsize=1)
+def _frequency_array() -> "np.ndarray":
+    """Read-only int16 array of _FREQUENCIES; numpy is imported on first use to keep this module light."""
+    import numpy as np
+
+    freqs = np.fromiter(_FREQUENCIES, dtype=np.int16, count=len(_FREQUENCIES))
+    freqs.flags.writeable = False
+    return freqs
+
+
+@lru_cache(maxsize=64)
+def _chakra_protocol(chakra_name: str) -> Mapping[str, Any]:
+    """Read-only healing protocol of a chakra (empty for unknown names), built once per name."""
+    i = _CHAKRA_INDEX.get(chakra_name)
+    if i is None:
+        return _freeze({})
+
+    return _freeze(
+        {
+            "frequencies": [_FREQUENCIES[i]],
+            "mantra": _MANTRAS[i],
+            "color": _COLORS[i],
+            "element": _ELEMENTS[i],
+            "practices": _PRACTICES[i],
+            # TO BE EXPANDED
+        }
+    )
+
+
+# Condition -> chakras to work with
+_CHAKRA_CONDITIONS: Mapping[str, tuple[str, ...]] = _freeze(
+    {
+        # Physical conditions
+        "lower_back_pain": ["muladhara"],
+        "digestive_issues": ["manipura"],
+        "heart_disease": ["anahata"],
+        "thyroid": ["vishuddha"],
+        "headache": ["ajna"],
+        # Emotional/Mental conditions
+        "anxiety": ["muladhara", "anahata"],
+        "depression": ["sahasrara", "anahata"],
+        "anger": ["manipura"],
+        "grief": ["anahata"],
+        "fear": ["muladhara"],
+        # TO BE FILLED: Add hundreds more mappings
+    }
+)
+
 
 class ChakraSystem:
     """Vedic/Tantric 7-chakra model with healing correspondences.
@@ -37,223 +374,215 @@ class ChakraSystem:
         :meth:`get_healing_protocol` — return frequencies, mantra, colour, and practices.
 
     Attributes:
-        chakras: Dict keyed by Sanskrit name (``"muladhara"`` through ``"sahasrara"``).
+        chakras: Read-only mapping of :class:`ChakraRecord` keyed by Sanskrit
+            name (``"muladhara"`` through ``"sahasrara"``).
     """
 
+    __slots__ = ("chakras",)
+
     def __init__(self):
-        # Primary 7 chakras (classic system)
-        self.chakras = {
-            "muladhara": {
-                "name": "Muladhara",
-                "english": "Root Chakra",
-                "location": "Base of spine, perineum",
-                "element": "Earth",
-                "color": "Red",
-                "seed_mantra": "LAM",
-                "petals": 4,
-                "frequency": 396,  # Solfeggio
-                "physical_associations": ["Legs", "Feet", "Bones", "Large intestine", "Adrenal glands", "Spine base"],
-                "emotional_qualities": ["Grounding", "Security", "Survival", "Stability"],
-                "imbalances": [
-                    "Fear",
-                    "Insecurity",
-                    "Lower back pain",
-                    "Constipation",
-                    "Fatigue",
-                    "Disconnection from body",
-                ],
-                "healing_practices": [
-                    "Standing postures",
-                    "Walking barefoot",
-                    "Root vegetable diet",
-                    "Red color therapy",
-                ],
-                # TO BE FILLED: Add more detailed correspondences
-                "deities": None,  # e.g., Ganesha, Brahma
-                "sounds": None,  # Beyond mantra
-                "gems": None,  # e.g., Ruby, Garnet
-            },
-            "svadhisthana": {
-                "name": "Svadhisthana",
-                "english": "Sacral Chakra",
-                "location": "Lower abdomen, 2 inches below navel",
-                "element": "Water",
-                "color": "Orange",
-                "seed_mantra": "VAM",
-                "petals": 6,
-                "frequency": 417,
-                "physical_associations": [
-                    "Reproductive organs",
-                    "Kidneys",
-                    "Bladder",
-                    "Circulatory system",
-                    "Lower abdomen",
-                ],
-                "emotional_qualities": ["Creativity", "Pleasure", "Sexuality", "Flow"],
-                "imbalances": [
-                    "Creative blocks",
-                    "Emotional instability",
-                    "Sexual dysfunction",
-                    "Urinary issues",
-                    "Lower back pain",
-                ],
-                "healing_practices": ["Hip openers", "Water therapy", "Creative expression", "Orange foods"],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-            "manipura": {
-                "name": "Manipura",
-                "english": "Solar Plexus Chakra",
-                "location": "Upper abdomen, below sternum",
-                "element": "Fire",
-                "color": "Yellow",
-                "seed_mantra": "RAM",
-                "petals": 10,
-                "frequency": 528,
-                "physical_associations": ["Digestive system", "Pancreas", "Liver", "Stomach", "Spleen", "Gallbladder"],
-                "emotional_qualities": ["Personal power", "Will", "Confidence", "Transformation"],
-                "imbalances": ["Low self-esteem", "Digestive issues", "Anger", "Perfectionism", "Control issues"],
-                "healing_practices": ["Core strengthening", "Breath of fire", "Solar practice", "Yellow foods"],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-            "anahata": {
-                "name": "Anahata",
-                "english": "Heart Chakra",
-                "location": "Center of chest",
-                "element": "Air",
-                "color": "Green/Pink",
-                "seed_mantra": "YAM",
-                "petals": 12,
-                "frequency": 639,
-                "physical_associations": ["Heart", "Lungs", "Circulatory system", "Thymus", "Arms", "Hands"],
-                "emotional_qualities": ["Love", "Compassion", "Forgiveness", "Connection"],
-                "imbalances": ["Heart disease", "Asthma", "Inability to love", "Jealousy", "Loneliness", "Grief"],
-                "healing_practices": [
-                    "Loving-kindness meditation",
-                    "Heart openers",
-                    "Green leafy vegetables",
-                    "Pranayama",
-                ],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-            "vishuddha": {
-                "name": "Vishuddha",
-                "english": "Throat Chakra",
-                "location": "Throat",
-                "element": "Ether/Space",
-                "color": "Blue",
-                "seed_mantra": "HAM",
-                "petals": 16,
-                "frequency": 741,
-                "physical_associations": ["Throat", "Thyroid", "Parathyroid", "Neck", "Jaw", "Mouth", "Ears"],
-                "emotional_qualities": ["Communication", "Truth", "Expression", "Listening"],
-                "imbalances": [
-                    "Thyroid issues",
-                    "Sore throat",
-                    "Inability to speak truth",
-                    "Fear of speaking",
-                    "Hearing problems",
-                ],
-                "healing_practices": ["Chanting", "Singing", "Neck stretches", "Blue foods", "Truthful communication"],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-            "ajna": {
-                "name": "Ajna",
-                "english": "Third Eye Chakra",
-                "location": "Between eyebrows",
-                "element": "Light",
-                "color": "Indigo/Purple",
-                "seed_mantra": "OM",
-                "petals": 2,
-                "frequency": 852,
-                "physical_associations": ["Pituitary gland", "Eyes", "Brain", "Neurological system", "Sinuses"],
-                "emotional_qualities": ["Intuition", "Wisdom", "Imagination", "Insight"],
-                "imbalances": [
-                    "Headaches",
-                    "Vision problems",
-                    "Nightmares",
-                    "Lack of intuition",
-                    "Confusion",
-                    "Delusion",
-                ],
-                "healing_practices": [
-                    "Meditation",
-                    "Visualization",
-                    "Trataka (candle gazing)",
-                    "Indigo foods",
-                    "Dream work",
-                ],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-            "sahasrara": {
-                "name": "Sahasrara",
-                "english": "Crown Chakra",
-                "location": "Top of head",
-                "element": "Consciousness/Beyond elements",
-                "color": "Violet/White",
-                "seed_mantra": "AH/Silence",
-                "petals": 1000,
-                "frequency": 963,
-                "physical_associations": ["Pineal gland", "Cerebral cortex", "Central nervous system", "Upper skull"],
-                "emotional_qualities": ["Unity", "Enlightenment", "Divine connection", "Transcendence"],
-                "imbalances": ["Disconnection from spirit", "Cynicism", "Depression", "Confusion", "Closed-mindedness"],
-                "healing_practices": ["Meditation", "Prayer", "Silence", "Fasting", "Violet foods", "Crown breathing"],
-                "deities": None,
-                "sounds": None,
-                "gems": None,
-            },
-        }
+        # Shared, read-only tables built once at import
+        self.chakras = _CHAKRAS
 
     def get_chakra_for_condition(self, condition: str) -> list[str]:
         """
         Suggest which chakra(s) to work with for a given condition
         TO BE EXPANDED with comprehensive condition mapping
         """
-        condition_map = {
-            # Physical conditions
-            "lower_back_pain": ["muladhara"],
-            "digestive_issues": ["manipura"],
-            "heart_disease": ["anahata"],
-            "thyroid": ["vishuddha"],
-            "headache": ["ajna"],
-            # Emotional/Mental conditions
-            "anxiety": ["muladhara", "anahata"],
-            "depression": ["sahasrara", "anahata"],
-            "anger": ["manipura"],
-            "grief": ["anahata"],
-            "fear": ["muladhara"],
-            # TO BE FILLED: Add hundreds more mappings
-        }
+        return list(_CONDITION_TABLE.get(_condition_key(condition), _NO_CONDITION)[0])
 
-        return condition_map.get(condition.lower(), [])
+    def get_chakra_flags_for_condition(self, condition: str) -> ChakraFlag:
+        """Chakras for a condition as a :class:`ChakraFlag` mask (empty for unknown conditions)."""
+        return _CONDITION_FLAGS.get(_condition_key(condition), ChakraFlag(0))
 
     def get_healing_protocol(self, chakra_name: str) -> dict:
         """
         Get comprehensive healing protocol for a chakra
         Returns: frequencies, practices, foods, colors, etc.
         """
-        chakra = self.chakras.get(chakra_name)
-        if not chakra:
-            return {}
-
+        # The caller gets its own dict and lists; the shared protocol stays read-only
         return {
-            "frequencies": [chakra["frequency"]],
-            "mantra": chakra["seed_mantra"],
-            "color": chakra["color"],
-            "element": chakra["element"],
-            "practices": chakra["healing_practices"],
-            # TO BE EXPANDED
+            key: list(value) if isinstance(value, tuple) else value
+            for key, value in _chakra_protocol(chakra_name).items()
         }
 
+    def get_frequencies_array(self, chakra_names: Iterable[str]) -> "np.ndarray":
+        """Frequencies of the named chakras, in order, as an int16 array for vectorized synthesis.
+
+        Unknown names are skipped, so an unmatched condition yields an empty array.
+        """
+        return _frequency_array()[[_CHAKRA_INDEX[name] for name in chakra_names if name in _CHAKRA_INDEX]]
+
+
+# 12 Primary Meridians
+_PRIMARY_MERIDIANS: Mapping[str, MeridianRecord] = _records(
+    MeridianRecord,
+    {
+        "lung": {
+            "chinese": "肺经",
+            "pinyin": "Fèi Jīng",
+            "english": "Lung Meridian",
+            "yin_yang": "Yin",
+            "element": "Metal",
+            "organ": "Lung",
+            "paired_organ": "Large Intestine",
+            "time_active": "3-5 AM",
+            "pathway": "Chest to thumb",
+            "num_points": 11,
+            "key_functions": [
+                "Respiration",
+                "Immune function",
+                "Skin health",
+                "Grief processing",
+                "Receiving energy from universe",
+            ],
+            "imbalances": ["Asthma", "Cough", "Skin problems", "Grief", "Sadness", "Inability to let go"],
+            # TO BE FILLED: Major acupoints
+            "key_points": None,
+            "associated_emotions": ["Grief", "Sadness"],
+            "season": "Autumn",
+        },
+        "large_intestine": {
+            "chinese": "大肠经",
+            "pinyin": "Dà Cháng Jīng",
+            "english": "Large Intestine Meridian",
+            "yin_yang": "Yang",
+            "element": "Metal",
+            "organ": "Large Intestine",
+            "paired_organ": "Lung",
+            "time_active": "5-7 AM",
+            "pathway": "Index finger to nose",
+            "num_points": 20,
+            "key_functions": ["Elimination", "Detoxification", "Letting go"],
+            "imbalances": ["Constipation", "Diarrhea", "Skin issues", "Holding on to past", "Rigidity"],
+            "key_points": None,
+            "associated_emotions": ["Holding on", "Control"],
+            "season": "Autumn",
+        },
+        "stomach": {
+            "chinese": "胃经",
+            "pinyin": "Wèi Jīng",
+            "english": "Stomach Meridian",
+            "yin_yang": "Yang",
+            "element": "Earth",
+            "organ": "Stomach",
+            "paired_organ": "Spleen",
+            "time_active": "7-9 AM",
+            "pathway": "Face to second toe",
+            "num_points": 45,
+            "key_functions": ["Digestion", "Nourishment", "Grounding"],
+            "imbalances": None,
+            "key_points": None,
+            "associated_emotions": ["Worry", "Overthinking"],
+            "season": "Late Summer",
+        },
+        "spleen": {
+            "chinese": "脾经",
+            "pinyin": "Pí Jīng",
+            "english": "Spleen Meridian",
+            "yin_yang": "Yin",
+            "element": "Earth",
+            "organ": "Spleen",
+            "paired_organ": "Stomach",
+            "time_active": "9-11 AM",
+            "pathway": "Big toe to chest",
+            "num_points": 21,
+            "key_functions": ["Blood production", "Energy transformation", "Muscle tone", "Analytical thinking"],
+            "imbalances": None,
+            "key_points": None,
+            "associated_emotions": ["Worry", "Pensiveness"],
+            "season": "Late Summer",
+        },
+        # TO BE FILLED: Remaining 8 meridians
+        # - Heart (心经)
+        # - Small Intestine (小肠经)
+        # - Bladder (膀胱经)
+        # - Kidney (肾经)
+        # - Pericardium (心包经)
+        # - Triple Warmer (三焦经)
+        # - Gallbladder (胆经)
+        # - Liver (肝经)
+    },
+)
+
+
+# 8 Extraordinary Vessels
+_EXTRAORDINARY_VESSELS: Mapping[str, Mapping[str, Any]] = _freeze(
+    {
+        "governing": {
+            "chinese": "督脉",
+            "pinyin": "Dū Mài",
+            "english": "Governing Vessel",
+            "pathway": "Tailbone up spine to head",
+            "functions": ["Yang energy reservoir", "Spine and brain health", "Overall vitality"],
+            # TO BE FILLED
+        },
+        "conception": {
+            "chinese": "任脉",
+            "pinyin": "Rèn Mài",
+            "english": "Conception Vessel",
+            "pathway": "Perineum up front centerline to chin",
+            "functions": ["Yin energy reservoir", "Reproductive health", "Nourishment"],
+            # TO BE FILLED
+        },
+        # TO BE FILLED: Remaining 6 vessels
+    }
+)
+
+
+# Chinese Medicine Clock: each meridian's two-hour window, starting at 23:00
+_MERIDIAN_CLOCK = (
+    "gallbladder",
+    "liver",
+    "lung",
+    "large_intestine",
+    "stomach",
+    "spleen",
+    "heart",
+    "small_intestine",
+    "bladder",
+    "kidney",
+    "pericardium",
+    "triple_warmer",
+)
+# Meridian active at each hour 0-23 (the gallbladder window wraps past midnight)
+_HOUR_TO_MERIDIAN = tuple(_MERIDIAN_CLOCK[(hour + 1) % 24 // 2] for hour in range(24))
+
+
+@lru_cache(maxsize=1)
+def _hour_to_meridian_array() -> "np.ndarray":
+    """Read-only array form of _HOUR_TO_MERIDIAN for batch lookups (numpy imported on first use)."""
+    import numpy as np
+
+    names = np.array(_HOUR_TO_MERIDIAN)
+    names.flags.writeable = False
+    return names
+
+
+# Condition -> meridians to work with (placeholder structure)
+_MERIDIAN_CONDITIONS: Mapping[str, tuple[str, ...]] = _freeze(
+    {
+        "headache": ["liver", "gallbladder", "stomach"],
+        "digestive": ["spleen", "stomach"],
+        "respiratory": ["lung"],
+        # Add hundreds more
+    }
+)
+
+# Condition -> (chakras, meridians), merged so every condition lookup is a single probe
+_CONDITION_TABLE: Mapping[str, tuple[tuple[str, ...], tuple[str, ...]]] = MappingProxyType(
+    {
+        condition: (_CHAKRA_CONDITIONS.get(condition, ()), _MERIDIAN_CONDITIONS.get(condition, ()))
+        for condition in {*_CHAKRA_CONDITIONS, *_MERIDIAN_CONDITIONS}
+    }
+)
+# Lookup result for conditions neither system maps
+_NO_CONDITION: tuple[tuple[str, ...], tuple[str, ...]] = ((), ())
+# Condition -> chakras involved as a bitmask (order-free view of _CONDITION_TABLE)
+_CONDITION_FLAGS: Mapping[str, ChakraFlag] = MappingProxyType(
+    {condition: ChakraFlag.from_names(chakras) for condition, (chakras, _) in _CONDITION_TABLE.items()}
+)
+
 
 class MeridianSystem:
     """Chinese Medicine meridian framework (12 primary + 8 extraordinary vessels).
@@ -263,160 +592,97 @@ class MeridianSystem:
     the Chinese Medicine Clock via :meth:`get_meridian_for_time`.
 
     Attributes:
-        primary_meridians: Dict of 12 meridian entries (Lung through Liver).
-        extraordinary_vessels: Dict of 8 extraordinary vessel entries.
+        primary_meridians: Read-only mapping of :class:`MeridianRecord` entries (Lung through Liver).
+        extraordinary_vessels: Read-only mapping of 8 extraordinary vessel entries.
     """
 
-    def __init__(self):
-        # 12 Primary Meridians
-        self.primary_meridians = {
-            "lung": {
-                "chinese": "肺经",
-                "pinyin": "Fèi Jīng",
-                "english": "Lung Meridian",
-                "yin_yang": "Yin",
-                "element": "Metal",
-                "organ": "Lung",
-                "paired_organ": "Large Intestine",
-                "time_active": "3-5 AM",
-                "pathway": "Chest to thumb",
-                "num_points": 11,
-                "key_functions": [
-                    "Respiration",
-                    "Immune function",
-                    "Skin health",
-                    "Grief processing",
-                    "Receiving energy from universe",
-                ],
-                "imbalances": ["Asthma", "Cough", "Skin problems", "Grief", "Sadness", "Inability to let go"],
-                # TO BE FILLED: Major acupoints
-                "key_points": None,
-                "associated_emotions": ["Grief", "Sadness"],
-                "season": "Autumn",
-            },
-            "large_intestine": {
-                "chinese": "大肠经",
-                "pinyin": "Dà Cháng Jīng",
-                "english": "Large Intestine Meridian",
-                "yin_yang": "Yang",
-                "element": "Metal",
-                "organ": "Large Intestine",
-                "paired_organ": "Lung",
-                "time_active": "5-7 AM",
-                "pathway": "Index finger to nose",
-                "num_points": 20,
-                "key_functions": ["Elimination", "Detoxification", "Letting go"],
-                "imbalances": ["Constipation", "Diarrhea", "Skin issues", "Holding on to past", "Rigidity"],
-                "key_points": None,
-                "associated_emotions": ["Holding on", "Control"],
-                "season": "Autumn",
-            },
-            "stomach": {
-                "chinese": "胃经",
-                "pinyin": "Wèi Jīng",
-                "english": "Stomach Meridian",
-                "yin_yang": "Yang",
-                "element": "Earth",
-                "organ": "Stomach",
-                "paired_organ": "Spleen",
-                "time_active": "7-9 AM",
-                "pathway": "Face to second toe",
-                "num_points": 45,
-                "key_functions": ["Digestion", "Nourishment", "Grounding"],
-                "imbalances": None,
-                "key_points": None,
-                "associated_emotions": ["Worry", "Overthinking"],
-                "season": "Late Summer",
-            },
-            "spleen": {
-                "chinese": "脾经",
-                "pinyin": "Pí Jīng",
-                "english": "Spleen Meridian",
-                "yin_yang": "Yin",
-                "element": "Earth",
-                "organ": "Spleen",
-                "paired_organ": "Stomach",
-                "time_active": "9-11 AM",
-                "pathway": "Big toe to chest",
-                "num_points": 21,
-                "key_functions": ["Blood production", "Energy transformation", "Muscle tone", "Analytical thinking"],
-                "imbalances": None,
-                "key_points": None,
-                "associated_emotions": ["Worry", "Pensiveness"],
-                "season": "Late Summer",
-            },
-            # TO BE FILLED: Remaining 8 meridians
-            # - Heart (心经)
-            # - Small Intestine (小肠经)
-            # - Bladder (膀胱经)
-            # - Kidney (肾经)
-            # - Pericardium (心包经)
-            # - Triple Warmer (三焦经)
-            # - Gallbladder (胆经)
-            # - Liver (肝经)
-        }
+    __slots__ = ("primary_meridians", "extraordinary_vessels")
 
-        # 8 Extraordinary Vessels
-        self.extraordinary_vessels = {
-            "governing": {
-                "chinese": "督脉",
-                "pinyin": "Dū Mài",
-                "english": "Governing Vessel",
-                "pathway": "Tailbone up spine to head",
-                "functions": ["Yang energy reservoir", "Spine and brain health", "Overall vitality"],
-                # TO BE FILLED
-            },
-            "conception": {
-                "chinese": "任脉",
-                "pinyin": "Rèn Mài",
-                "english": "Conception Vessel",
-                "pathway": "Perineum up front centerline to chin",
-                "functions": ["Yin energy reservoir", "Reproductive health", "Nourishment"],
-                # TO BE FILLED
-            },
-            # TO BE FILLED: Remaining 6 vessels
-        }
+    def __init__(self):
+        self.primary_meridians = _PRIMARY_MERIDIANS
+        self.extraordinary_vessels = _EXTRAORDINARY_VESSELS
 
     def get_meridian_for_time(self, hour: int) -> str:
         """
-        Get the meridian most active at given hour (24-hour clock)
+        Get the meridian most active at given hour (24-hour clock, taken modulo 24)
         Based on Chinese Medicine Clock
         """
-        time_map = {
-            (3, 5): "lung",
-            (5, 7): "large_intestine",
-            (7, 9): "stomach",
-            (9, 11): "spleen",
-            (11, 13): "heart",
-            (13, 15): "small_intestine",
-            (15, 17): "bladder",
-            (17, 19): "kidney",
-            (19, 21): "pericardium",
-            (21, 23): "triple_warmer",
-            (23, 24): "gallbladder",  # 23:00–midnight
-            (0, 1): "gallbladder",  # midnight–01:00 (split for wraparound)
-            (1, 3): "liver",
-        }
+        return _HOUR_TO_MERIDIAN[hour % 24]
 
-        for (start, end), meridian in time_map.items():
-            if start <= hour < end:
-                return meridian
+    def get_meridians_for_hours(self, hours: Iterable[int]) -> "np.ndarray":
+        """Batch form of :meth:`get_meridian_for_time`: the active meridian for each hour, as a string array."""
+        import numpy as np
 
-        return "liver"  # Safety-net default (all 24 hours are covered above)
+        return _hour_to_meridian_array()[np.asarray(hours, dtype=np.int64) % 24]
 
     def get_meridian_for_condition(self, condition: str) -> list[str]:
         """
         TO BE FILLED: Map conditions to meridians
         """
-        # Placeholder structure
-        condition_map = {
-            "headache": ["liver", "gallbladder", "stomach"],
-            "digestive": ["spleen", "stomach"],
-            "respiratory": ["lung"],
-            # Add hundreds more
-        }
-
-        return condition_map.get(condition.lower(), [])
+        return list(_CONDITION_TABLE.get(_condition_key(condition), _NO_CONDITION)[1])
+
+
+# Three main channels
+_MAIN_CHANNELS: Mapping[str, Mapping[str, Any]] = _freeze(
+    {
+        "central": {
+            "tibetan": "uma",
+            "sanskrit": "avadhuti",
+            "location": "Central channel, spine centerline",
+            "color": "Blue",
+            "width": "Wheat stalk",
+            "function": "Wisdom, enlightenment, bliss",
+            "practices": ["Tummo", "Six Yogas of Naropa"],
+        },
+        "right": {
+            "tibetan": "roma",
+            "sanskrit": "rasana",
+            "location": "Right of central channel",
+            "color": "Red",
+            "width": "Thinner",
+            "function": "Heat, method, skillful means",
+            "associated_with": "Sun, masculine",
+        },
+        "left": {
+            "tibetan": "kyangma",
+            "sanskrit": "lalana",
+            "location": "Left of central channel",
+            "color": "White",
+            "width": "Thinner",
+            "function": "Cooling, wisdom, emptiness",
+            "associated_with": "Moon, feminine",
+        },
+    }
+)
+
+
+# Channel wheels (chakras in Tibetan system)
+_CHANNEL_WHEELS: Mapping[str, Mapping[str, Any]] = _freeze(
+    {
+        "crown": {"location": "Crown of head", "petals": 32, "element": "Space", "function": "Great bliss"},
+        "throat": {"location": "Throat", "petals": 16, "element": "Wind", "function": "Enjoyment"},
+        "heart": {
+            "location": "Heart center",
+            "petals": 8,
+            "element": "Fire",
+            "function": "Dharma, indestructible drop",
+        },
+        "navel": {"location": "Navel", "petals": 64, "element": "Water", "function": "Emanation, inner fire"},
+        # TO BE FILLED: Secret chakra
+    }
+)
+
+
+# Five Winds (Lung)
+_FIVE_WINDS: Mapping[str, str] = _freeze(
+    {
+        "life_bearing": "Heart, respiration, circulation",
+        "upward_moving": "Throat, speech, swallowing",
+        "pervading": "Whole body, movement",
+        "fire_accompanying": "Stomach, digestion",
+        "downward_clearing": "Lower body, elimination",
+    }
+)
 
 
 class TibetanChannelSystem:
@@ -432,60 +698,40 @@ class TibetanChannelSystem:
         five_winds: The five prana-vayu functions.
     """
 
+    __slots__ = ("main_channels", "channel_wheels", "five_winds")
+
     def __init__(self):
-        # Three main channels
-        self.main_channels = {
-            "central": {
-                "tibetan": "uma",
-                "sanskrit": "avadhuti",
-                "location": "Central channel, spine centerline",
-                "color": "Blue",
-                "width": "Wheat stalk",
-                "function": "Wisdom, enlightenment, bliss",
-                "practices": ["Tummo", "Six Yogas of Naropa"],
-            },
-            "right": {
-                "tibetan": "roma",
-                "sanskrit": "rasana",
-                "location": "Right of central channel",
-                "color": "Red",
-                "width": "Thinner",
-                "function": "Heat, method, skillful means",
-                "associated_with": "Sun, masculine",
-            },
-            "left": {
-                "tibetan": "kyangma",
-                "sanskrit": "lalana",
-                "location": "Left of central channel",
-                "color": "White",
-                "width": "Thinner",
-                "function": "Cooling, wisdom, emptiness",
-                "associated_with": "Moon, feminine",
-            },
+        self.main_channels = _MAIN_CHANNELS
+        self.channel_wheels = _CHANNEL_WHEELS
+        self.five_winds = _FIVE_WINDS
+
+
+def _build_condition_index() -> Mapping[str, Mapping[str, tuple]]:
+    """Aggregate the static tables into one read-only, duplicate-free protocol per known condition."""
+    index = {}
+    for condition, (chakras, meridians) in _CONDITION_TABLE.items():
+        index[condition] = {
+            "chakras_involved": chakras,
+            "meridians_involved": meridians,
+            # dict.fromkeys keeps first-seen order while dropping values shared between chakras
+            "frequencies": tuple(dict.fromkeys(_FREQUENCIES[_CHAKRA_INDEX[name]] for name in chakras)),
+            "practices": tuple(
+                dict.fromkeys(practice for name in chakras for practice in _PRACTICES[_CHAKRA_INDEX[name]])
+            ),
         }
+    return _freeze(index)
 
-        # Channel wheels (chakras in Tibetan system)
-        self.channel_wheels = {
-            "crown": {"location": "Crown of head", "petals": 32, "element": "Space", "function": "Great bliss"},
-            "throat": {"location": "Throat", "petals": 16, "element": "Wind", "function": "Enjoyment"},
-            "heart": {
-                "location": "Heart center",
-                "petals": 8,
-                "element": "Fire",
-                "function": "Dharma, indestructible drop",
-            },
-            "navel": {"location": "Navel", "petals": 64, "element": "Water", "function": "Emanation, inner fire"},
-            # TO BE FILLED: Secret chakra
-        }
 
-        # Five Winds (Lung)
-        self.five_winds = {
-            "life_bearing": "Heart, respiration, circulation",
-            "upward_moving": "Throat, speech, swallowing",
-            "pervading": "Whole body, movement",
-            "fire_accompanying": "Stomach, digestion",
-            "downward_clearing": "Lower body, elimination",
-        }
+# Condition -> aggregated chakra/meridian protocol, built once from the tables above
+_CONDITION_PROTOCOLS = _build_condition_index()
+
+
+# Session skeleton: each phase's name and default practices, in order (durations are set per plan)
+_SESSION_PHASES: tuple[tuple[str, tuple[str, ...]], ...] = (
+    ("Opening/Grounding", ("Breath awareness", "Body scan")),
+    ("Main Practice", ()),  # TO BE FILLED
+    ("Closing/Integration", ("Dedication", "Rest")),
+)
 
 
 class IntegratedHealingProtocol:
@@ -499,71 +745,83 @@ class IntegratedHealingProtocol:
         chakra_system: :class:`ChakraSystem` instance.
         meridian_system: :class:`MeridianSystem` instance.
         tibetan_system: :class:`TibetanChannelSystem` instance.
+
+    Each system is created on first access, so callers pay only for the ones they use.
     """
 
-    def __init__(self):
-        self.chakra_system = ChakraSystem()
-        self.meridian_system = MeridianSystem()
-        self.tibetan_system = TibetanChannelSystem()
+    @cached_property
+    def chakra_system(self) -> ChakraSystem:
+        return ChakraSystem()
+
+    @cached_property
+    def meridian_system(self) -> MeridianSystem:
+        return MeridianSystem()
+
+    @cached_property
+    def tibetan_system(self) -> TibetanChannelSystem:
+        return TibetanChannelSystem()
 
     def generate_protocol(self, condition: str, include_astrology: bool = True) -> dict:
         """
         Generate integrated healing protocol
         TO BE EXPANDED with full integration logic
         """
-        protocol = {
+        base = _CONDITION_PROTOCOLS.get(_condition_key(condition))
+        if base is None:
+            # Unknown condition: nothing to copy out of the index, every field starts empty
+            return {
+                "condition": condition,
+                "chakras_involved": [],
+                "meridians_involved": [],
+                "frequencies": [],
+                "mantras": [],
+                "colors": [],
+                "practices": [],
+                "dietary_suggestions": [],
+                "timing_recommendations": [],
+            }
+        return {
             "condition": condition,
-            "chakras_involved": self.chakra_system.get_chakra_for_condition(condition),
-            "meridians_involved": self.meridian_system.get_meridian_for_condition(condition),
-            "frequencies": [],
+            "chakras_involved": list(base["chakras_involved"]),
+            "meridians_involved": list(base["meridians_involved"]),
+            "frequencies": list(base["frequencies"]),
             "mantras": [],
             "colors": [],
-            "practices": [],
+            "practices": list(base["practices"]),
             "dietary_suggestions": [],
             "timing_recommendations": [],
             # TO BE FILLED with complete protocol
         }
 
-        # Aggregate frequencies from chakras
-        for chakra_name in protocol["chakras_involved"]:
-            chakra_protocol = self.chakra_system.get_healing_protocol(chakra_name)
-            protocol["frequencies"].extend(chakra_protocol.get("frequencies", []))
-            protocol["practices"].extend(chakra_protocol.get("practices", []))
-
-        return protocol
-
     def create_session_plan(self, intention: str, duration_minutes: int = 30) -> dict:
         """
         Create a complete healing session plan.
         Phase durations scale proportionally (1:4:1 ratio) to the requested total.
         """
         opening = max(5, duration_minutes // 6)
-        closing = opening
-        main = duration_minutes - opening - closing
+        durations = (opening, duration_minutes - 2 * opening, opening)
         return {
             "intention": intention,
             "duration": duration_minutes,
             "phases": [
-                {
-                    "name": "Opening/Grounding",
-                    "duration": opening,
-                    "practices": ["Breath awareness", "Body scan"],
-                },
-                {
-                    "name": "Main Practice",
-                    "duration": main,
-                    "practices": [],  # TO BE FILLED
-                },
-                {
-                    "name": "Closing/Integration",
-                    "duration": closing,
-                    "practices": ["Dedication", "Rest"],
-                },
+                {"name": name, "duration": minutes, "practices": list(practices)}
+                for (name, practices), minutes in zip(_SESSION_PHASES, durations)
             ],
             # TO BE FILLED
         }
 
 
+__all__ = [
+    "ChakraRecord",
+    "MeridianRecord",
+    "ChakraFlag",
+    "ChakraSystem",
+    "MeridianSystem",
+    "TibetanChannelSystem",
+    "IntegratedHealingProtocol",
+]
+
+
 # === FOR OFFLINE DEVELOPMENT ===
 #
 # TODO(remediation): Fill in the following areas: (offline-development stub; deferred — see eval Issue 5.11)
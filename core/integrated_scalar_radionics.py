@@ -14,16 +14,24 @@ Features:
 - Harmonic frequency selection
 """
 
+import io
+import queue
+import sys
+import threading
 import time
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
+from functools import partial
+from typing import TextIO
 
 try:
-    from core.advanced_scalar_waves import HybridScalarWaveGenerator
+    from core.advanced_scalar_waves import HAS_NUMBA, HAS_NUMPY, HybridScalarWaveGenerator
 
     HAS_SCALAR = True
 except ImportError:
+    HAS_NUMBA = False
+    HAS_NUMPY = False
     HAS_SCALAR = False
 
 try:
@@ -40,6 +48,30 @@ try:
 except ImportError:
     HAS_ANATOMY = False
 
+# Scalar samples per batch at full intensity: NumPy batches are large enough to
+# amortize per-call overhead, the pure-Python fallback keeps its original size
+SCALAR_BATCH_NUMPY = 10_000
+SCALAR_BATCH_PYTHON = 1_000
+# Loop timing runs on integer time.monotonic_ns() readings
+NS_PER_SECOND = 1_000_000_000
+# Minimum time between refreshes of the live progress line
+PROGRESS_INTERVAL_NS = NS_PER_SECOND // 4
+# How long a fetched target list is reused by back-to-back broadcasts before the database is read again
+TARGET_CACHE_TTL_NS = 30 * NS_PER_SECOND
+# Width of the live progress bar and its rendering at every fill level
+PROGRESS_BAR_WIDTH = 20
+_PROGRESS_BARS = tuple("█" * i + " " * (PROGRESS_BAR_WIDTH - i) for i in range(PROGRESS_BAR_WIDTH + 1))
+# Each hybrid sample mixes seven generation methods; loops count samples and scale once
+OPS_PER_SAMPLE = 7
+# Batches the background producer may run ahead of the broadcast loop
+PRODUCER_QUEUE_DEPTH = 2
+# Resolution of the precomputed breathing batch-size schedule
+BREATH_STEPS_PER_SECOND = 100
+# Inhale, hold and exhale lengths of the breathing pattern, in seconds
+BREATH_INHALE_SECONDS = 33
+BREATH_HOLD_SECONDS = 27
+BREATH_EXHALE_SECONDS = 33
+
 
 class IntentionType(Enum):
     """Types of healing intentions"""
@@ -54,6 +86,30 @@ class IntentionType(Enum):
     WISDOM = "wisdom"
 
 
+# Numeric seed of each intention (gematria-inspired)
+_INTENTION_SEEDS = {
+    IntentionType.HEALING: 432,  # 432 Hz harmony
+    IntentionType.LIBERATION: 396,  # Liberation frequency
+    IntentionType.EMPOWERMENT: 528,  # DNA/transformation
+    IntentionType.PROTECTION: 741,  # Awakening/protection
+    IntentionType.RECONCILIATION: 639,  # Connection
+    IntentionType.PEACE: 852,  # Spiritual order
+    IntentionType.LOVE: 528,  # Love frequency
+    IntentionType.WISDOM: 963,  # Divine consciousness
+}
+# Key into the broadcaster's ``frequencies`` table for each intention
+_INTENTION_FREQUENCY_KEYS = {
+    IntentionType.HEALING: "healing_dna",
+    IntentionType.LIBERATION: "liberation",
+    IntentionType.EMPOWERMENT: "awakening",
+    IntentionType.PROTECTION: "awakening",
+    IntentionType.RECONCILIATION: "connection",
+    IntentionType.PEACE: "spiritual",
+    IntentionType.LOVE: "healing_dna",
+    IntentionType.WISDOM: "unity",
+}
+
+
 @dataclass
 class BroadcastConfiguration:
     """Configuration for scalar-radionics broadcast"""
@@ -115,6 +171,9 @@ class IntegratedScalarRadionicsBroadcaster:
             "saturn": 147.85,  # Saturn
         }
 
+        # Targets read from blessing_db with their monotonic_ns fetch time (see _get_targets_cached)
+        self._target_cache: tuple[list, int] | None = None
+
         # Statistics
         self.total_broadcasts = 0
         self.total_operations = 0
@@ -122,40 +181,43 @@ class IntegratedScalarRadionicsBroadcaster:
 
     def encode_intention(self, intention: IntentionType) -> int:
         """Encode intention as numeric seed (gematria-inspired)"""
-        intention_values = {
-            IntentionType.HEALING: 432,  # 432 Hz harmony
-            IntentionType.LIBERATION: 396,  # Liberation frequency
-            IntentionType.EMPOWERMENT: 528,  # DNA/transformation
-            IntentionType.PROTECTION: 741,  # Awakening/protection
-            IntentionType.RECONCILIATION: 639,  # Connection
-            IntentionType.PEACE: 852,  # Spiritual order
-            IntentionType.LOVE: 528,  # Love frequency
-            IntentionType.WISDOM: 963,  # Divine consciousness
-        }
-        return intention_values.get(intention, 528)
+        return _INTENTION_SEEDS.get(intention, 528)
 
     def select_frequency(self, intention: IntentionType) -> float:
         """Select appropriate frequency for intention"""
-        frequency_map = {
-            IntentionType.HEALING: self.frequencies["healing_dna"],
-            IntentionType.LIBERATION: self.frequencies["liberation"],
-            IntentionType.EMPOWERMENT: self.frequencies["awakening"],
-            IntentionType.PROTECTION: self.frequencies["awakening"],
-            IntentionType.RECONCILIATION: self.frequencies["connection"],
-            IntentionType.PEACE: self.frequencies["spiritual"],
-            IntentionType.LOVE: self.frequencies["healing_dna"],
-            IntentionType.WISDOM: self.frequencies["unity"],
-        }
-        return frequency_map.get(intention, self.frequencies["healing_dna"])
+        return self.frequencies[_INTENTION_FREQUENCY_KEYS.get(intention, "healing_dna")]
 
-    def broadcast_to_targets(self, config: BroadcastConfiguration) -> dict:
+    def _get_targets_cached(self) -> list:
+        """All blessing targets, re-read from the database at most every TARGET_CACHE_TTL_NS."""
+        now_ns = time.monotonic_ns()
+        if self._target_cache is None or now_ns - self._target_cache[1] >= TARGET_CACHE_TTL_NS:
+            self._target_cache = (self.blessing_db.get_all_targets(), now_ns)
+        return self._target_cache[0]
+
+    def invalidate_caches(self):
+        """Forget cached database reads so the next broadcast sees current rows."""
+        self._target_cache = None
+
+    def broadcast_to_targets(self, config: BroadcastConfiguration, out: TextIO | None = None) -> dict:
         """
         Perform integrated scalar-radionics broadcast to targets.
+
+        The report is printed to ``out`` (stdout by default). When stdout is
+        not a terminal it is collected in memory and written once at the end;
+        pass ``io.StringIO()`` to keep it off stdout entirely.
         """
-        print("\n" + "=" * 70)
-        print("INTEGRATED SCALAR-RADIONICS BROADCAST")
-        print("=" * 70)
-        print()
+        if out is None and not sys.stdout.isatty():
+            buffer = io.StringIO()
+            try:
+                return self._broadcast(config, buffer)
+            finally:
+                sys.stdout.write(buffer.getvalue())
+        return self._broadcast(config, out or sys.stdout)
+
+    def _broadcast(self, config: BroadcastConfiguration, out: TextIO) -> dict:
+        """Run the broadcast, printing the report to ``out``"""
+        rule = "=" * 70
+        print(f"\n{rule}\nINTEGRATED SCALAR-RADIONICS BROADCAST\n{rule}\n", file=out)
 
         results = {
             "start_time": datetime.now().isoformat(),
@@ -176,29 +238,31 @@ class IntegratedScalarRadionicsBroadcaster:
 
         # Get targets from database
         if self.blessing_db:
-            targets = self.blessing_db.get_all_targets()
+            targets = self._get_targets_cached()
             if targets:
                 targets = targets[: config.target_count]
                 results["targets_blessed"] = len(targets)
-                print(f"📡 Broadcasting to {len(targets)} targets")
-                for target in targets[:5]:  # Show first 5
-                    print(f"   • {target.name}")
+                # Show the first 5, built into one write
+                lines = [f"📡 Broadcasting to {len(targets)} targets"]
+                lines.extend(f"   • {target.name}" for target in targets[:5])
                 if len(targets) > 5:
-                    print(f"   ... and {len(targets) - 5} more")
+                    lines.append(f"   ... and {len(targets) - 5} more")
+                print("\n".join(lines), file=out)
             else:
-                print("⚠️  No targets in database - creating universal target")
+                print("⚠️  No targets in database - creating universal target", file=out)
                 targets = []
         else:
             targets = []
-            print("📡 Broadcasting to universal field")
-
-        print()
-        print(f"🎯 Intention: {config.intention.value}")
-        print(f"🔊 Frequency: {results['config']['frequency']:.2f} Hz")
-        print(f"🕉️  Mantra: {config.mantra}")
-        print(f"⚡ Intensity: {config.scalar_intensity:.0%}")
-        print(f"⏱️  Duration: {config.duration_seconds:.0f} seconds")
-        print()
+            print("📡 Broadcasting to universal field", file=out)
+
+        print(
+            f"\n🎯 Intention: {config.intention.value}\n"
+            f"🔊 Frequency: {results['config']['frequency']:.2f} Hz\n"
+            f"🕉️  Mantra: {config.mantra}\n"
+            f"⚡ Intensity: {config.scalar_intensity:.0%}\n"
+            f"⏱️  Duration: {config.duration_seconds:.0f} seconds\n",
+            file=out,
+        )
 
         # Invoke crystal broadcaster for prayer bowl audio (if available).
         # This is the integration point that was previously missing —
@@ -215,81 +279,110 @@ class IntegratedScalarRadionicsBroadcaster:
                     prayer_bowl_mode=True,
                     amplitude=0.15 + 0.35 * config.scalar_intensity,
                 )
-                print(f"🔔 Crystal broadcast: {crystal_result.get('status', 'unknown')}")
+                print(f"🔔 Crystal broadcast: {crystal_result.get('status', 'unknown')}", file=out)
             except Exception as e:
                 crystal_result = {"status": "failed", "error": str(e)}
-                print(f"⚠️  Crystal broadcast failed: {e}")
-            print()
+                print(f"⚠️  Crystal broadcast failed: {e}", file=out)
+            print(file=out)
 
         # Activate meridians if requested
         if config.use_meridians and self.anatomy_db:
             meridians = self.anatomy_db.get_all_meridians()
             results["meridians_activated"] = len(meridians)
-            print(f"🌿 Activating {len(meridians)} meridians:")
-            for m in meridians:
-                print(f"   • {m.name} ({m.element.value if m.element else 'N/A'})")
-            print()
+            print(
+                f"🌿 Activating {len(meridians)} meridians:",
+                *(f"   • {m.name} ({m.element.value if m.element else 'N/A'})" for m in meridians),
+                "",
+                sep="\n",
+                file=out,
+            )
 
         # Activate chakras if requested
         if config.use_chakras and self.anatomy_db:
             chakras = self.anatomy_db.get_all_chakras()
             results["chakras_activated"] = len(chakras)
-            print(f"🕉️  Activating {len(chakras)} chakras:")
-            for ch in chakras:
-                print(f"   • {ch.name} ({ch.frequency}Hz)")
-            print()
+            print(
+                f"🕉️  Activating {len(chakras)} chakras:",
+                *(f"   • {ch.name} ({ch.frequency}Hz)" for ch in chakras),
+                "",
+                sep="\n",
+                file=out,
+            )
 
         # Generate scalar wave field
         if self.scalar_gen:
-            print("⚡ Generating scalar wave field...")
-            print()
+            print("⚡ Generating scalar wave field...", file=out)
+            print(file=out)
 
-            self.encode_intention(config.intention)
-            ops_count = 0
-            start_time = time.time()
+            start_ns = time.monotonic_ns()
 
             if config.breathing_pattern:
                 # Sacred breathing pattern
-                print("🌬️  Using sacred breathing pattern...")
-                self._breathing_broadcast(config, results)
+                print("🌬️  Using sacred breathing pattern...", file=out)
+                ops_count = self._breathing_broadcast(config, out)
             else:
-                # Continuous broadcast
-                while (time.time() - start_time) < config.duration_seconds:
-                    # Generate based on intensity
-                    batch_size = int(1000 * config.scalar_intensity)
-                    stream = self.scalar_gen.generate_hybrid_stream(batch_size)
-
-                    ops_count += len(stream) * 7  # 7 methods
-
-                    # Show progress every 5 seconds
-                    elapsed = time.time() - start_time
-                    if int(elapsed) % 5 == 0:
-                        mops = (ops_count / elapsed) / 1_000_000
-                        progress = elapsed / config.duration_seconds
-                        temp = self.scalar_gen.thermal.state.temperature
-                        print(
-                            f"\r⏱️  {elapsed:.0f}s/{config.duration_seconds:.0f}s | "
-                            f"📊 {mops:.2f} MMOPS | "
-                            f"🌡️  {temp:.1f}°C | "
-                            f"{'█' * int(progress * 20)}{' ' * (20 - int(progress * 20))} {progress:.0%}",
-                            end="",
-                            flush=True,
-                        )
-
-            elapsed = time.time() - start_time
+                # Continuous broadcast. With NumPy, samples come in large vectorized batches.
+                # Only the sample count of each batch is used, so every batch reuses one buffer.
+                # The chaotic attractors integrate step by step, which holds the GIL unless the
+                # numba kernels (compiled nogil) are available; only then does a producer thread
+                # generate batches while this loop counts and prints.
+                if HAS_NUMPY:
+                    import numpy as np
+
+                    batch_size = int(SCALAR_BATCH_NUMPY * config.scalar_intensity)
+                    buffer = np.empty(max(1, batch_size), dtype=np.float32)
+                    generate = partial(self.scalar_gen.generate_hybrid_stream_np, out=buffer)
+                    if HAS_NUMBA:
+                        batches = self._sample_counts_in_background(generate, batch_size)
+                    else:
+                        batches = self._sample_counts_inline(generate, batch_size)
+                else:
+                    batch_size = int(SCALAR_BATCH_PYTHON * config.scalar_intensity)
+                    batches = self._sample_counts_inline(self.scalar_gen.generate_hybrid_stream, batch_size)
+                # One clock reading per batch serves both the deadline and the progress line
+                duration_ns = int(config.duration_seconds * NS_PER_SECOND)
+                now_ns = next_progress_ns = start_ns
+                samples = 0
+                try:
+                    while now_ns - start_ns < duration_ns:
+                        samples += next(batches)
+
+                        now_ns = time.monotonic_ns()
+                        if now_ns >= next_progress_ns:
+                            next_progress_ns = now_ns + PROGRESS_INTERVAL_NS
+                            elapsed = (now_ns - start_ns) / NS_PER_SECOND
+                            mops = (samples * OPS_PER_SAMPLE / elapsed) / 1_000_000
+                            progress = elapsed / config.duration_seconds
+                            temp = self.scalar_gen.thermal.state.temperature
+                            # The last batch can finish past the deadline, so clamp to a full bar
+                            bar = _PROGRESS_BARS[min(int(progress * PROGRESS_BAR_WIDTH), PROGRESS_BAR_WIDTH)]
+                            print(
+                                f"\r⏱️  {elapsed:.0f}s/{config.duration_seconds:.0f}s | "
+                                f"📊 {mops:.2f} MMOPS | "
+                                f"🌡️  {temp:.1f}°C | "
+                                f"{bar} {progress:.0%}",
+                                end="",
+                                flush=True,
+                                file=out,
+                            )
+                finally:
+                    batches.close()
+                ops_count = samples * OPS_PER_SAMPLE
+
+            elapsed = (time.monotonic_ns() - start_ns) / NS_PER_SECOND
             results["operations"] = ops_count
-            results["mops"] = (ops_count / elapsed) / 1_000_000
+            results["mops"] = (ops_count / elapsed) / 1_000_000 if elapsed > 0 else 0.0
 
-            print()
-            print()
-            print("✅ Scalar wave generation complete!")
-            print(f"   Operations: {ops_count:,}")
-            print(f"   Average MOPS: {results['mops']:.2f}")
-            print()
+            print(file=out)
+            print(file=out)
+            print("✅ Scalar wave generation complete!", file=out)
+            print(f"   Operations: {ops_count:,}", file=out)
+            print(f"   Average MOPS: {results['mops']:.2f}", file=out)
+            print(file=out)
 
         # Record session if we have blessing database
         if self.blessing_db and targets:
-            print("📝 Recording blessing session...")
+            print("📝 Recording blessing session...", file=out)
             session_id = self.blessing_db.record_session(
                 mantra_type=config.mantra,
                 total_mantras=108,
@@ -300,17 +393,19 @@ class IntegratedScalarRadionicsBroadcaster:
             )
 
             # Dedicate to each target
-            for target in targets:
-                self.blessing_db.record_dedication(
-                    target_identifier=target.identifier,
-                    session_id=session_id,
-                    mantra_type=config.mantra,
-                    mantras_count=108,
-                    notes=f"Scalar-enhanced broadcast at {results['mops']:.2f} MMOPS",
-                )
+            self.blessing_db.record_dedications_batch(
+                target_identifiers=[target.identifier for target in targets],
+                session_id=session_id,
+                mantra_type=config.mantra,
+                mantras_count=108,
+                notes=f"Scalar-enhanced broadcast at {results['mops']:.2f} MMOPS",
+            )
+
+            # Dedications changed the targets' counters
+            self.invalidate_caches()
 
-            print(f"✅ Blessed {len(targets)} targets")
-            print()
+            print(f"✅ Blessed {len(targets)} targets", file=out)
+            print(file=out)
 
         # Update statistics
         self.total_broadcasts += 1
@@ -318,64 +413,120 @@ class IntegratedScalarRadionicsBroadcaster:
         self.total_targets_blessed += results["targets_blessed"]
 
         # Final summary
-        print("=" * 70)
-        print("BROADCAST COMPLETE")
-        print("=" * 70)
-        print()
-        print(f"Intention: {config.intention.value}")
-        print(f"Operations: {results['operations']:,}")
-        print(f"MOPS: {results['mops']:.2f}")
-        print(f"Targets: {results['targets_blessed']}")
+        print("=" * 70, file=out)
+        print("BROADCAST COMPLETE", file=out)
+        print("=" * 70, file=out)
+        print(file=out)
+        print(f"Intention: {config.intention.value}", file=out)
+        print(f"Operations: {results['operations']:,}", file=out)
+        print(f"MOPS: {results['mops']:.2f}", file=out)
+        print(f"Targets: {results['targets_blessed']}", file=out)
         if results["meridians_activated"]:
-            print(f"Meridians: {results['meridians_activated']} activated")
+            print(f"Meridians: {results['meridians_activated']} activated", file=out)
         if results["chakras_activated"]:
-            print(f"Chakras: {results['chakras_activated']} activated")
-        print()
-        print("May all beings benefit from this transmission!")
-        print("Om Mani Padme Hum 🙏")
-        print()
+            print(f"Chakras: {results['chakras_activated']} activated", file=out)
+        print(file=out)
+        print("May all beings benefit from this transmission!", file=out)
+        print("Om Mani Padme Hum 🙏", file=out)
+        print(file=out)
 
         results["end_time"] = datetime.now().isoformat()
         results["crystal_output"] = crystal_result
         return results
 
-    def _breathing_broadcast(self, config: BroadcastConfiguration, results: dict):
-        """Broadcast using sacred breathing pattern"""
-        print("  Inhale phase (33s) - building field...")
-        start = time.time()
-        ops = 0
-        while (time.time() - start) < 33:
-            progress = (time.time() - start) / 33.0
-            batch = int(1000 * progress * config.scalar_intensity)
-            stream = self.scalar_gen.generate_hybrid_stream(max(10, batch))
-            ops += len(stream) * 7
-
-        print(f"  ✓ Inhale complete ({ops:,} operations)")
-
-        print("  Hold phase (27s) - maximum intensity...")
-        start = time.time()
-        while (time.time() - start) < 27:
-            batch = int(1000 * config.scalar_intensity)
-            stream = self.scalar_gen.generate_hybrid_stream(batch)
-            ops += len(stream) * 7
-
-        print(f"  ✓ Hold complete ({ops:,} operations)")
-
-        print("  Exhale phase (33s) - releasing field...")
-        start = time.time()
-        while (time.time() - start) < 33:
-            progress = 1.0 - ((time.time() - start) / 33.0)
-            batch = int(1000 * progress * config.scalar_intensity)
-            stream = self.scalar_gen.generate_hybrid_stream(max(10, batch))
-            ops += len(stream) * 7
-
-        print(f"  ✓ Exhale complete ({ops:,} operations)")
-
-        print("  Rest phase (12s) - integration...")
+    @staticmethod
+    def _sample_counts_inline(generate, batch_size: int):
+        """Yield the sample count of each batch generated on the calling thread"""
+        while True:
+            yield len(generate(batch_size))
+
+    @staticmethod
+    def _sample_counts_in_background(generate, batch_size: int):
+        """Yield the sample count of each batch generated on a producer thread.
+
+        The producer runs up to PRODUCER_QUEUE_DEPTH batches ahead.
+
+        Closing the generator stops the producer; a producer error is re-raised here.
+        """
+        ready = queue.Queue(maxsize=PRODUCER_QUEUE_DEPTH)
+        stop = threading.Event()
+
+        def produce():
+            try:
+                while not stop.is_set():
+                    ready.put(len(generate(batch_size)))
+            except Exception as e:
+                ready.put(e)
+
+        producer = threading.Thread(target=produce, name="scalar-producer", daemon=True)
+        producer.start()
+        try:
+            while True:
+                count = ready.get()
+                if isinstance(count, Exception):
+                    raise count
+                yield count
+        finally:
+            stop.set()
+            # Emptying the queue lets a blocked put() finish; the producer then sees the stop flag
+            while True:
+                try:
+                    ready.get_nowait()
+                except queue.Empty:
+                    break
+            producer.join()
+
+    def _breathing_schedule(self, intensity: float) -> tuple[list[int], list[int], list[int]]:
+        """Batch size for every step of the inhale, hold and exhale phases"""
+        full = 1000 * intensity
+        inhale_steps = BREATH_INHALE_SECONDS * BREATH_STEPS_PER_SECOND
+        exhale_steps = BREATH_EXHALE_SECONDS * BREATH_STEPS_PER_SECOND
+        inhale = [max(10, int(full * i / inhale_steps)) for i in range(inhale_steps)]
+        hold = [int(full)] * (BREATH_HOLD_SECONDS * BREATH_STEPS_PER_SECOND)
+        exhale = [max(10, int(full * (exhale_steps - i) / exhale_steps)) for i in range(exhale_steps)]
+        return inhale, hold, exhale
+
+    @staticmethod
+    def _run_breath_phase(generate, schedule: list[int]) -> int:
+        """Generate batches sized by the schedule step the clock is in; returns operations"""
+        step_ns = NS_PER_SECOND // BREATH_STEPS_PER_SECOND
+        phase_ns = len(schedule) * step_ns
+        samples = 0
+        start_ns = time.monotonic_ns()
+        while (elapsed_ns := time.monotonic_ns() - start_ns) < phase_ns:
+            samples += len(generate(schedule[elapsed_ns // step_ns]))
+        return samples * OPS_PER_SAMPLE
+
+    def _breathing_broadcast(self, config: BroadcastConfiguration, out: TextIO) -> int:
+        """Broadcast using sacred breathing pattern; returns the operation count"""
+        inhale, hold, exhale = self._breathing_schedule(config.scalar_intensity)
+        if HAS_NUMPY:
+            import numpy as np
+
+            # As in the continuous loop, only sample counts are used, so every batch
+            # of the cycle is written into one buffer sized for the largest step
+            buffer = np.empty(max(1, *inhale, *hold, *exhale), dtype=np.float32)
+            generate = partial(self.scalar_gen.generate_hybrid_stream_np, out=buffer)
+        else:
+            generate = self.scalar_gen.generate_hybrid_stream
+
+        print(f"  Inhale phase ({BREATH_INHALE_SECONDS}s) - building field...", file=out)
+        ops = self._run_breath_phase(generate, inhale)
+        print(f"  ✓ Inhale complete ({ops:,} operations)", file=out)
+
+        print(f"  Hold phase ({BREATH_HOLD_SECONDS}s) - maximum intensity...", file=out)
+        ops += self._run_breath_phase(generate, hold)
+        print(f"  ✓ Hold complete ({ops:,} operations)", file=out)
+
+        print(f"  Exhale phase ({BREATH_EXHALE_SECONDS}s) - releasing field...", file=out)
+        ops += self._run_breath_phase(generate, exhale)
+        print(f"  ✓ Exhale complete ({ops:,} operations)", file=out)
+
+        print("  Rest phase (12s) - integration...", file=out)
         time.sleep(12)
 
-        results["operations"] = ops
-        print("  ✓ Breathing cycle complete")
+        print("  ✓ Breathing cycle complete", file=out)
+        return ops
 
     def healing_protocol(self, target_name: str, duration_minutes: int = 10):
         """
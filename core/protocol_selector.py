@@ -99,15 +99,16 @@ class ProtocolSelector:
         protocol.chakras = chakra_names
 
         for name in chakra_names:
-            chakra = self.chakra_system.chakras.get(name, {})
-            if chakra.get("frequency"):
-                protocol.frequencies.append(float(chakra["frequency"]))
-            if chakra.get("seed_mantra"):
-                protocol.mantras.append(chakra["seed_mantra"])
-            if chakra.get("color"):
-                protocol.colours.append(chakra["color"])
-            if chakra.get("healing_practices"):
-                protocol.practices.extend(chakra["healing_practices"])
+            chakra = self.chakra_system.chakras.get(name)
+            if chakra is None:
+                continue
+            if chakra.frequency:
+                protocol.frequencies.append(float(chakra.frequency))
+            if chakra.seed_mantra:
+                protocol.mantras.append(chakra.seed_mantra)
+            if chakra.color:
+                protocol.colours.append(chakra.color)
+            protocol.practices.extend(chakra.healing_practices)
 
         # --- Meridian mapping ---
         meridian_names = self.meridian_system.get_meridian_for_condition(condition) if self.meridian_system else []
@@ -117,9 +118,9 @@ class ProtocolSelector:
         if meridian_names:
             # Suggest the active hour of the first meridian
             first_m = meridian_names[0]
-            meridian_data = self.meridian_system.primary_meridians.get(first_m, {})
-            if meridian_data.get("time_active"):
-                protocol.timing = meridian_data["time_active"]
+            meridian_data = self.meridian_system.primary_meridians.get(first_m)
+            if meridian_data is not None and meridian_data.time_active:
+                protocol.timing = meridian_data.time_active
 
         # --- Deduplicate and clean ---
         protocol.frequencies = list(dict.fromkeys(protocol.frequencies))
@@ -16,6 +16,10 @@ Covers:
   different output (avalanche property)
 * :class:`HybridScalarWaveGenerator` — ``generate_hybrid_stream`` returns a
   list of floats of the requested length
+* ``generate_array`` / ``generate_hybrid_stream_np`` — the NumPy forms match
+  the list streams and advance the same generator state
+* ``core._scalar_kernels`` — the (optionally numba-compiled) kernels match the
+  list streams
 """
 
 from __future__ import annotations
@@ -191,3 +195,110 @@ def test_hybrid_scalar_wave_generator_returns_requested_count():
     assert 1 <= len(out) <= 32
     for v in out:
         assert isinstance(v, float)
+
+
+# ---------------------------------------------------------------------------
+# 8. NumPy batch forms — same values and state as the list streams
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "factory",
+    [
+        asw.LorenzAttractor,
+        asw.RosslerAttractor,
+        lambda: asw.CellularAutomata1D(size=64, rule=110),
+        asw.KuramotoOscillator,
+        asw.CryptoMixer,
+        asw.PrimeHarmonics,
+    ],
+)
+def test_generate_array_matches_generate_stream(factory):
+    """``generate_array`` yields the list stream's values and leaves the same state behind."""
+    import copy
+
+    np = pytest.importorskip("numpy")
+
+    listed = factory()
+    arrayed = copy.deepcopy(listed)
+    for count in (40, 7):
+        expected = listed.generate_stream(count)
+        actual = arrayed.generate_array(count)
+        assert isinstance(actual, np.ndarray) and actual.shape == (count,)
+        np.testing.assert_allclose(actual, expected, rtol=0, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_hybrid_stream_np_returns_weighted_array():
+    """``generate_hybrid_stream_np`` returns a 1-D float32 array in [0, 1], counts 7 ops per sample, and fills ``out``."""
+    np = pytest.importorskip("numpy")
+
+    gen = asw.HybridScalarWaveGenerator()
+    assert sum(asw.HYBRID_WEIGHTS) == pytest.approx(1.0)
+    out = gen.generate_hybrid_stream_np(64)
+    assert isinstance(out, np.ndarray) and out.ndim == 1 and out.dtype == np.float32
+    assert 1 <= out.size <= 64
+    assert np.all((out >= 0.0) & (out <= 1.0))
+    assert gen.total_ops == 7 * out.size
+    assert asw.QuantumRNG().generate_array(16).shape == (16,)
+
+    # Writing into a caller's buffer returns a view of the filled samples
+    buffer = np.full(64, -1.0, dtype=np.float32)
+    filled = gen.generate_hybrid_stream_np(32, out=buffer)
+    assert filled.base is buffer and 1 <= filled.size <= 32
+    assert np.all((filled >= 0.0) & (filled <= 1.0))
+
+
+# ---------------------------------------------------------------------------
+# 9. Sequential-method kernels — compiled with numba when installed
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_scalar_kernels_match_list_streams():
+    """Each kernel fills its buffer with the list stream's values and advances the state."""
+    np = pytest.importorskip("numpy")
+    from core import _scalar_kernels as kernels
+
+    lorenz, lorenz_ref = asw.LorenzAttractor(), asw.LorenzAttractor()
+    state, out = np.array([lorenz.x, lorenz.y, lorenz.z]), np.empty(30)
+    kernels.lorenz_stream(state, lorenz.sigma, lorenz.rho, lorenz.beta, lorenz.dt, out)
+    np.testing.assert_allclose(out, lorenz_ref.generate_stream(30), rtol=0, atol=1e-12)
+    np.testing.assert_allclose(state, [lorenz_ref.x, lorenz_ref.y, lorenz_ref.z], rtol=0, atol=1e-12)
+
+    rossler, rossler_ref = asw.RosslerAttractor(), asw.RosslerAttractor()
+    state, out = np.array([rossler.x, rossler.y, rossler.z]), np.empty(30)
+    kernels.rossler_stream(state, rossler.a, rossler.b, rossler.c, rossler.dt, out)
+    np.testing.assert_allclose(out, rossler_ref.generate_stream(30), rtol=0, atol=1e-12)
+
+    ca, ca_ref = asw.CellularAutomata1D(size=32, rule=110), asw.CellularAutomata1D(size=32, rule=110)
+    cells, out = np.array(ca.cells, dtype=np.uint8), np.empty(12)
+    kernels.ca_entropy_stream(cells, np.array(ca.rule_table, dtype=np.uint8), out)
+    np.testing.assert_allclose(out, ca_ref.generate_stream(12), rtol=0, atol=1e-12)
+    assert cells.tolist() == ca_ref.cells
+
+    osc, osc_ref = asw.KuramotoOscillator(n_oscillators=8), asw.KuramotoOscillator(n_oscillators=8)
+    theta, out = np.array(osc.theta), np.empty(12)
+    kernels.kuramoto_order_stream(theta, np.array(osc.omega) * osc.dt, osc.K / osc.n * osc.dt, out)
+    np.testing.assert_allclose(out, osc_ref.generate_stream(12), rtol=0, atol=1e-12)
+
+
+@pytest.mark.unit
+def test_generate_array_kernel_path_matches_streams(monkeypatch):
+    """With the kernels switched on, ``generate_array`` still matches the list streams."""
+    import copy
+
+    np = pytest.importorskip("numpy")
+    monkeypatch.setattr(asw, "HAS_NUMBA", True)
+
+    for listed in (
+        asw.LorenzAttractor(),
+        asw.RosslerAttractor(),
+        asw.CellularAutomata1D(size=32, rule=110),
+        asw.KuramotoOscillator(n_oscillators=8),
+    ):
+        arrayed = copy.deepcopy(listed)
+        for count in (10, 5):
+            expected = listed.generate_stream(count)
+            np.testing.assert_allclose(arrayed.generate_array(count), expected, rtol=0, atol=1e-12)
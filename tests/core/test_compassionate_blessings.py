@@ -8,7 +8,8 @@ Covers the public API:
 - :class:`BlessingAllocator` — three static allocation strategies
 - :func:`create_target` — convenience factory
 - :class:`BlessingDatabase` — touched lightly with a temp file + a mocked
-  ``init_db`` so the test never touches the global database.
+  ``init_db`` so the test never touches the global database; batched
+  dedications are checked against a throwaway database under ``tmp_path``.
 """
 
 from __future__ import annotations
@@ -458,6 +459,45 @@ def test_blessing_database_get_target_returns_none_for_missing_id():
     assert fake_conn.closed is True
 
 
+@pytest.mark.unit
+def test_record_dedications_batch_matches_per_target_dedications(tmp_path):
+    """The batched write leaves the same rows and counters as record_dedication in a loop."""
+    import sqlite3
+
+    from core.schema import init_db
+
+    totals = []
+    for batched in (False, True):
+        db_path = str(tmp_path / f"batched-{batched}.db")
+        init_db(db_path).close()
+        # The constructor bootstraps the default database; keep it off the real one
+        with patch("core.schema.init_db"):
+            db = BlessingDatabase(db_path=db_path)
+        ids = [f"T-{i}" for i in range(3)]
+        for identifier in ids:
+            db.add_target(_make_target(identifier=identifier, name=identifier))
+        if batched:
+            db.record_dedications_batch(ids, session_id=1, mantra_type="om", mantras_count=108, notes="n")
+        else:
+            for identifier in ids:
+                db.record_dedication(identifier, session_id=1, mantra_type="om", mantras_count=108, notes="n")
+
+        conn = sqlite3.connect(db.db_path)
+        dedications = conn.execute(
+            "SELECT target_identifier, session_id, mantra_type, mantras_count, notes FROM mantra_dedications"
+            " ORDER BY target_identifier"
+        ).fetchall()
+        counters = conn.execute(
+            "SELECT identifier, mantras_dedicated, json_array_length(dedication_sessions_json)"
+            " FROM blessing_targets ORDER BY identifier"
+        ).fetchall()
+        conn.close()
+        totals.append((dedications, counters))
+
+    assert totals[0] == totals[1]
+    assert totals[1][1][0][1:] == (10 + 108, 2)
+
+
 # ---------------------------------------------------------------------------
 # 8. Error handling: invalid enum value in from_dict
 # ---------------------------------------------------------------------------
@@ -18,6 +18,7 @@ from core.energetic_anatomy import (
     Element,
     EnergeticAnatomyDatabase,
     Tradition,
+    YinYang,
     get_chakra_by_name,
     get_meridian_by_element,
 )
@@ -88,6 +89,11 @@ def test_get_chakra_by_name_finds_heart_chakra(db: EnergeticAnatomyDatabase):
     anahata = get_chakra_by_name(db, "anahata")
     assert anahata is heart  # same object
 
+    # Exact id / full English name / mixed case all resolve
+    assert get_chakra_by_name(db, "Heart Chakra") is heart
+    assert get_chakra_by_name(db, "ANAHATA") is heart
+    assert get_chakra_by_name(db, "ajna").id == "ajna"
+
     # Unknown name returns None
     assert get_chakra_by_name(db, "not-a-real-chakra") is None
 
@@ -110,6 +116,34 @@ def test_get_meridian_by_element_filters_correctly(db: EnergeticAnatomyDatabase)
     assert space_meridians == []
 
 
+@pytest.mark.unit
+def test_get_correspondence_resolves_any_tradition_element_id(db: EnergeticAnatomyDatabase):
+    """get_correspondence maps Taoist, Tibetan, and Hindu element ids to one entry."""
+    heart = db.get_correspondence("anahata")
+    assert heart is not None and heart.id == "heart_center"
+    assert db.get_correspondence(heart.tibetan_element.id) is heart
+    assert db.get_correspondence(heart.taoist_element.id) is heart
+
+    assert db.get_correspondence("sushumna").id == "central_channel"
+    assert db.get_correspondence("not-an-element") is None
+
+
+@pytest.mark.unit
+def test_element_lookups_match_a_full_scan(db: EnergeticAnatomyDatabase):
+    """Indexed element lookups return the same objects, in order, as scanning."""
+    for element in Element:
+        expected = [
+            obj
+            for obj in (*db.meridians.values(), *db.chakras.values(), *db.tibetan_chakras.values())
+            if obj.element == element
+        ]
+        assert db.get_element_points(element) == expected
+
+        for yy in (None, *YinYang):
+            scanned = [m for m in db.meridians.values() if m.element == element and (yy is None or m.yin_yang == yy)]
+            assert get_meridian_by_element(db, element, yy) == scanned
+
+
 # ─── Behavior: dataclass contract ──────────────────────────────────────────
 
 
@@ -157,6 +191,25 @@ def test_search_by_keyword_returns_expected_categories(db: EnergeticAnatomyDatab
     assert any("fire" in w.name.lower() for w in fire_winds)
 
 
+@pytest.mark.unit
+def test_search_by_keyword_word_index_and_substring_mode(db: EnergeticAnatomyDatabase):
+    """Whole words come from the index; partial words need substring=True."""
+    hits = db.search_by_keyword("Heart")
+    assert any(c.id == "anahata" for c in hits["chakras"])
+
+    # Index results are fresh lists — mutating them must not corrupt the index
+    hits["chakras"].clear()
+    assert db.search_by_keyword("heart")["chakras"]
+
+    # "plex" is only a fragment of "Plexus"
+    assert db.search_by_keyword("plex")["chakras"] == []
+    partial = db.search_by_keyword("plex", substring=True)
+    assert [c.id for c in partial["chakras"]] == ["manipura"]
+
+    # Multi-word phrases fall back to the substring scan automatically
+    assert [c.id for c in db.search_by_keyword("solar plexus")["chakras"]] == ["manipura"]
+
+
 @pytest.mark.unit
 def test_export_to_json_writes_valid_file(db: EnergeticAnatomyDatabase, tmp_path):
     """export_to_json() writes a parseable JSON file with all three systems."""
@@ -174,3 +227,18 @@ def test_export_to_json_writes_valid_file(db: EnergeticAnatomyDatabase, tmp_path
     # Hindu section includes kundalini
     assert data["hindu"]["kundalini"] is not None
     assert data["hindu"]["kundalini"]["id"] == "kundalini"
+
+
+@pytest.mark.unit
+def test_export_to_json_stdlib_fallback_matches(db: EnergeticAnatomyDatabase, tmp_path, monkeypatch):
+    """Without orjson, export_to_json falls back to stdlib json with identical content."""
+    import core.energetic_anatomy as anatomy
+
+    fast = tmp_path / "fast.json"
+    db.export_to_json(str(fast))
+
+    monkeypatch.setattr(anatomy, "HAS_ORJSON", False)
+    slow = tmp_path / "slow.json"
+    db.export_to_json(str(slow))
+
+    assert json.loads(fast.read_text()) == json.loads(slow.read_text())
@@ -25,6 +25,7 @@ from core.energetic_visualization import (
     CHAKRA_COLORS,
     ELEMENT_COLORS,
     PLANET_COLORS,
+    ROTHKO_LAYOUTS,
     ROTHKO_PALETTES,
     BaseVisualizer,
     ColorField,
@@ -152,6 +153,24 @@ def test_base_visualizer_init_creates_canvas_of_correct_size():
     assert img.mode == "RGB"
 
 
+@pytest.mark.unit
+def test_base_visualizer_draw_is_created_lazily_and_follows_clear():
+    """The ImageDraw context is built on first use and still valid after clear()."""
+    viz = BaseVisualizer(width=16, height=16, background=(0, 0, 0))
+    assert viz._draw is None
+
+    viz.draw.point((1, 1), fill=(255, 0, 0))
+    assert viz.draw is viz.draw
+    assert viz.canvas.getpixel((1, 1)) == (255, 0, 0)
+
+    canvas = viz.canvas
+    viz.clear()
+    assert viz.canvas is canvas  # repainted in place, not reallocated
+    viz.draw.point((2, 2), fill=(0, 255, 0))
+    assert viz.canvas.getpixel((1, 1)) == (0, 0, 0)
+    assert viz.canvas.getpixel((2, 2)) == (0, 255, 0)
+
+
 @pytest.mark.unit
 def test_base_visualizer_save_writes_png(tmp_path: Path):
     """BaseVisualizer.save writes a PNG file to disk and detects the format."""
@@ -166,6 +185,20 @@ def test_base_visualizer_save_writes_png(tmp_path: Path):
         assert img.size == (32, 32)
 
 
+@pytest.mark.unit
+def test_base_visualizer_add_texture_shifts_channels_together_within_bounds():
+    """add_texture nudges each pixel by one shared, bounded offset and clamps."""
+    viz = BaseVisualizer(width=40, height=30, background=(100, 150, 250))
+    viz.add_texture(strength=1.0)
+
+    for x, y in ((0, 0), (13, 7), (39, 29)):
+        r, g, b = viz.canvas.getpixel((x, y))
+        delta = r - 100
+        assert -10 <= delta <= 10
+        assert g - 150 == delta
+        assert b == min(255, 250 + delta)
+
+
 # ---------------------------------------------------------------------------
 # 6. RothkoVisualizer
 # ---------------------------------------------------------------------------
@@ -189,6 +222,20 @@ def test_rothko_visualizer_create_from_palette_known_palette_creates_fields():
         assert isinstance(field, ColorField)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize("layout", list(RothkoLayout))
+def test_rothko_visualizer_every_layout_has_a_table_entry(layout: RothkoLayout):
+    """Each RothkoLayout is driven by ROTHKO_LAYOUTS and places fields on-canvas."""
+    viz = RothkoVisualizer(width=64, height=48)
+    viz.create_from_palette("warm", layout)
+
+    assert len(viz.fields) == len(ROTHKO_LAYOUTS[layout])
+    for field in viz.fields:
+        assert field.color in ROTHKO_PALETTES["warm"]
+        assert 0 <= field.position[0] + field.size[0] <= 1
+        assert 0 <= field.position[1] + field.size[1] <= 1
+
+
 @pytest.mark.unit
 def test_rothko_visualizer_create_chakra_field_unknown_chakra_raises():
     """create_chakra_field raises ValueError for unknown chakra."""
@@ -209,6 +256,73 @@ def test_rothko_visualizer_create_seven_chakras_vertical_and_horizontal():
     assert len(viz_h.fields) == 7
 
 
+@pytest.mark.unit
+def test_rothko_visualizer_render_field_variation_stays_inside_field():
+    """render_field only perturbs pixels inside the field rectangle."""
+    viz = RothkoVisualizer(width=64, height=48, background=(10, 20, 30))
+    field = ColorField(color=(200, 100, 50), position=(0.25, 0.25), size=(0.5, 0.5), edge_blur=0)
+    viz.render_field(field, add_variation=True)
+
+    img = viz.get_image()
+    # Corner pixel is untouched background (blended 0.95 onto itself)
+    assert img.getpixel((0, 0)) == (10, 20, 30)
+    # Field interior is within the ±8 noise band around the blended field color
+    r, g, b = img.getpixel((32, 24))
+    assert abs(r - 190) <= 9 and abs(g - 96) <= 9 and abs(b - 49) <= 9
+
+
+@pytest.mark.unit
+def test_rothko_visualizer_label_font_is_loaded_once():
+    """Chakra labels reuse one cached font handle across renders."""
+    from core.energetic_visualization import _get_font
+
+    _get_font.cache_clear()
+    for name in ("anahata", "ajna"):
+        RothkoVisualizer(width=64, height=48).create_chakra_field(name, include_label=True)
+
+    info = _get_font.cache_info()
+    assert info.misses == 1 and info.hits == 1
+
+
+@pytest.mark.unit
+def test_rothko_visualizer_create_seven_chakras_paints_root_to_crown():
+    """Vertical stripes run crown (top) to root (bottom) across the full width."""
+    viz = RothkoVisualizer(width=32, height=700, background=(30, 30, 35))
+    viz.create_seven_chakras(vertical=True)
+    img = viz.get_image()
+
+    top = img.getpixel((16, 50))
+    bottom = img.getpixel((16, 650))
+    for got, want in ((top, CHAKRA_COLORS["sahasrara"]), (bottom, CHAKRA_COLORS["muladhara"])):
+        assert all(abs(g - w) <= 12 for g, w in zip(got, want))
+
+
+@pytest.mark.unit
+def test_rothko_visualizer_field_color_applies_luminosity_and_clamps():
+    """Luminosity scales each channel and saturates at 255."""
+    viz = RothkoVisualizer(width=8, height=8)
+    assert viz._field_color(ColorField((200, 100, 0), (0, 0), (1, 1), luminosity=1.0)) == (200, 100, 0)
+    assert viz._field_color(ColorField((200, 100, 10), (0, 0), (1, 1), luminosity=1.1)) == (220, 110, 11)
+    assert viz._field_color(ColorField((250, 128, 64), (0, 0), (1, 1), luminosity=0.5)) == (125, 64, 32)
+
+
+@pytest.mark.unit
+def test_rothko_visualizer_reuses_noise_free_field_tiles():
+    """Without variation, identical fields share one cached tile and render identically."""
+    from core.energetic_visualization import _cached_field_tile
+
+    _cached_field_tile.cache_clear()
+    images = []
+    for _ in range(2):
+        viz = RothkoVisualizer(width=64, height=48)
+        viz.create_field((90, 40, 120), (0.2, 0.2), (0.6, 0.6), edge_blur=4)
+        viz.render_all_fields(add_variation=False)
+        images.append(viz.get_image())
+
+    assert _cached_field_tile.cache_info().hits == 1
+    assert images[0].tobytes() == images[1].tobytes()
+
+
 # ---------------------------------------------------------------------------
 # 7. SacredGeometryVisualizer
 # ---------------------------------------------------------------------------
@@ -223,6 +337,47 @@ def test_sacred_geometry_create_flower_of_life_does_not_error():
     assert viz.canvas.size == (128, 128)
 
 
+@pytest.mark.unit
+def test_sacred_geometry_glow_is_a_soft_halo_around_the_outline():
+    """Glow blends a blurred halo of the outline color just outside the crisp circle."""
+    plain = SacredGeometryVisualizer(width=128, height=128, background=(0, 0, 0))
+    plain.create_seed_of_life(radius=20, color=(200, 100, 0), glow=False)
+    glowing = SacredGeometryVisualizer(width=128, height=128, background=(0, 0, 0))
+    glowing.create_seed_of_life(radius=20, color=(200, 100, 0), glow=True)
+
+    # Pending glow is consumed by the pattern
+    assert glowing._glow_masks == {}
+
+    # A few pixels outside the outermost ring: dark without glow, dimly lit with it
+    x, y = 64 + 20 + 20 + 4, 64
+    assert plain.canvas.getpixel((x, y)) == (0, 0, 0)
+    r, g, b = glowing.canvas.getpixel((x, y))
+    assert 0 < r < 200 and g < 100 and b == 0
+
+
+@pytest.mark.unit
+def test_sacred_geometry_direct_glow_is_applied_immediately():
+    """A glowing circle drawn outside a pattern shows its halo right away, e.g. in get_image()."""
+    viz = SacredGeometryVisualizer(width=128, height=128, background=(0, 0, 0))
+    viz.draw_circle_outline((64, 64), 20, color=(0, 200, 0), glow=True)
+
+    assert viz._glow_masks == {}
+    assert viz.get_image().getpixel((64 + 20 + 4, 64))[1] > 0
+
+
+@pytest.mark.unit
+def test_sacred_geometry_glow_is_confined_to_the_outlines():
+    """Glow only touches the tile around its outlines, and off-canvas outlines add none."""
+    viz = SacredGeometryVisualizer(width=256, height=256, background=(0, 0, 0))
+    viz.draw_circle_outline((40, 40), 10, color=(0, 200, 0), glow=True)
+    viz.draw_circle_outline((-500, -500), 10, color=(200, 0, 0), glow=True)
+    viz.apply_glow()
+
+    assert viz.canvas.getpixel((40 + 10 + 3, 40))[1] > 0
+    assert viz.canvas.getpixel((250, 250)) == (0, 0, 0)
+    assert viz.canvas.getchannel("R").getextrema() == (0, 0)
+
+
 @pytest.mark.unit
 def test_sacred_geometry_create_seed_of_life_and_sri_yantra_smoke():
     """Other sacred-geometry helpers render without raising."""
@@ -262,6 +417,23 @@ def test_create_seven_chakras_composition_and_flower_of_life_smoke():
     img2 = create_flower_of_life(width=128, height=128)
     assert isinstance(img2, Image.Image) and img2.size == (128, 128)
 
+    # Each call hands back its own canvas, never a shared one
+    img3 = create_flower_of_life(width=128, height=128)
+    assert img3 is not img2
+    img3.paste((1, 2, 3), (0, 0, 128, 128))
+    assert img2.getpixel((0, 0)) != (1, 2, 3)
+
+
+@pytest.mark.unit
+def test_examples_are_picklable_for_the_process_pool():
+    """The __main__ examples are module-level so ProcessPoolExecutor can ship them."""
+    import pickle
+
+    from core import energetic_visualization
+
+    for example in energetic_visualization._EXAMPLES.values():
+        assert pickle.loads(pickle.dumps(example)) is example
+
 
 # ---------------------------------------------------------------------------
 # 9. Error handling
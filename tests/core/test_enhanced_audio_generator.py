@@ -8,6 +8,7 @@ Covers the public surface:
 - ``generate_chakra_healing`` — returns correct shape, includes Schumann resonance.
 - ``generate_5_channel_blessing`` — returns correct shape, default duration.
 - ``play`` — delegates to sounddevice (mocked) and tolerates failures.
+- :class:`BowlStream` / ``play_stream`` — block-by-block streaming synthesis.
 
 ``numpy``, ``sounddevice``, and ``config.settings.PRAYER_BOWL_CONFIG`` are
 required at import time. We use a tiny ``sample_rate`` (e.g. 1024) to keep
@@ -24,6 +25,7 @@ import numpy as np
 import pytest
 
 from core.enhanced_audio_generator import (
+    BowlStream,
     EnhancedAudioGenerator,
     PrayerBowlGenerator,
 )
@@ -62,16 +64,17 @@ def test_constructor_records_sample_rate():
 
 @pytest.mark.unit
 def test_generate_prayer_bowl_pure_sine_shape_and_range():
-    """``pure_sine=True`` returns a 1-D float array in [-1, 1] of the right length."""
+    """``pure_sine=True`` returns a 1-D float32 array in [-1, 1] of the right length."""
     gen = EnhancedAudioGenerator(sample_rate=44100)
     wave = gen.generate_prayer_bowl_tone(frequency=200, duration=1, pure_sine=True)
 
     assert isinstance(wave, np.ndarray)
     assert wave.ndim == 1
     assert wave.shape == (44100,)
-    assert wave.dtype == np.float64
+    assert wave.dtype == np.float32
     # Bounded
-    assert np.max(np.abs(wave)) <= 1.0 + 1e-9
+    assert np.max(np.abs(wave)) <= 1.0 + 1e-6
+    np.testing.assert_allclose(wave, np.sin(2 * np.pi * 200 * np.arange(44100) / 44100), atol=1e-5)
 
 
 # ---------------------------------------------------------------------------
@@ -91,6 +94,127 @@ def test_generate_prayer_bowl_harmonic_mode_is_bounded_1d():
     assert np.max(np.abs(wave)) <= 0.3 + 1e-9
 
 
+@pytest.mark.unit
+def test_generate_prayer_bowl_envelope_shapes_every_partial():
+    """The ADSR envelope starts from silence and fades the whole tone out at the end."""
+    gen = EnhancedAudioGenerator(sample_rate=1024)
+    wave = gen.generate_prayer_bowl_tone(frequency=220, duration=8, pure_sine=False)
+
+    assert wave[0] == 0
+    # Release tail is far quieter than the sustained middle of the tone
+    assert np.max(np.abs(wave[-64:])) < 0.25 * np.max(np.abs(wave[3000:5000]))
+
+
+@pytest.mark.unit
+def test_phasor_sum_matches_direct_complex_exponentials():
+    """Block-factored phasor sums equal ``sum(a * exp(2j*pi*f*n))`` sample for sample, with no drift."""
+    from core.enhanced_audio_generator import _phasor_sum
+
+    n = np.arange(37 * 64)
+    expected = 0.5 * np.exp(2j * np.pi * 0.1234 * n) + 0.25 * np.exp(2j * np.pi * 0.0071 * n)
+    phasors = _phasor_sum([0.1234, 0.0071], [0.5, 0.25], 37, 64).ravel()
+
+    np.testing.assert_allclose(phasors, expected, atol=1e-6)
+
+
+@pytest.mark.unit
+def test_time_vector_is_shared_and_read_only():
+    """Repeated calls share one read-only float32 time vector per (sample_rate, length)."""
+    from core.enhanced_audio_generator import _time_vector
+
+    t = _time_vector(1024, 2048)
+    assert _time_vector(1024, 2048) is t
+    assert t.dtype == np.float32
+    assert t[1024] == 1.0
+    with pytest.raises(ValueError):
+        t[0] = 1.0
+
+
+@pytest.mark.unit
+def test_time_vector_is_not_cached_above_the_size_limit(monkeypatch):
+    """Vectors longer than SHARED_BUFFER_MAX_SAMPLES are rebuilt per call instead of pinned in the cache."""
+    import core.enhanced_audio_generator as eag
+
+    monkeypatch.setattr(eag, "SHARED_BUFFER_MAX_SAMPLES", 1024)
+    long_t = eag._time_vector(1024, 4096)
+    assert eag._time_vector(1024, 4096) is not long_t
+    assert not long_t.flags.writeable
+    np.testing.assert_array_equal(long_t, eag._build_time_vector(1024, 4096))
+
+
+@pytest.mark.unit
+def test_bowl_partials_are_precomputed_from_the_config():
+    """Partial tables mirror PRAYER_BOWL_CONFIG, harmonics first, and are read-only."""
+    import core.enhanced_audio_generator as mod
+
+    config = mod.PRAYER_BOWL_CONFIG
+    assert mod._BOWL_RATIOS.tolist() == config["harmonic_ratios"] + config["inharmonic_partials"]
+    assert mod._HARM_AMPS.dtype == mod._INH_AMPS.dtype == np.float32
+    np.testing.assert_allclose(mod._HARM_AMPS, 1.0 / np.arange(1, len(config["harmonic_ratios"]) + 1))
+    np.testing.assert_allclose(mod._INH_AMPS, 0.3 / np.arange(1, len(config["inharmonic_partials"]) + 1))
+    with pytest.raises(ValueError):
+        mod._BOWL_AMPS[0] = 0.0
+
+
+@pytest.mark.unit
+def test_adsr_envelope_segments():
+    """The ADSR envelope rises from 0, settles toward sustain, holds, then releases."""
+    from core.enhanced_audio_generator import _adsr_envelope
+
+    env = _adsr_envelope(1000, 100, 50, 0.6, 200)
+    assert env[0] == 0.0
+    assert np.all(np.diff(env[:100]) > 0)  # attack rises
+    assert np.all(np.diff(env[100:150]) < 0) and env[149] > 0.6  # decay falls toward sustain
+    assert np.all(env[150:800] == 1.0)
+    np.testing.assert_allclose(env[800], 0.6)  # release starts at sustain level
+    assert env[-1] < 0.6 * np.exp(-2.9)
+
+
+@pytest.mark.unit
+def test_bowl_amplitude_is_envelope_times_tremolo_and_shared():
+    """The cached amplitude curve is the ADSR envelope times the tremolo LFO."""
+    from core.enhanced_audio_generator import (
+        _adsr_envelope,
+        _adsr_samples,
+        _bowl_amplitude,
+        _time_vector,
+        _tremolo,
+    )
+
+    amplitude = _bowl_amplitude(1024, 8192)
+    assert _bowl_amplitude(1024, 8192) is amplitude
+    assert not amplitude.flags.writeable
+
+    lfo = _tremolo(_time_vector(1024, 8192), np.empty(8192, dtype=np.float32))
+    assert lfo.min() >= 0.85 and lfo.max() <= 1.15
+    np.testing.assert_allclose(amplitude, _adsr_envelope(8192, *_adsr_samples(1024)) * lfo, rtol=1e-6)
+
+
+@pytest.mark.unit
+def test_bowl_amplitude_is_not_cached_above_the_size_limit(monkeypatch):
+    """Amplitude curves longer than SHARED_BUFFER_MAX_SAMPLES are rebuilt per call."""
+    import core.enhanced_audio_generator as eag
+
+    monkeypatch.setattr(eag, "SHARED_BUFFER_MAX_SAMPLES", 1024)
+    amplitude = eag._bowl_amplitude(1024, 8192)
+    assert eag._bowl_amplitude(1024, 8192) is not amplitude
+    assert not amplitude.flags.writeable
+    np.testing.assert_array_equal(amplitude, eag._build_bowl_amplitude(1024, 8192))
+
+
+@pytest.mark.unit
+def test_small_angle_vibrato_matches_exact_mix(monkeypatch):
+    """The small-angle vibrato mix agrees with the exact sin/cos rotation."""
+    import core.enhanced_audio_generator as eag
+
+    gen = EnhancedAudioGenerator(sample_rate=1024)
+    approx = gen.generate_prayer_bowl_tone(frequency=220, duration=8)
+    monkeypatch.setattr(eag, "SMALL_ANGLE", 0.0)
+    exact = gen.generate_prayer_bowl_tone(frequency=220, duration=8)
+
+    np.testing.assert_allclose(approx, exact, atol=1e-4)
+
+
 # ---------------------------------------------------------------------------
 # 5. generate_chakra_healing returns correct shape and includes Schumann
 # ---------------------------------------------------------------------------
@@ -119,6 +243,32 @@ def test_generate_chakra_healing_unknown_chakra_falls_back_to_528():
     assert wave.shape == (1024,)
 
 
+@pytest.mark.unit
+def test_generate_chakra_healing_memoizes_renders_on_disk(tmp_path):
+    """Repeat renders are served from ``cache_dir`` as writable arrays; the cache is off by default."""
+    assert EnhancedAudioGenerator(sample_rate=1024).cache_dir is None
+
+    gen = EnhancedAudioGenerator(sample_rate=1024, cache_dir=tmp_path)
+    first = gen.generate_chakra_healing(chakra="heart", duration=2)
+    assert len(list(tmp_path.glob("*.npy"))) == 1
+    # No partial files are left behind
+    assert [p.suffix for p in tmp_path.iterdir()] == [".npy"]
+
+    again = gen.generate_chakra_healing(chakra="heart", duration=2)
+    assert not isinstance(again, np.memmap)
+    np.testing.assert_array_equal(again, first)
+    # Callers may normalize a cache hit in place, just like a fresh render
+    again *= 0.5
+    np.testing.assert_array_equal(gen.generate_chakra_healing(chakra="heart", duration=2), first)
+
+    # A different chakra is a different cache entry
+    gen.generate_chakra_healing(chakra="root", duration=2)
+    assert len(list(tmp_path.glob("*.npy"))) == 2
+
+    uncached = EnhancedAudioGenerator(sample_rate=1024, cache_dir=None)
+    np.testing.assert_array_equal(uncached.generate_chakra_healing(chakra="heart", duration=2), first)
+
+
 # ---------------------------------------------------------------------------
 # 6. generate_5_channel_blessing returns expected shape
 # ---------------------------------------------------------------------------
@@ -156,6 +306,26 @@ def test_layer_frequencies_pure_sine_shape():
     assert np.max(np.abs(wave)) <= 1.0 + 1e-9
 
 
+@pytest.mark.unit
+def test_layer_frequencies_bowl_matches_single_tone_synthesis():
+    """Fused bowl layering of one frequency is that prayer bowl tone, normalised."""
+    gen = EnhancedAudioGenerator(sample_rate=1024)
+    tone = gen.generate_prayer_bowl_tone(432, duration=3)
+    layered = gen.layer_frequencies([(432, 0.4)], duration=3)
+
+    np.testing.assert_allclose(layered, tone / 0.3, atol=1e-5)
+    assert np.isclose(np.abs(gen.layer_frequencies([(432, 0.4), (528, 0.6)], duration=3)).max(), 1.0)
+
+
+@pytest.mark.unit
+def test_layer_frequencies_silent_input_stays_finite():
+    """All-zero amplitudes normalise to silence instead of dividing by zero."""
+    gen = EnhancedAudioGenerator(sample_rate=1024)
+    wave = gen.layer_frequencies(frequency_list=[(528, 0.0)], duration=1, pure_sine=True)
+
+    assert np.all(wave == 0)
+
+
 # ---------------------------------------------------------------------------
 # 8. play() delegates to sounddevice and waits
 # ---------------------------------------------------------------------------
@@ -192,3 +362,57 @@ def test_play_loop_passes_loop_true():
     # sd.play was called with loop=True somewhere in its args
     args, kwargs = mock_sd.play.call_args
     assert kwargs.get("loop") is True or (len(args) >= 3 and args[2] is True)
+
+
+# ---------------------------------------------------------------------------
+# 9. Streaming synthesis
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_bowl_stream_blocks_match_the_rendered_tone():
+    """Streamed blocks reproduce the rendered tone up to its normalisation, then pad with silence."""
+    gen = EnhancedAudioGenerator(sample_rate=1024, cache_dir=None)
+    rendered = gen.generate_prayer_bowl_tone(frequency=220, duration=8)
+
+    stream = BowlStream(220, sample_rate=1024, duration=8)
+    blocks = []
+    while not stream.finished:
+        blocks.append(stream.read(300))  # deliberately not a divisor of the length
+    streamed = np.concatenate(blocks)
+
+    assert streamed.dtype == np.float32
+    assert np.all(streamed[len(rendered) :] == 0)
+    streamed = streamed[: len(rendered)]
+    assert np.max(np.abs(streamed)) <= 0.3
+    np.testing.assert_allclose(streamed * (0.3 / np.max(np.abs(streamed))), rendered, atol=1e-5)
+
+
+@pytest.mark.unit
+def test_play_stream_feeds_an_output_stream_until_the_tone_ends():
+    """``play_stream`` drives ``sd.OutputStream`` with a BowlStream callback that stops at the end."""
+    import core.enhanced_audio_generator as eag
+
+    class CallbackStop(Exception):
+        pass
+
+    mock_sd = MagicMock(name="sounddevice")
+    mock_sd.CallbackStop = CallbackStop
+    outdata = np.empty((eag.STREAM_BLOCK, 1), dtype=np.float32)
+
+    def output_stream(**kwargs):
+        # Pull blocks like the audio thread would, then report completion
+        with pytest.raises(CallbackStop):
+            for _ in range(10):
+                kwargs["callback"](outdata, eag.STREAM_BLOCK, None, None)
+        kwargs["finished_callback"]()
+        return MagicMock()
+
+    mock_sd.OutputStream.side_effect = output_stream
+    with patch.object(eag, "sd", mock_sd):
+        EnhancedAudioGenerator(sample_rate=1024).play_stream(220, duration=3)
+
+    kwargs = mock_sd.OutputStream.call_args.kwargs
+    assert isinstance(kwargs["callback"], BowlStream)
+    assert kwargs["callback"].finished
+    assert kwargs["channels"] == 1 and kwargs["dtype"] == "float32"
@@ -7,12 +7,43 @@ Covers:
   ``speak`` and ``generate_audio_file`` return ``False`` and set ``error_msg``
 * :class:`EnhancedTTSEngine` — initialises all providers, selects an
   available one, and raises ``RuntimeError`` when none are available
+* Provider setup — concurrent, registered in priority order, with
+  thread-bound providers built on the caller's thread
 * :meth:`EnhancedTTSEngine.set_provider` — returns ``False`` for unknown
   providers and for unavailable providers
 * :meth:`EnhancedTTSEngine.list_available_providers` — returns the expected
   dict shape (``name``, ``available``, ``error``)
 * :meth:`EnhancedTTSEngine.speak_slowly` — stops early and returns ``False``
   if the active provider's ``speak`` returns ``False`` on the first sentence
+  and, for file-playing providers, synthesizes the next sentence while the
+  current one plays; sentences come from pysbd when installed, else from a
+  punctuation-and-capital regex that keeps numbers whole
+* Speech cache — repeated text reaches the provider once and is decoded
+  once; the on-disk LRU (``_TTSCache``) evicts past its byte budget and
+  survives restarts
+* :meth:`EnhancedTTSEngine.speak_mantra` — synthesizes the mantra once for
+  any file-writing provider and replays it on one audio stream
+* :class:`AzureTTS` — synthesizers are reused per voice and output,
+  ``speak_stream`` plays audio chunks as they arrive, and a mantra is one
+  synthesis request
+* :class:`CoquiTTS` — the model loads lazily and is shared; concurrent
+  requests are batched and each distinct text is synthesized once; on CUDA
+  the networks are compiled and run under autocast
+* Convenience functions reuse one engine per ``prefer_local`` setting,
+  even when first called from several threads at once
+* :meth:`EnhancedTTSEngine.speak` — falls back down the priority list,
+  benches repeatedly failing providers, and tries slow ones last
+* Warm-up — selecting a remote provider opens its connection in the
+  background; local providers are left alone
+* Playback — the pygame mixer is initialised once and shared; without it
+  files play in-process, and the system player never goes through a shell;
+  cloud providers play synthesized audio from memory, and
+  ``generate_bytes`` falls back to a temporary file for file-only providers
+* :class:`PiperTTS` — ``speak_stream`` pipes raw PCM straight to the device
+* :class:`OpenAITTS` — ``speak_stream`` requests raw PCM and plays each
+  chunk as it arrives
+* :class:`ElevenLabsTTS` — ``speak_stream_async`` sends text as it is
+  produced and yields audio before the input ends
 
 Heavy dependencies (elevenlabs, azure-cognitiveservices-speech, google.cloud,
 openai, TTS, pyttsx3, pygame, edge-tts) are mocked so the tests never
@@ -21,6 +52,14 @@ require real cloud credentials or audio hardware.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -313,3 +352,1066 @@ def test_speak_slowly_returns_false_when_first_sentence_fails(monkeypatch):
     result = engine.speak_slowly("First. Second.", pause_duration=0.0)
     assert result is False
     assert failing.speak.call_count == 1
+
+
+@pytest.mark.unit
+def test_speak_slowly_splits_on_runs_of_sentence_punctuation(monkeypatch):
+    """Ellipses and mixed ``?!`` end one sentence each; numbers stay whole; blank fragments are skipped."""
+    monkeypatch.setattr(etts, "_sentence_segmenter", lambda: None)
+    provider = etts.TTSProvider("OpenAI TTS")
+    provider.speak = MagicMock(return_value=True)  # type: ignore[method-assign]
+
+    engine = etts.EnhancedTTSEngine.__new__(etts.EnhancedTTSEngine)
+    engine.providers = {provider.name: provider}
+    engine.active_provider = provider
+
+    text = 'Peace... Joy?! Love. Chant it 3.5 times. "Om mani." (Hum.) '
+    assert engine.speak_slowly(text, pause_duration=0.0) is True
+    assert [call.args[0] for call in provider.speak.call_args_list] == [
+        "Peace...",
+        "Joy?!",
+        "Love.",
+        "Chant it 3.5 times.",
+        '"Om mani."',
+        "(Hum.)",
+    ]
+
+
+@pytest.mark.unit
+def test_sentences_come_from_pysbd_when_installed(monkeypatch):
+    """With pysbd available its segmenter is built once and its segments are used, stripped."""
+    pysbd = MagicMock()
+    pysbd.Segmenter.return_value.segment.return_value = ["Dr. Tenzin teaches. ", "  ", "Om."]
+    monkeypatch.setitem(sys.modules, "pysbd", pysbd)
+    etts._sentence_segmenter.cache_clear()
+    try:
+        assert etts._split_sentences("Dr. Tenzin teaches. Om.") == ["Dr. Tenzin teaches.", "Om."]
+        etts._split_sentences("Hum.")
+    finally:
+        etts._sentence_segmenter.cache_clear()
+
+    pysbd.Segmenter.assert_called_once_with(language="en", clean=False)
+
+
+# ---------------------------------------------------------------------------
+# 8. Speech cache — repeated text is synthesized once
+# ---------------------------------------------------------------------------
+
+
+class _FileProvider(etts.TTSProvider):
+    """Provider that writes the text as bytes and records what it synthesizes and plays."""
+
+    def __init__(self):
+        super().__init__("Fake File TTS")
+        self.available = True
+        self.generated: list[str] = []
+        self.played: list[bytes] = []
+
+    def generate_audio_file(self, text: str, output_path: str, **kwargs) -> bool:
+        self.generated.append(text)
+        with open(output_path, "wb") as f:
+            f.write(f"{text}|{sorted(kwargs.items())}".encode())
+        return True
+
+    def _play_audio_file(self, path: str):
+        with open(path, "rb") as f:
+            self.played.append(f.read())
+
+
+def _engine_with(provider: etts.TTSProvider, cache_dir, cache_bytes: int = etts.TTS_CACHE_BYTES):
+    engine = etts.EnhancedTTSEngine.__new__(etts.EnhancedTTSEngine)
+    engine.prefer_local = False
+    engine.providers = {provider.name: provider}
+    engine.active_provider = provider
+    engine.cache = etts._TTSCache(cache_dir, cache_bytes) if cache_dir is not None else None
+    engine._pcm_clips = OrderedDict()
+    engine._pcm_lock = threading.Lock()
+    return engine
+
+
+@pytest.mark.unit
+def test_speak_mantra_synthesizes_the_mantra_once(tmp_path):
+    """Every repetition is played, but only the first one reaches the provider."""
+    provider = _FileProvider()
+    engine = _engine_with(provider, tmp_path)
+
+    assert engine.speak_mantra("Om Mani Padme Hum", repetitions=5, pause_duration=0.0) is True
+    assert provider.generated == ["Om Mani Padme Hum"]
+    assert len(provider.played) == 5 and len(set(provider.played)) == 1
+
+
+@pytest.mark.unit
+def test_speak_mantra_decodes_the_cached_clip_once(tmp_path, monkeypatch):
+    """Repeated playback of a cached clip reuses its decoded PCM."""
+    decode = MagicMock(return_value=(b"\x00\x00" * 4, 24000, 1))
+    play = MagicMock(return_value=True)
+    monkeypatch.setattr(etts, "_decode_pcm", decode)
+    monkeypatch.setattr(etts, "_play_pcm", play)
+    provider = _FileProvider()
+    engine = _engine_with(provider, tmp_path)
+
+    assert engine.speak_mantra("Om", repetitions=4, pause_duration=0.5) is True
+    assert engine.speak("Om") is True
+    assert decode.call_count == 1
+    assert play.call_args_list[0].args == decode.return_value
+    assert play.call_args_list[0].kwargs == {"repetitions": 4, "gap": 0.5}
+    assert provider.played == []  # nothing fell back to file playback
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cached", [True, False])
+def test_speak_mantra_synthesizes_once_for_streaming_providers(tmp_path, monkeypatch, cached):
+    """Streaming providers skip the cache in ``speak``, but a mantra is still synthesized once."""
+
+    class StreamingFileProvider(etts.StreamingTTSProvider, _FileProvider):
+        pass
+
+    provider = StreamingFileProvider()
+    provider.speak_stream = MagicMock(return_value=True)  # type: ignore[method-assign]
+    engine = _engine_with(provider, tmp_path if cached else None)
+
+    assert engine.speak_mantra("Hum", repetitions=3, pause_duration=0.0) is True
+    provider.speak_stream.assert_not_called()
+    assert provider.generated == ["Hum"]
+    assert len(provider.played) == 3
+    if not cached:
+        assert list(tmp_path.iterdir()) == []  # the temporary clip is removed
+
+
+@pytest.mark.unit
+def test_speak_plays_a_cached_clip_instead_of_streaming(tmp_path):
+    """A streaming provider streams only on a cache miss; a clip already on disk is played from there."""
+
+    class StreamingFileProvider(etts.StreamingTTSProvider, _FileProvider):
+        pass
+
+    provider = StreamingFileProvider()
+    provider.speak_stream = MagicMock(return_value=True)  # type: ignore[method-assign]
+    engine = _engine_with(provider, tmp_path)
+    assert engine.generate_audio_file("Om", str(tmp_path / "om.mp3"), voice="onyx") is True
+
+    assert engine.speak("Om", voice="onyx") is True
+    provider.speak_stream.assert_not_called()
+    assert provider.generated == ["Om"] and len(provider.played) == 1
+
+    assert engine.speak("Om", voice="nova") is True
+    provider.speak_stream.assert_called_once_with("Om", voice="nova")
+
+
+@pytest.mark.unit
+def test_play_pcm_repeats_on_one_stream_with_silent_gaps():
+    """All repetitions go to one device stream, separated by the pause as silence."""
+    sounddevice = MagicMock()
+    output = sounddevice.RawOutputStream.return_value.__enter__.return_value
+
+    with patch.dict("sys.modules", {"sounddevice": sounddevice}):
+        assert etts._play_pcm(b"\x01\x00" * 3, 1000, 2, repetitions=3, gap=0.01) is True
+
+    sounddevice.RawOutputStream.assert_called_once_with(samplerate=1000, channels=2, dtype="int16")
+    silence = bytes(10 * 2 * 2)
+    pcm = b"\x01\x00" * 3
+    assert [call.args[0] for call in output.write.call_args_list] == [pcm, silence, pcm, silence, pcm]
+
+
+@pytest.mark.unit
+def test_generate_audio_file_copies_cache_hits_per_settings(tmp_path):
+    """Cache hits are copied to ``output_path``; different settings are cached apart."""
+    provider = _FileProvider()
+    engine = _engine_with(provider, tmp_path / "cache")
+
+    first, second = tmp_path / "a.mp3", tmp_path / "b.mp3"
+    assert engine.generate_audio_file("peace", str(first), voice="nova")
+    assert engine.generate_audio_file("peace", str(second), voice="nova")
+    assert provider.generated == ["peace"]
+    assert first.read_bytes() == second.read_bytes()
+
+    assert engine.generate_audio_file("peace", str(tmp_path / "c.mp3"), voice="onyx")
+    assert provider.generated == ["peace", "peace"]
+
+
+@pytest.mark.unit
+def test_speech_cache_evicts_least_recently_used_and_survives_restart(tmp_path):
+    """Past the byte budget the least recently used clip goes; order persists on disk."""
+    cache = etts._TTSCache(tmp_path, max_bytes=10)
+
+    def writer(data: bytes):
+        def write(path: str) -> bool:
+            with open(path, "wb") as f:
+                f.write(data)
+            return True
+
+        return write
+
+    cache.put("a.wav", writer(b"aaaa"))
+    cache.put("b.wav", writer(b"bbbb"))
+    assert cache.get("a.wav") is not None  # a is now the most recently used
+    cache.put("c.wav", writer(b"cccc"))
+
+    assert cache.get("b.wav") is None and not (tmp_path / "b.wav").exists()
+    assert cache.total_bytes == 8
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.wav", "c.wav"]
+
+    # A failed synthesis caches nothing and leaves no partial file behind
+    assert cache.put("d.wav", lambda path: False) is None
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.wav", "c.wav"]
+
+    reopened = etts._TTSCache(tmp_path, max_bytes=10)
+    assert reopened.total_bytes == 8 and set(reopened.entries) == {"a.wav", "c.wav"}
+
+
+@pytest.mark.unit
+def test_speech_cache_writers_of_the_same_text_get_their_own_partial_files(tmp_path):
+    """Two threads caching one name write separate partial files, and both end up with the clip."""
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+    from pathlib import Path
+
+    cache = etts._TTSCache(tmp_path)
+    both_writing = threading.Barrier(2)
+    partials = []
+
+    def write(path: str) -> bool:
+        partials.append(path)
+        both_writing.wait(timeout=5)
+        with open(path, "wb") as f:
+            f.write(b"om")
+        return True
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        paths = list(pool.map(lambda _: cache.put("om.wav", write), range(2)))
+
+    assert len(set(partials)) == 2
+    assert all(Path(p).name.startswith(".") and p.endswith("om.wav") for p in partials)
+    assert paths == [tmp_path / "om.wav"] * 2
+    assert [p.name for p in tmp_path.iterdir()] == ["om.wav"]
+
+
+@pytest.mark.unit
+def test_speech_cache_index_stays_consistent_under_concurrent_use(tmp_path):
+    """Threads reading, writing and evicting at once keep the byte count equal to the index."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Switch threads as often as possible to interleave the index updates
+    switch_interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    cache = etts._TTSCache(tmp_path, max_bytes=40)
+
+    def write(path: str) -> bool:
+        with open(path, "wb") as f:
+            f.write(b"mantra")
+        return True
+
+    def churn(worker: int):
+        for i in range(200):
+            name = f"{(worker + i) % 12}.wav"
+            if cache.get(name) is None:
+                cache.put(name, write)
+
+    try:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(churn, range(4)))
+    finally:
+        sys.setswitchinterval(switch_interval)
+
+    assert cache.total_bytes == sum(cache.entries.values()) <= 40
+    assert set(cache.entries) == {p.name for p in tmp_path.iterdir()}
+
+
+@pytest.mark.unit
+def test_speech_cache_disabled_calls_provider_every_time():
+    """With ``cache_dir=None`` the engine delegates straight to the provider."""
+    provider = _FileProvider()
+    provider.speak = MagicMock(return_value=True)  # type: ignore[method-assign]
+    engine = _engine_with(provider, None)
+
+    for _ in range(3):
+        assert engine.speak("Om") is True
+    assert provider.speak.call_count == 3
+
+
+# ---------------------------------------------------------------------------
+# 9. AzureTTS — synthesizers are reused across calls
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_azure_reuses_one_synthesizer_per_voice_and_output(tmp_path):
+    """Repeated calls share a synthesizer; file output is written from the in-memory result."""
+    sdk = MagicMock()
+    result = sdk.SpeechSynthesizer.return_value.speak_text_async.return_value.get.return_value
+    result.reason = sdk.ResultReason.SynthesizingAudioCompleted
+    result.audio_data = b"RIFF-audio"
+
+    azure = etts.AzureTTS.__new__(etts.AzureTTS)
+    etts.TTSProvider.__init__(azure, "Azure TTS")
+    azure.speechsdk = sdk
+    azure.speech_config = MagicMock()
+    azure._synthesizers = {}
+
+    for i in range(3):
+        assert azure.generate_audio_file("peace", str(tmp_path / f"{i}.wav"))
+        assert azure.speak("peace")
+    assert sdk.SpeechSynthesizer.call_count == 2  # one in-memory, one to the speaker
+    assert (tmp_path / "2.wav").read_bytes() == b"RIFF-audio"
+
+    assert azure.speak("peace", voice="en-US-GuyNeural")
+    assert sdk.SpeechSynthesizer.call_count == 3
+    assert azure.speech_config.speech_synthesis_voice_name == "en-US-GuyNeural"
+
+
+@pytest.mark.unit
+def test_azure_mantra_is_one_synthesis_round_trip(tmp_path, monkeypatch):
+    """Every repetition of a mantra replays the one in-memory Azure synthesis."""
+    sdk = MagicMock()
+    result = sdk.SpeechSynthesizer.return_value.speak_text_async.return_value.get.return_value
+    result.reason = sdk.ResultReason.SynthesizingAudioCompleted
+    result.audio_data = b"RIFF-audio"
+    play = MagicMock(return_value=True)
+    monkeypatch.setattr(etts, "_decode_pcm", MagicMock(return_value=(b"\x00\x00", 24000, 1)))
+    monkeypatch.setattr(etts, "_play_pcm", play)
+
+    azure = etts.AzureTTS.__new__(etts.AzureTTS)
+    etts.TTSProvider.__init__(azure, "Azure TTS")
+    azure.speechsdk = sdk
+    azure.speech_config = MagicMock()
+    azure._synthesizers = {}
+    azure.speak_stream = MagicMock()  # type: ignore[method-assign]
+    engine = _engine_with(azure, tmp_path)
+
+    assert engine.speak_mantra("Om Ah Hum", repetitions=108, pause_duration=2.0) is True
+    sdk.SpeechSynthesizer.return_value.speak_text_async.assert_called_once_with("Om Ah Hum")
+    azure.speak_stream.assert_not_called()
+    assert play.call_args.kwargs == {"repetitions": 108, "gap": 2.0}
+
+
+@pytest.mark.unit
+def test_azure_speak_stream_plays_chunks_as_they_arrive():
+    """speak_stream copies each filled chunk to a raw output stream until the data runs out."""
+    sdk = MagicMock()
+    stream = sdk.AudioDataStream.return_value
+    stream.read_data.side_effect = [4, 2, 0]
+    stream.status = "done"
+
+    azure = etts.AzureTTS.__new__(etts.AzureTTS)
+    etts.TTSProvider.__init__(azure, "Azure TTS")
+    azure.speechsdk = sdk
+    azure.speech_config = MagicMock()
+    azure.api_key, azure.region = "key", "eastus"
+    azure._synthesizers = {}
+
+    sounddevice = MagicMock()
+    output = sounddevice.RawOutputStream.return_value.__enter__.return_value
+    engine = _engine_with(azure, None)
+    with patch.dict("sys.modules", {"sounddevice": sounddevice}):
+        assert engine.speak("peace") is True
+
+    sdk.SpeechSynthesizer.return_value.start_speaking_text_async.assert_called_once_with("peace")
+    sounddevice.RawOutputStream.assert_called_once_with(samplerate=etts.AZURE_STREAM_RATE, channels=1, dtype="int16")
+    assert [len(call.args[0]) for call in output.write.call_args_list] == [4, 2]
+    # The stream synthesizer has its own raw PCM config, leaving file output untouched
+    azure.speech_config.set_speech_synthesis_output_format.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# 10. speak_slowly — synthesis of the next sentence overlaps playback
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cached", [True, False])
+def test_speak_slowly_synthesizes_next_sentence_during_playback(tmp_path, cached):
+    """While a sentence plays, the next one is already being synthesized; temp files are removed."""
+    import threading
+
+    provider = _FileProvider()
+    second_started = threading.Event()
+    generate = provider.generate_audio_file
+    played_paths: list[str] = []
+
+    def generate_audio_file(text: str, output_path: str, **kwargs) -> bool:
+        if text == "Second!":
+            second_started.set()
+        return generate(text, output_path, **kwargs)
+
+    def play(path: str):
+        played_paths.append(path)
+        if len(played_paths) == 1:
+            # Only returns promptly if the producer runs ahead of playback
+            assert second_started.wait(timeout=5)
+        _FileProvider._play_audio_file(provider, path)
+
+    provider.generate_audio_file = generate_audio_file  # type: ignore[method-assign]
+    provider._play_audio_file = play  # type: ignore[method-assign]
+    engine = _engine_with(provider, tmp_path / "cache" if cached else None)
+
+    assert engine.speak_slowly("First. Second! Third?", pause_duration=0.0) is True
+    assert provider.generated == ["First.", "Second!", "Third?"]
+    assert [clip.split(b"|")[0] for clip in provider.played] == [b"First.", b"Second!", b"Third?"]
+    if not cached:
+        assert not any(os.path.exists(path) for path in played_paths)
+
+
+@pytest.mark.unit
+def test_speak_slowly_pipeline_stops_at_the_first_failed_sentence(tmp_path):
+    """A synthesis failure ends playback after the sentences before it."""
+    provider = _FileProvider()
+    generate = provider.generate_audio_file
+    provider.generate_audio_file = lambda text, path, **kw: text != "Two." and generate(text, path, **kw)  # type: ignore[method-assign]
+    engine = _engine_with(provider, tmp_path)
+
+    assert engine.speak_slowly("One. Two. Three.", pause_duration=0.0) is False
+    assert [clip.split(b"|")[0] for clip in provider.played] == [b"One."]
+    assert "Three." not in provider.generated
+
+
+# ---------------------------------------------------------------------------
+# 11. CoquiTTS — concurrent requests share one model run per distinct text
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_coqui_batches_concurrent_requests_by_text(tmp_path, monkeypatch):
+    """Requests in one batch window run the model once per distinct text."""
+    import threading
+
+    monkeypatch.setattr(etts, "COQUI_BATCH_WINDOW", 0.5)
+
+    def tts_to_file(text: str, file_path: str):
+        with open(file_path, "w") as f:
+            f.write(text)
+
+    with patch.object(etts.CoquiTTS, "check_availability", return_value=True):
+        coqui = etts.CoquiTTS()
+    coqui.tts = MagicMock()
+    coqui.tts.tts_to_file.side_effect = tts_to_file
+
+    texts = ["Om", "Om", "Hum", "Om"]
+    results: dict[int, bool] = {}
+
+    def request(i: int):
+        results[i] = coqui.generate_audio_file(texts[i], str(tmp_path / f"{i}.wav"))
+
+    threads = [threading.Thread(target=request, args=(i,)) for i in range(len(texts))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == dict.fromkeys(range(len(texts)), True)
+    assert sorted(call.kwargs["text"] for call in coqui.tts.tts_to_file.call_args_list) == ["Hum", "Om"]
+    assert [(tmp_path / f"{i}.wav").read_text() for i in range(len(texts))] == texts
+
+
+@pytest.mark.unit
+def test_coqui_failed_copy_only_fails_its_own_request(tmp_path, monkeypatch):
+    """One unwritable duplicate path fails that request alone; the synthesized file still counts."""
+    import threading
+
+    monkeypatch.setattr(etts, "COQUI_BATCH_WINDOW", 0.5)
+
+    def tts_to_file(text: str, file_path: str):
+        with open(file_path, "w") as f:
+            f.write(text)
+
+    with patch.object(etts.CoquiTTS, "check_availability", return_value=True):
+        first, broken, other = etts.CoquiTTS(), etts.CoquiTTS(), etts.CoquiTTS()
+    first.tts = broken.tts = other.tts = MagicMock()
+    first.tts.tts_to_file.side_effect = tts_to_file
+
+    paths = [tmp_path / "first.wav", tmp_path / "missing" / "broken.wav", tmp_path / "other.wav"]
+    results: dict[int, bool] = {}
+
+    def request(i: int, provider: etts.CoquiTTS):
+        results[i] = provider.generate_audio_file("Om", str(paths[i]))
+
+    threads = [threading.Thread(target=request, args=(0, first))]
+    threads[0].start()
+    # The first request in the batch window is the one synthesized; the others are copies
+    time.sleep(0.05)
+    threads += [threading.Thread(target=request, args=(i, p)) for i, p in ((1, broken), (2, other))]
+    for thread in threads[1:]:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert first.tts.tts_to_file.call_count == 1
+    assert results == {0: True, 1: False, 2: True}
+    assert "broken.wav" in broken.error_msg and not first.error_msg and not other.error_msg
+    assert paths[0].read_text() == paths[2].read_text() == "Om"
+
+
+@pytest.mark.unit
+def test_coqui_instances_share_one_worker_and_concurrent_speak_through_the_cache(tmp_path, monkeypatch):
+    """Engines with separate Coqui instances feed one worker; the same prayer twice is one model run."""
+    import threading
+
+    monkeypatch.setattr(etts, "COQUI_BATCH_WINDOW", 0.5)
+    monkeypatch.setattr(etts, "_decode_pcm", MagicMock(return_value=(b"\x00\x00", 24000, 1)))
+    monkeypatch.setattr(etts, "_play_pcm", MagicMock(return_value=True))
+
+    def tts_to_file(text: str, file_path: str):
+        with open(file_path, "w") as f:
+            f.write(text)
+
+    with patch.object(etts.CoquiTTS, "check_availability", return_value=True):
+        local, remote = etts.CoquiTTS(), etts.CoquiTTS()
+    local.tts = remote.tts = MagicMock()
+    local.tts.tts_to_file.side_effect = tts_to_file
+    assert local._requests is remote._requests
+
+    engines = [_engine_with(local, tmp_path / "local"), _engine_with(remote, tmp_path / "remote")]
+    calls = [
+        lambda: engines[0].speak("Om"),
+        lambda: engines[0].speak("Om"),
+        lambda: engines[1].speak("Om"),
+        # Two callers naming the same output file
+        lambda: remote.generate_audio_file("Om", str(tmp_path / "same.wav")),
+        lambda: remote.generate_audio_file("Om", str(tmp_path / "same.wav")),
+    ]
+    results: dict[int, bool] = {}
+
+    def run(i: int):
+        results[i] = calls[i]()
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(calls))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert results == dict.fromkeys(range(len(calls)), True)
+    assert local.tts.tts_to_file.call_count == 1
+    assert (tmp_path / "same.wav").read_text() == "Om"
+
+
+@pytest.mark.unit
+def test_coqui_loads_one_shared_model_on_first_use(monkeypatch):
+    """Availability only imports Coqui; the model loads once, on first synthesis, for all instances."""
+    api = MagicMock()
+    monkeypatch.setitem(sys.modules, "TTS", MagicMock())
+    monkeypatch.setitem(sys.modules, "TTS.api", MagicMock(TTS=api))
+    monkeypatch.setattr(etts.CoquiTTS, "_model", None)
+
+    first, second = etts.CoquiTTS(), etts.CoquiTTS()
+    assert first.available and second.available
+    api.assert_not_called()
+
+    assert first._ensure_loaded() is second._ensure_loaded() is api.return_value
+    api.assert_called_once_with(etts.CoquiTTS.MODEL_NAME)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("cuda", [True, False])
+def test_coqui_compiles_and_autocasts_only_on_cuda(monkeypatch, cuda):
+    """On CUDA both networks are compiled and synthesis runs under autocast; on CPU nothing changes."""
+    torch = MagicMock()
+    torch.cuda.is_available.return_value = cuda
+    monkeypatch.setitem(sys.modules, "torch", torch)
+    monkeypatch.setattr(etts.CoquiTTS, "_on_cuda", False)
+    tts = MagicMock()
+    tts_model, vocoder_model = tts.synthesizer.tts_model, tts.synthesizer.vocoder_model
+
+    assert etts.CoquiTTS._accelerate(tts) is tts
+    with etts.CoquiTTS._inference_context():
+        pass
+
+    if cuda:
+        tts.to.assert_called_once_with("cuda")
+        assert [call.args[0] for call in torch.compile.call_args_list] == [tts_model, vocoder_model]
+        assert tts.synthesizer.tts_model is torch.compile.return_value
+        torch.autocast.assert_called_once_with("cuda", dtype=torch.float16)
+        torch.inference_mode.assert_called_once_with()
+    else:
+        tts.to.assert_not_called()
+        torch.compile.assert_not_called()
+        torch.autocast.assert_not_called()
+
+
+@pytest.mark.unit
+def test_convenience_functions_share_one_engine(monkeypatch):
+    """speak / speak_prayer / speak_mantra build the engine once per prefer_local setting."""
+    engine_cls = MagicMock()
+    monkeypatch.setattr(etts, "EnhancedTTSEngine", engine_cls)
+    monkeypatch.setattr(etts, "_engines", {})
+
+    etts.speak("Om")
+    etts.speak_prayer("May all beings be happy.")
+    etts.speak_mantra("Om", repetitions=2)
+    assert engine_cls.call_count == 1
+
+    etts.speak("Om", prefer_local=True)
+    assert engine_cls.call_count == 2
+
+
+@pytest.mark.unit
+def test_concurrent_first_calls_build_one_engine(monkeypatch):
+    """Threads racing on the first convenience call still share a single engine."""
+    import threading
+
+    started = threading.Event()
+
+    def slow_engine(prefer_local: bool):
+        started.set()
+        time.sleep(0.05)  # the other callers arrive while this one is being set up
+        return MagicMock()
+
+    engine_cls = MagicMock(side_effect=slow_engine)
+    monkeypatch.setattr(etts, "EnhancedTTSEngine", engine_cls)
+    monkeypatch.setattr(etts, "_engines", {})
+
+    threads = [threading.Thread(target=etts.speak, args=("Om",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=5)
+
+    assert started.is_set() and engine_cls.call_count == 1
+
+
+# ---------------------------------------------------------------------------
+# 12. Playback — the pygame mixer is opened once per process
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_play_audio_file_opens_the_mixer_once(monkeypatch):
+    """Every file-playing provider shares one mixer, initialised on first playback."""
+    pygame = MagicMock()
+    pygame.mixer.music.get_busy.return_value = False
+    monkeypatch.setitem(sys.modules, "pygame", pygame)
+    monkeypatch.setattr(etts, "_mixer_ready", False)
+
+    for provider_cls in (etts.OpenAITTS, etts.CoquiTTS, etts.PiperTTS):
+        provider = provider_cls.__new__(provider_cls)
+        provider._play_audio_file("/tmp/clip.wav")
+
+    pygame.mixer.init.assert_called_once_with(frequency=etts.MIXER_FREQUENCY, channels=1, buffer=etts.MIXER_BUFFER)
+    assert pygame.mixer.music.play.call_count == 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("decodable", [True, False])
+def test_play_audio_file_without_pygame_stays_in_process(monkeypatch, decodable):
+    """Without pygame the clip is decoded and played in-process; the system player runs without a shell."""
+    monkeypatch.setitem(sys.modules, "pygame", None)
+    clip = (b"\x00\x00", 22050, 1) if decodable else None
+    monkeypatch.setattr(etts, "_decode_pcm", MagicMock(return_value=clip))
+    monkeypatch.setattr(etts, "_play_pcm", MagicMock(return_value=True))
+    monkeypatch.setattr(etts.subprocess, "run", MagicMock())
+    monkeypatch.setattr(etts.os, "system", MagicMock(side_effect=AssertionError("shell used")))
+
+    etts._play_audio_file("/tmp/om chant; rm -rf ~.wav")
+
+    if decodable:
+        etts._play_pcm.assert_called_once_with(*clip)
+        etts.subprocess.run.assert_not_called()
+    else:
+        assert etts.subprocess.run.call_args.args[0][1] == "/tmp/om chant; rm -rf ~.wav"
+
+
+@pytest.mark.unit
+def test_openai_speak_plays_from_memory(monkeypatch):
+    """``speak`` hands the synthesized MP3 bytes to the mixer without writing a file."""
+    pygame = MagicMock()
+    pygame.mixer.music.get_busy.return_value = False
+    monkeypatch.setitem(sys.modules, "pygame", pygame)
+    monkeypatch.setattr(etts, "_mixer_ready", False)
+    monkeypatch.setattr(etts.tempfile, "NamedTemporaryFile", MagicMock(side_effect=AssertionError("file used")))
+    monkeypatch.setattr(etts.tempfile, "TemporaryDirectory", MagicMock(side_effect=AssertionError("file used")))
+
+    openai = etts.OpenAITTS.__new__(etts.OpenAITTS)
+    etts.TTSProvider.__init__(openai, "OpenAI TTS")
+    openai.client = MagicMock()
+    openai.client.audio.speech.create.return_value.content = b"ID3 mp3"
+
+    assert openai.speak("Om", voice="alloy") is True
+    openai.client.audio.speech.create.assert_called_once_with(model="tts-1", voice="alloy", input="Om")
+    buffer, hint = pygame.mixer.music.load.call_args.args
+    assert buffer.getvalue() == b"ID3 mp3" and hint == "mp3"
+
+
+@pytest.mark.unit
+def test_generate_bytes_defaults_to_a_temporary_file(tmp_path, monkeypatch):
+    """Providers without an in-memory API still produce bytes, and leave no file behind."""
+    monkeypatch.setattr(etts.tempfile, "tempdir", str(tmp_path))
+    provider = _FileProvider()
+
+    assert provider.generate_bytes("Om", voice="nova") == b"Om|[('voice', 'nova')]"
+    assert list(tmp_path.iterdir()) == []
+
+
+# ---------------------------------------------------------------------------
+# 13. PiperTTS — raw PCM is streamed straight to the audio device
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_piper_speak_stream_pipes_raw_pcm_to_the_device(tmp_path):
+    """speak_stream plays piper's --output-raw stdout in chunks at the model's sample rate."""
+    import io
+
+    model = tmp_path / "voice.onnx"
+    model.write_bytes(b"")
+    (tmp_path / "voice.onnx.json").write_text(json.dumps({"audio": {"sample_rate": 16000}}))
+
+    piper = etts.PiperTTS.__new__(etts.PiperTTS)
+    etts.TTSProvider.__init__(piper, "Piper TTS")
+    piper.piper_path, piper.model_path = "piper", model
+    piper.sample_rate = etts.PiperTTS._model_sample_rate(model)
+    assert piper.sample_rate == 16000
+
+    process = MagicMock()
+    process.stdout = io.BytesIO(b"\x01\x00" * (etts.PIPER_STREAM_CHUNK // 2 + 10))
+    process.stderr = io.BytesIO(b"")
+    process.wait.return_value = 0
+    sounddevice = MagicMock()
+    output = sounddevice.RawOutputStream.return_value.__enter__.return_value
+
+    with (
+        patch.dict("sys.modules", {"sounddevice": sounddevice}),
+        patch("subprocess.Popen", return_value=process) as popen,
+    ):
+        assert piper.speak_stream("Om") is True
+
+    assert popen.call_args.args[0] == ["piper", "--model", str(model), "--output-raw"]
+    process.stdin.write.assert_called_once_with(b"Om")
+    sounddevice.RawOutputStream.assert_called_once_with(samplerate=16000, channels=1, dtype="int16")
+    assert [len(call.args[0]) for call in output.write.call_args_list] == [etts.PIPER_STREAM_CHUNK, 20]
+
+
+@pytest.mark.unit
+def test_openai_speak_stream_plays_pcm_chunks_as_they_arrive():
+    """OpenAI asks for raw PCM and each streamed chunk goes straight to the device."""
+    openai = etts.OpenAITTS.__new__(etts.OpenAITTS)
+    etts.TTSProvider.__init__(openai, "OpenAI TTS")
+    openai.client = MagicMock()
+    create = openai.client.audio.speech.with_streaming_response.create
+    create.return_value.__enter__.return_value.iter_bytes.return_value = iter([b"\x01\x00" * 4, b"\x02\x00"])
+    sounddevice = MagicMock()
+    output = sounddevice.RawOutputStream.return_value.__enter__.return_value
+
+    with patch.dict("sys.modules", {"sounddevice": sounddevice}):
+        assert openai.speak_stream("Om", voice="alloy") is True
+
+    create.assert_called_once_with(model="tts-1", voice="alloy", input="Om", response_format="pcm")
+    create.return_value.__enter__.return_value.iter_bytes.assert_called_once_with(etts.OPENAI_STREAM_CHUNK)
+    sounddevice.RawOutputStream.assert_called_once_with(samplerate=etts.OPENAI_PCM_RATE, channels=1, dtype="int16")
+    assert [call.args[0] for call in output.write.call_args_list] == [b"\x01\x00" * 4, b"\x02\x00"]
+
+
+# ---------------------------------------------------------------------------
+# 14. Provider setup runs concurrently
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_providers_initialise_concurrently_in_priority_order():
+    """Slow providers are built side by side; thread-bound ones on the caller's thread."""
+    import threading
+
+    barrier = threading.Barrier(2, timeout=5)
+    built_on: dict[str, threading.Thread] = {}
+
+    def stub(name: str, waits: bool = False, caller_thread: bool = False, fails: bool = False):
+        def __init__(self):
+            etts.TTSProvider.__init__(self, name)
+            built_on[name] = threading.current_thread()
+            if waits:
+                barrier.wait()  # only passes if both waiting providers run at once
+            if fails:
+                raise RuntimeError("boom")
+            self.available = name == "pyttsx3"
+
+        return type(
+            f"Fake_{name.replace(' ', '')}",
+            (etts.TTSProvider,),
+            {
+                "__init__": __init__,
+                "init_in_caller_thread": caller_thread,
+            },
+        )
+
+    classes = {
+        "OpenAITTS": stub("OpenAI TTS", waits=True),
+        "ElevenLabsTTS": stub("ElevenLabs"),
+        "AzureTTS": stub("Azure TTS", waits=True),
+        "GoogleCloudTTS": stub("Google Cloud TTS", fails=True),
+        "CoquiTTS": stub("Coqui TTS"),
+        "PiperTTS": stub("Piper TTS"),
+        "Pyttsx3TTS": stub("pyttsx3", caller_thread=True),
+    }
+
+    with patch.multiple(etts, **classes):
+        engine = etts.EnhancedTTSEngine(prefer_local=False, cache_dir=None)
+
+    assert list(engine.providers) == ["OpenAI TTS", "ElevenLabs", "Azure TTS", "Coqui TTS", "Piper TTS", "pyttsx3"]
+    assert built_on["pyttsx3"] is threading.current_thread()
+    assert built_on["OpenAI TTS"] is not threading.current_thread()
+    assert engine.get_current_provider() == "pyttsx3"
+
+
+# ---------------------------------------------------------------------------
+# 15. ElevenLabsTTS — text streamed in, audio streamed out over a websocket
+# ---------------------------------------------------------------------------
+
+
+class _FakeSocket:
+    """Websocket stand-in: records sends and answers once the input is closed."""
+
+    def __init__(self, replies: list[dict]):
+        self.sent: list[dict] = []
+        self.replies = replies
+        self.closed = asyncio.Event()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def send(self, message: str):
+        self.sent.append(json.loads(message))
+        if self.sent[-1]["text"] == "":
+            self.closed.set()
+
+    async def close(self):
+        self.closed.set()
+
+    async def __aiter__(self):
+        # First audio arrives before the input is closed
+        yield json.dumps(self.replies[0])
+        await self.closed.wait()
+        for reply in self.replies[1:]:
+            yield json.dumps(reply)
+
+
+def _elevenlabs_provider() -> etts.ElevenLabsTTS:
+    provider = etts.ElevenLabsTTS.__new__(etts.ElevenLabsTTS)
+    etts.TTSProvider.__init__(provider, "ElevenLabs")
+    provider.api_key = "key"
+    provider._voice_ids = {}
+    voice = MagicMock(voice_id="bella-id")
+    voice.name = "Bella"
+    provider.voices_func = MagicMock(return_value=[voice])
+    return provider
+
+
+@pytest.mark.unit
+async def test_elevenlabs_speak_stream_async_yields_audio_while_text_streams():
+    """Tokens are sent as they arrive and decoded audio is yielded before the input ends."""
+    provider = _elevenlabs_provider()
+    socket = _FakeSocket(
+        [
+            {"audio": base64.b64encode(b"first").decode()},
+            {"audio": base64.b64encode(b"rest").decode()},
+            {"audio": None, "isFinal": True},
+        ]
+    )
+    websockets = MagicMock()
+    websockets.connect.return_value = socket
+
+    async def tokens():
+        yield "Om "
+        yield ""
+        yield "mani"
+
+    with patch.dict("sys.modules", {"websockets": websockets}):
+        audio = [chunk async for chunk in provider.speak_stream_async(tokens())]
+
+    assert audio == [b"first", b"rest"]
+    assert websockets.connect.call_args.args[0] == etts.ELEVENLABS_STREAM_URL.format(
+        voice_id="bella-id", model="eleven_monolingual_v1"
+    )
+    assert socket.sent[0] == {"text": " ", "voice_settings": etts.ELEVENLABS_VOICE_SETTINGS, "xi_api_key": "key"}
+    assert socket.sent[1:] == [
+        {"text": "Om ", "try_trigger_generation": True},
+        {"text": "mani", "try_trigger_generation": True},
+        {"text": ""},
+    ]
+
+
+@pytest.mark.unit
+async def test_elevenlabs_speak_stream_async_ends_and_reports_failed_text_source():
+    """A failing text iterator closes the socket, ends the stream and sets ``error_msg``."""
+    provider = _elevenlabs_provider()
+    socket = _FakeSocket([{"audio": base64.b64encode(b"first").decode()}])
+    websockets = MagicMock()
+    websockets.connect.return_value = socket
+
+    async def tokens():
+        yield "Om"
+        raise RuntimeError("llm dropped")
+
+    with patch.dict("sys.modules", {"websockets": websockets}):
+        audio = [chunk async for chunk in provider.speak_stream_async(tokens(), voice="custom-id")]
+
+    assert audio == [b"first"]
+    assert "llm dropped" in provider.error_msg
+    assert "custom-id" in websockets.connect.call_args.args[0]
+
+
+# ---------------------------------------------------------------------------
+# 16. speak — failover, circuit breaker and latency tracking
+# ---------------------------------------------------------------------------
+
+
+def _speaking_provider(name: str, ok: bool | Exception = True) -> etts.TTSProvider:
+    """Available provider whose ``speak`` returns ``ok``, or raises it if it is an exception."""
+    provider = etts.TTSProvider(name)
+    provider.available = True
+    speak = MagicMock(side_effect=ok) if isinstance(ok, Exception) else MagicMock(return_value=ok)
+    provider.speak = speak  # type: ignore[method-assign]
+    return provider
+
+
+def _engine_of(*providers: etts.TTSProvider) -> etts.EnhancedTTSEngine:
+    engine = etts.EnhancedTTSEngine.__new__(etts.EnhancedTTSEngine)
+    engine.providers = {provider.name: provider for provider in providers}
+    engine.active_provider = providers[0]
+    return engine
+
+
+@pytest.mark.unit
+def test_speak_falls_back_and_cools_down_a_failing_provider():
+    """Failures (False or raised) move on down the priority list; repeated ones bench the provider."""
+    openai = _speaking_provider("OpenAI TTS", ok=False)
+    azure = _speaking_provider("Azure TTS", ok=RuntimeError("quota"))
+    pyttsx3 = _speaking_provider("pyttsx3")
+    engine = _engine_of(openai, azure, pyttsx3)
+
+    for _ in range(etts.TTS_FAILURE_THRESHOLD):
+        assert engine.speak("Om") is True
+    assert openai.speak.call_count == azure.speak.call_count == etts.TTS_FAILURE_THRESHOLD
+    assert "quota" in azure.error_msg
+    assert openai.cooldown_until > time.monotonic() and azure.cooldown_until > time.monotonic()
+
+    # Both are benched now: only the fallback is asked
+    assert engine.speak("Hum") is True
+    assert openai.speak.call_count == etts.TTS_FAILURE_THRESHOLD
+    assert pyttsx3.speak.call_count == etts.TTS_FAILURE_THRESHOLD + 1
+    assert engine.active_provider is openai
+
+    # After the cooldown the preferred provider is tried again
+    openai.cooldown_until = 0.0
+    openai.speak.return_value = True
+    assert engine.speak("Ah") is True
+    assert openai.speak.call_count == etts.TTS_FAILURE_THRESHOLD + 1
+    assert openai.failure_count == 0
+
+
+@pytest.mark.unit
+def test_speak_returns_false_when_every_provider_fails():
+    """With nothing left to try, speak reports failure; a fully benched engine still tries the active one."""
+    openai = _speaking_provider("OpenAI TTS", ok=False)
+    pyttsx3 = _speaking_provider("pyttsx3", ok=False)
+    engine = _engine_of(openai, pyttsx3)
+
+    assert engine.speak("Om") is False
+    assert openai.speak.call_count == pyttsx3.speak.call_count == 1
+
+    openai.cooldown_until = pyttsx3.cooldown_until = time.monotonic() + 60
+    assert engine.speak("Om") is False
+    assert openai.speak.call_count == 2 and pyttsx3.speak.call_count == 1
+
+
+@pytest.mark.unit
+def test_slow_provider_is_tried_after_healthy_ones(tmp_path, monkeypatch):
+    """Synthesis time feeds a moving average; a provider averaging too slow is demoted."""
+    clock = iter([0.0, 1.0, 10.0, 10.5])
+    monkeypatch.setattr(etts.time, "perf_counter", lambda: next(clock))
+    provider = _FileProvider()
+    engine = _engine_with(provider, tmp_path)
+
+    assert engine.generate_audio_file("Om", str(tmp_path / "om.mp3")) is True
+    assert provider.ewma_latency_ms == 1000.0
+    assert engine.generate_audio_file("Hum", str(tmp_path / "hum.mp3")) is True
+    assert provider.ewma_latency_ms == pytest.approx(0.7 * 1000 + 0.3 * 500)
+
+    openai = _speaking_provider("OpenAI TTS")
+    pyttsx3 = _speaking_provider("pyttsx3")
+    openai.ewma_latency_ms = etts.TTS_DEGRADED_LATENCY_MS + 1
+    engine = _engine_of(openai, pyttsx3)
+    assert engine._fallback_order() == [pyttsx3, openai]
+    assert engine.speak("Om") is True
+    openai.speak.assert_not_called()
+
+
+@pytest.mark.unit
+def test_speak_slowly_and_speak_mantra_fail_over_between_file_providers(monkeypatch):
+    """Synthesis for played-back clips goes through the same failover and failure counting as ``speak``."""
+    monkeypatch.setattr(etts.time, "sleep", lambda _: None)
+    broken = _FileProvider()
+    broken.name = "OpenAI TTS"
+    broken.generate_audio_file = MagicMock(side_effect=RuntimeError("offline"))  # type: ignore[method-assign]
+    backup = _FileProvider()
+    backup.name = "Piper TTS"
+    engine = _engine_with(broken, None)
+    engine.providers[backup.name] = backup
+
+    assert engine.speak_slowly("Om. Ah.", pause_duration=0) is True
+    assert broken.failure_count == 2 and "offline" in broken.error_msg
+    assert [clip.split(b"|")[0] for clip in backup.played] == [b"Om.", b"Ah."]
+    assert backup.failure_count == 0
+
+    assert engine.speak_mantra("Hum", repetitions=2, pause_duration=0) is True
+    # The third failure in a row benches it
+    assert broken.generate_audio_file.call_count == 3
+    assert broken.cooldown_until > time.monotonic()
+    assert backup.generated.count("Hum") == 1 and len(backup.played) == 4
+    assert engine.active_provider is broken
+
+
+# ---------------------------------------------------------------------------
+# 17. Provider warm-up on selection
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_selecting_a_remote_provider_warms_it_up_in_the_background():
+    """Remote providers get a throwaway request on selection; its failure changes nothing."""
+    import threading
+
+    warmed = threading.Event()
+
+    class Remote(etts.TTSProvider):
+        warm_up_on_select = True
+
+        def warm_up(self):
+            self.error_msg = "warm-up failed"
+            warmed.set()
+            raise ConnectionError("offline")
+
+    remote, local = Remote("OpenAI TTS"), etts.TTSProvider("pyttsx3")
+    remote.available = local.available = True
+    local.warm_up = MagicMock()  # type: ignore[method-assign]
+    engine = _engine_of(local, remote)
+
+    engine._select_provider()
+    assert engine.active_provider is remote
+    assert warmed.wait(timeout=5)
+    for thread in threading.enumerate():
+        if thread.name == "tts-warmup":
+            thread.join(timeout=5)
+    assert remote.error_msg is None
+
+    assert engine.set_provider("pyttsx3") is True
+    local.warm_up.assert_not_called()
+
+
+@pytest.mark.unit
+def test_remote_providers_warm_up_and_local_ones_do_not():
+    """Only providers behind a network connection opt into warm-up; Azure pre-opens its stream connection."""
+    assert [cls.warm_up_on_select for cls in (etts.OpenAITTS, etts.ElevenLabsTTS, etts.AzureTTS)] == [True] * 3
+    assert etts.GoogleCloudTTS.warm_up_on_select
+    assert not any(cls.warm_up_on_select for cls in (etts.CoquiTTS, etts.PiperTTS, etts.Pyttsx3TTS))
+
+    azure = etts.AzureTTS.__new__(etts.AzureTTS)
+    etts.TTSProvider.__init__(azure, "Azure TTS")
+    azure.speechsdk = MagicMock()
+    azure._get_synthesizer = MagicMock()  # type: ignore[method-assign]
+
+    azure.warm_up()
+    azure._get_synthesizer.assert_called_once_with("en-US-JennyNeural", "stream")
+    connection = azure.speechsdk.Connection.from_speech_synthesizer
+    connection.assert_called_once_with(azure._get_synthesizer.return_value)
+    connection.return_value.open.assert_called_once_with(True)
@@ -7,7 +7,9 @@ Covers the public API:
 - :class:`IntegratedHealingProtocol` — cross-system protocol generator.
 
 This module is pure data/lookup logic — no I/O, no DB, no LLM. All tests
-exercise the in-memory behavior contract.
+exercise the in-memory behavior contract, including that the knowledge
+tables are built once and shared read-only and that condition names are
+normalized before lookup.
 """
 
 from __future__ import annotations
@@ -15,6 +17,7 @@ from __future__ import annotations
 import pytest
 
 from core.healing_systems import (
+    ChakraFlag,
     ChakraSystem,
     IntegratedHealingProtocol,
     MeridianSystem,
@@ -39,6 +42,10 @@ def test_module_imports_public_api():
     ):
         assert hasattr(mod, name), f"Missing public symbol: {name}"
 
+    # __all__ lists exactly the public names and each resolves
+    assert {"ChakraSystem", "IntegratedHealingProtocol", "ChakraFlag"} <= set(mod.__all__)
+    assert all(hasattr(mod, name) and not name.startswith("_") for name in mod.__all__)
+
 
 # ---------------------------------------------------------------------------
 # 2. ChakraSystem data + lookup
@@ -72,8 +79,8 @@ def test_chakra_system_has_all_seven_chakras_with_solfeggio_frequencies():
         "sahasrara": 963,
     }
     for name, freq in expected_freq.items():
-        assert sys.chakras[name]["frequency"] == freq
-        assert sys.chakras[name]["seed_mantra"], f"{name} missing seed mantra"
+        assert sys.chakras[name].frequency == freq
+        assert sys.chakras[name].seed_mantra, f"{name} missing seed mantra"
 
 
 @pytest.mark.unit
@@ -91,10 +98,33 @@ def test_chakra_get_chakra_for_condition_known_and_unknown():
     # Case-insensitive lookup
     assert sys.get_chakra_for_condition("DEPRESSION") == ["sahasrara", "anahata"]
 
+    # Spaces and hyphens normalize to the underscore keys
+    assert sys.get_chakra_for_condition(" Lower back-pain ") == ["muladhara"]
+
     # Unknown condition returns an empty list
     assert sys.get_chakra_for_condition("never_heard_of_this") == []
 
 
+@pytest.mark.unit
+def test_chakra_flags_for_condition_mirror_the_name_lists():
+    """ChakraFlag masks hold the same chakras as the name lists, root to crown."""
+    import core.healing_systems as mod
+
+    sys = ChakraSystem()
+    assert [member.name.lower() for member in ChakraFlag] == list(mod._CHAKRAS)
+
+    anxiety = sys.get_chakra_flags_for_condition("Anxiety")
+    assert anxiety == ChakraFlag.MULADHARA | ChakraFlag.ANAHATA
+    assert ChakraFlag.ANAHATA in anxiety and ChakraFlag.AJNA not in anxiety
+    assert (anxiety | sys.get_chakra_flags_for_condition("headache")).as_names() == ["muladhara", "anahata", "ajna"]
+
+    for condition in mod._CHAKRA_CONDITIONS:
+        names = sys.get_chakra_for_condition(condition)
+        assert sorted(sys.get_chakra_flags_for_condition(condition).as_names()) == sorted(names)
+
+    assert sys.get_chakra_flags_for_condition("never_heard_of_this") == ChakraFlag(0)
+
+
 @pytest.mark.unit
 def test_chakra_get_healing_protocol_returns_structured_dict():
     """get_healing_protocol returns frequencies/mantra/color/element/practices."""
@@ -113,6 +143,45 @@ def test_chakra_get_healing_protocol_returns_structured_dict():
     assert sys.get_healing_protocol("nonexistent_chakra") == {}
 
 
+@pytest.mark.unit
+def test_chakra_frequencies_array_gathers_in_order():
+    """get_frequencies_array gathers int16 frequencies in the requested order."""
+    import numpy as np
+
+    sys = ChakraSystem()
+    freqs = sys.get_frequencies_array(["anahata", "unknown", "muladhara"])
+    assert freqs.dtype == np.int16
+    assert freqs.tolist() == [639, 396]
+    assert sys.get_frequencies_array([]).tolist() == []
+
+    # The gathered array is the caller's own copy
+    freqs[0] = 0
+    assert sys.get_frequencies_array(["anahata"]).tolist() == [639]
+
+
+@pytest.mark.unit
+def test_chakra_protocols_are_built_once_and_copied_out():
+    """The shared per-chakra protocol is cached; each caller gets an independent copy."""
+    import core.healing_systems as mod
+
+    assert mod._chakra_protocol("anahata") is mod._chakra_protocol("anahata")
+
+    # The per-field columns agree with the per-chakra records they are derived from
+    for name, chakra in mod._CHAKRAS.items():
+        i = mod._CHAKRA_INDEX[name]
+        assert (mod._FREQUENCIES[i], mod._COLORS[i], mod._PRACTICES[i]) == (
+            chakra.frequency,
+            chakra.color,
+            chakra.healing_practices,
+        )
+
+    sys = ChakraSystem()
+    first = sys.get_healing_protocol("anahata")
+    first["practices"].append("Gratitude")
+    first["frequencies"][0] = 0
+    assert sys.get_healing_protocol("anahata") == {**first, "frequencies": [639], "practices": first["practices"][:-1]}
+
+
 # ---------------------------------------------------------------------------
 # 3. MeridianSystem
 # ---------------------------------------------------------------------------
@@ -142,6 +211,30 @@ def test_meridian_get_meridian_for_time_covers_chinese_medicine_clock():
         assert sys.get_meridian_for_time(hour) == expected_meridian, f"Hour {hour} should map to {expected_meridian}"
 
 
+@pytest.mark.unit
+def test_meridian_clock_covers_every_hour_and_wraps():
+    """All 24 hours map to a two-hour window; hours outside 0-23 wrap around the clock."""
+    sys = MeridianSystem()
+    hours = [sys.get_meridian_for_time(hour) for hour in range(24)]
+
+    assert hours[23] == hours[0] == "gallbladder"
+    assert hours[1] == hours[2] == "liver"
+    assert all(hours.count(meridian) == 2 for meridian in set(hours))
+    assert sys.get_meridian_for_time(27) == "lung"
+    assert sys.get_meridian_for_time(-1) == "gallbladder"
+
+
+@pytest.mark.unit
+def test_meridians_for_hours_matches_single_lookups():
+    """The batch clock lookup agrees with get_meridian_for_time hour by hour."""
+    import numpy as np
+
+    sys = MeridianSystem()
+    hours = np.arange(-30, 50)
+    assert sys.get_meridians_for_hours(hours).tolist() == [sys.get_meridian_for_time(int(h)) for h in hours]
+    assert sys.get_meridians_for_hours([3]).tolist() == ["lung"]
+
+
 @pytest.mark.unit
 def test_meridian_get_meridian_for_condition_returns_list():
     """get_meridian_for_condition returns a list (possibly empty) for any input."""
@@ -155,6 +248,21 @@ def test_meridian_get_meridian_for_condition_returns_list():
     assert sys.get_meridian_for_condition("unknown_xyz") == []
 
 
+@pytest.mark.unit
+def test_condition_lookups_share_one_merged_table():
+    """Both systems answer from the merged table and hand out independent lists."""
+    chakras, meridians = ChakraSystem(), MeridianSystem()
+
+    # "headache" is mapped by both systems, "anxiety" only by the chakras
+    assert chakras.get_chakra_for_condition("Headache") == ["ajna"]
+    assert meridians.get_meridian_for_condition("Headache") == ["liver", "gallbladder", "stomach"]
+    assert meridians.get_meridian_for_condition("anxiety") == []
+
+    first = meridians.get_meridian_for_condition("headache")
+    first.append("mutated")
+    assert "mutated" not in meridians.get_meridian_for_condition("headache")
+
+
 # ---------------------------------------------------------------------------
 # 4. TibetanChannelSystem data shape
 # ---------------------------------------------------------------------------
@@ -201,6 +309,60 @@ def test_integrated_protocol_generate_protocol_aggregates_chakra_data():
     assert isinstance(result["practices"], list) and result["practices"]
 
 
+@pytest.mark.unit
+def test_integrated_protocol_drops_shared_practices(monkeypatch):
+    """Practices shared by several chakras appear once, in first-seen order."""
+    import core.healing_systems as mod
+
+    # ajna and sahasrara both prescribe "Meditation"
+    monkeypatch.setattr(mod, "_CONDITION_TABLE", {"insight": (("ajna", "sahasrara"), ())})
+    index = mod._build_condition_index()["insight"]
+
+    assert index["practices"].count("Meditation") == 1
+    assert index["practices"][0] == mod._PRACTICES[mod._CHAKRA_INDEX["ajna"]][0]
+    assert index["frequencies"] == (852, 963)
+
+
+@pytest.mark.unit
+def test_integrated_protocol_matches_per_chakra_aggregation():
+    """Precomputed protocols equal aggregating each chakra's protocol, and are fresh per call."""
+    import core.healing_systems as mod
+
+    proto = IntegratedHealingProtocol()
+    chakras, meridians = ChakraSystem(), MeridianSystem()
+    for condition in {*mod._CHAKRA_CONDITIONS, *mod._MERIDIAN_CONDITIONS}:
+        result = proto.generate_protocol(condition.upper())
+        names = chakras.get_chakra_for_condition(condition)
+        assert result["condition"] == condition.upper()
+        assert result["chakras_involved"] == names
+        assert result["meridians_involved"] == meridians.get_meridian_for_condition(condition)
+        freqs = [f for n in names for f in chakras.get_healing_protocol(n)["frequencies"]]
+        practices = [p for n in names for p in chakras.get_healing_protocol(n)["practices"]]
+        assert result["frequencies"] == list(dict.fromkeys(freqs))
+        assert result["practices"] == list(dict.fromkeys(practices))
+
+    first = proto.generate_protocol("anxiety")
+    first["frequencies"].append(0)
+    first["chakras_involved"].clear()
+    assert proto.generate_protocol("anxiety")["frequencies"] == [396, 639]
+    assert proto.generate_protocol("anxiety")["chakras_involved"] == ["muladhara", "anahata"]
+
+
+@pytest.mark.unit
+def test_integrated_protocol_builds_subsystems_on_first_access():
+    """Sub-systems are created lazily and then reused."""
+    proto = IntegratedHealingProtocol()
+    assert "tibetan_system" not in vars(proto)
+
+    proto.generate_protocol("anxiety")
+    assert "tibetan_system" not in vars(proto)
+
+    assert isinstance(proto.tibetan_system, TibetanChannelSystem)
+    assert proto.tibetan_system is proto.tibetan_system
+    assert isinstance(proto.meridian_system, MeridianSystem)
+    assert isinstance(proto.chakra_system, ChakraSystem)
+
+
 @pytest.mark.unit
 def test_integrated_protocol_create_session_plan_has_three_phases():
     """create_session_plan returns a plan with opening/main/closing phases."""
@@ -220,6 +382,12 @@ def test_integrated_protocol_create_session_plan_has_three_phases():
     # Phase durations must sum to the total duration
     assert sum(p["duration"] for p in plan["phases"]) == 45
 
+    # Plans are filled from a shared skeleton but never share mutable state
+    plan["phases"][0]["practices"].append("Chanting")
+    again = proto.create_session_plan(intention="calm", duration_minutes=30)
+    assert again["phases"][0]["practices"] == ["Breath awareness", "Body scan"]
+    assert [p["duration"] for p in again["phases"]] == [5, 20, 5]
+
 
 # ---------------------------------------------------------------------------
 # 6. Error handling
@@ -241,3 +409,87 @@ def test_integrated_protocol_generate_protocol_unknown_condition_safe():
     assert result["mantras"] == []
     # Practices may be empty, but the dict must always be returned
     assert isinstance(result, dict)
+
+    # The miss path has the same shape as a hit and hands out fresh lists
+    assert result.keys() == proto.generate_protocol("anxiety").keys()
+    result["practices"].append("Rest")
+    assert proto.generate_protocol("totally_made_up_condition")["practices"] == []
+
+
+# ---------------------------------------------------------------------------
+# 7. Static knowledge tables
+# ---------------------------------------------------------------------------
+
+
+@pytest.mark.unit
+def test_knowledge_tables_are_shared_and_read_only():
+    """Every instance binds the same import-time tables, which cannot be mutated."""
+    assert ChakraSystem().chakras is ChakraSystem().chakras
+    assert MeridianSystem().primary_meridians is MeridianSystem().primary_meridians
+    assert TibetanChannelSystem().five_winds is TibetanChannelSystem().five_winds
+
+    # The system classes are slotted, so every attribute they expose is declared up front
+    for system in (ChakraSystem(), MeridianSystem(), TibetanChannelSystem()):
+        assert not hasattr(system, "__dict__")
+        assert all(hasattr(system, name) for name in type(system).__slots__)
+
+    chakras = ChakraSystem().chakras
+    with pytest.raises(TypeError):
+        chakras["anahata"] = {}
+    with pytest.raises(AttributeError):
+        chakras["anahata"].frequency = 0
+    # Records are named tuples: no per-instance __dict__
+    assert not hasattr(chakras["anahata"], "__dict__")
+    assert not hasattr(MeridianSystem().primary_meridians["lung"], "__dict__")
+    assert isinstance(chakras["anahata"].healing_practices, tuple)
+    assert isinstance(TibetanChannelSystem().main_channels["central"]["practices"], tuple)
+
+    # Keys are interned, so lookups with interned names hit on identity
+    from sys import intern
+
+    assert all(intern("".join(name)) is name for name in chakras)
+    assert all(intern("".join(name)) is name for name in MeridianSystem().primary_meridians)
+
+    # Protocols hand out their own lists, so callers may extend them freely
+    protocol = ChakraSystem().get_healing_protocol("anahata")
+    protocol["practices"].append("Gratitude")
+    assert "Gratitude" not in chakras["anahata"].healing_practices
+
+
+@pytest.mark.unit
+def test_knowledge_tables_hold_no_mutable_containers():
+    """Every value reachable from the static tables is a tuple, mapping proxy, record, or scalar."""
+    import core.healing_systems as mod
+
+    def walk(value):
+        assert not isinstance(value, list | dict | set), value
+        if isinstance(value, tuple):
+            for item in value:
+                walk(item)
+        elif hasattr(value, "values"):
+            for item in value.values():
+                walk(item)
+
+    for table in (
+        mod._CHAKRAS,
+        mod._CHAKRA_CONDITIONS,
+        mod._PRIMARY_MERIDIANS,
+        mod._EXTRAORDINARY_VESSELS,
+        mod._MERIDIAN_CONDITIONS,
+        mod._MAIN_CHANNELS,
+        mod._CHANNEL_WHEELS,
+        mod._FIVE_WINDS,
+        mod._CONDITION_PROTOCOLS,
+    ):
+        walk(table)
+
+
+@pytest.mark.unit
+def test_import_stays_light():
+    """Importing the module pulls in neither the audio stack nor dataclasses/inspect."""
+    import subprocess
+    import sys
+
+    code = "import sys, core.healing_systems; print(sorted({'core.audio_generator', 'dataclasses'} & set(sys.modules)))"
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    assert out.stdout.strip() == "[]"
@@ -7,7 +7,9 @@ Covers the public API:
   - ``encode_intention`` — returns a frequency seed for every intention.
   - ``select_frequency`` — picks from the Solfeggio map.
   - ``broadcast_to_targets`` — pure fallback path (all subsystems
-    mocked / disabled), so no audio / DB / LLM is exercised.
+    mocked / disabled), so no audio / DB / LLM is exercised, plus the
+    scalar loop (inline and on the producer thread) and the breathing
+    schedule driven by a stub generator, and the ``out`` report stream.
 
 The heavy subsystems (``HybridScalarWaveGenerator``, ``BlessingDatabase``,
 ``EnergeticAnatomyDatabase``) are mocked at the module level so the
@@ -166,6 +168,10 @@ def test_select_frequency_returns_mapped_solfeggio(broadcaster: IntegratedScalar
         actual = broadcaster.select_frequency(intention)
         assert actual == expected_freq, f"{intention} → {actual}, expected {expected_freq}"
 
+    # The lookup reads the instance table, so per-broadcaster overrides still apply
+    broadcaster.frequencies["unity"] = 999.0
+    assert broadcaster.select_frequency(IntentionType.WISDOM) == 999.0
+
 
 # ---------------------------------------------------------------------------
 # 4. broadcast_to_targets — pure fallback path
@@ -230,3 +236,270 @@ def test_broadcast_to_targets_with_explicit_frequency_preserves_value(
     assert results["config"]["frequency"] == 440.0
     assert broadcaster.total_broadcasts == 1
     assert broadcaster.total_operations == 0  # no scalar ops when duration == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("has_numba", [True, False])
+def test_broadcast_scalar_loop_uses_numpy_batches(
+    broadcaster: IntegratedScalarRadionicsBroadcaster, monkeypatch, has_numba: bool
+):
+    """With NumPy available, the scalar loop pulls large vectorized batches and counts 7 ops per sample.
+
+    Batches are generated on the producer thread only when numba can release the GIL.
+    """
+    import threading
+
+    import core.integrated_scalar_radionics as mod
+
+    pytest.importorskip("numpy")
+    monkeypatch.setattr(mod, "HAS_NUMPY", True)
+    monkeypatch.setattr(mod, "HAS_NUMBA", has_numba)
+
+    requested = []
+
+    buffers = set()
+    threads = set()
+
+    def fake_batch(n, out):
+        requested.append(n)
+        buffers.add(id(out))
+        threads.add(threading.current_thread().name)
+        out[:n] = 0.0
+        return out[:n]
+
+    gen = MagicMock()
+    gen.generate_hybrid_stream_np.side_effect = fake_batch
+    gen.thermal.state.temperature = 50.0
+    broadcaster.scalar_gen = gen
+
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.HEALING,
+        target_count=1,
+        duration_seconds=0.05,
+        scalar_intensity=0.5,
+        frequency_hz=None,
+        mantra="Om",
+    )
+    results = broadcaster.broadcast_to_targets(cfg)
+
+    assert requested and set(requested) == {mod.SCALAR_BATCH_NUMPY // 2}
+    # The producer may have run ahead; only batches the loop consumed are counted
+    consumed, remainder = divmod(results["operations"], 7 * (mod.SCALAR_BATCH_NUMPY // 2))
+    assert remainder == 0 and 1 <= consumed <= len(requested)
+    assert isinstance(results["operations"], int)
+    # Every batch was written into the same preallocated buffer
+    assert len(buffers) == 1
+    assert threads == {"scalar-producer" if has_numba else threading.current_thread().name}
+    gen.generate_hybrid_stream.assert_not_called()
+
+
+@pytest.mark.unit
+def test_background_batches_stop_the_producer_and_surface_its_errors():
+    """Closing the sample-count generator joins the producer thread; a producer exception is re-raised."""
+    import threading
+
+    counts = IntegratedScalarRadionicsBroadcaster._sample_counts_in_background(lambda n: [0.0] * n, 4)
+    assert next(counts) == 4
+    counts.close()
+    assert not any(t.name == "scalar-producer" for t in threading.enumerate())
+
+    def failing(_n):
+        raise RuntimeError("generator failed")
+
+    with pytest.raises(RuntimeError, match="generator failed"):
+        next(IntegratedScalarRadionicsBroadcaster._sample_counts_in_background(failing, 4))
+
+
+@pytest.mark.unit
+def test_broadcast_scalar_loop_runs_on_monotonic_ns_and_rate_limits_progress(
+    broadcaster: IntegratedScalarRadionicsBroadcaster, monkeypatch, capsys
+):
+    """The loop reads the clock once per batch and redraws progress at most every PROGRESS_INTERVAL_NS."""
+    import itertools
+
+    import core.integrated_scalar_radionics as mod
+
+    # A fake clock that advances 100 ms per reading
+    ticks = itertools.count(0, 100_000_000)
+    monkeypatch.setattr(mod.time, "monotonic_ns", lambda: next(ticks))
+    monkeypatch.setattr(mod, "HAS_NUMPY", False)
+
+    gen = MagicMock()
+    gen.generate_hybrid_stream.side_effect = lambda n: [0.0] * n
+    gen.thermal.state.temperature = 50.0
+    broadcaster.scalar_gen = gen
+
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.HEALING,
+        target_count=1,
+        duration_seconds=2.0,
+        scalar_intensity=1.0,
+        frequency_hz=None,
+        mantra="Om",
+    )
+    results = broadcaster.broadcast_to_targets(cfg)
+
+    # Readings at 0.1 s .. 2.0 s end one batch each; progress redraws every third reading
+    assert gen.generate_hybrid_stream.call_count == 20
+    assert results["operations"] == 20 * mod.SCALAR_BATCH_PYTHON * 7
+    out = capsys.readouterr().out
+    assert out.count("MMOPS") == 7
+    # The bar comes from the precomputed table
+    assert f"| {mod._PROGRESS_BARS[1]} 5%" in out
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("has_numpy", [True, False])
+def test_breathing_broadcast_follows_the_precomputed_ramp(
+    broadcaster: IntegratedScalarRadionicsBroadcaster, monkeypatch, has_numpy: bool
+):
+    """Breathing batches come from the step schedule, and their operations reach the results.
+
+    With NumPy they are vectorized batches written into one buffer sized for the largest step.
+    """
+    import itertools
+
+    import core.integrated_scalar_radionics as mod
+
+    if has_numpy:
+        pytest.importorskip("numpy")
+    monkeypatch.setattr(mod, "HAS_NUMPY", has_numpy)
+    # A fake clock that advances one second per reading
+    ticks = itertools.count(0, mod.NS_PER_SECOND)
+    monkeypatch.setattr(mod.time, "monotonic_ns", lambda: next(ticks))
+    monkeypatch.setattr(mod.time, "sleep", lambda _s: None)
+
+    buffers = set()
+
+    def fake_batch(n, out):
+        buffers.add((id(out), len(out)))
+        return out[:n]
+
+    gen = MagicMock()
+    gen.generate_hybrid_stream.side_effect = lambda n: [0.0] * n
+    gen.generate_hybrid_stream_np.side_effect = fake_batch
+    broadcaster.scalar_gen = gen
+
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.PEACE,
+        target_count=1,
+        duration_seconds=1.0,
+        scalar_intensity=0.5,
+        frequency_hz=None,
+        mantra="Om",
+        breathing_pattern=True,
+    )
+    inhale, hold, exhale = broadcaster._breathing_schedule(cfg.scalar_intensity)
+    assert (inhale[0], inhale[-1]) == (10, 499)
+    assert set(hold) == {500}
+    assert (exhale[0], exhale[-1]) == (500, 10)
+
+    results = broadcaster.broadcast_to_targets(cfg)
+
+    used, unused = (
+        (gen.generate_hybrid_stream_np, gen.generate_hybrid_stream)
+        if has_numpy
+        else (gen.generate_hybrid_stream, gen.generate_hybrid_stream_np)
+    )
+    unused.assert_not_called()
+    if has_numpy:
+        assert len(buffers) == 1 and next(iter(buffers))[1] == 500
+    sizes = [call.args[0] for call in used.call_args_list]
+    per_second = mod.BREATH_STEPS_PER_SECOND
+    # Each phase reads the clock at 1 s, 2 s, ... and stops at its length
+    assert sizes[:3] == [inhale[per_second], inhale[2 * per_second], inhale[3 * per_second]]
+    assert len(sizes) == mod.BREATH_INHALE_SECONDS + mod.BREATH_HOLD_SECONDS + mod.BREATH_EXHALE_SECONDS - 3
+    assert results["operations"] == 7 * sum(sizes)
+
+
+@pytest.mark.unit
+def test_back_to_back_broadcasts_reuse_the_target_list(broadcaster: IntegratedScalarRadionicsBroadcaster):
+    """Targets are fetched once per TTL window and re-read after dedications are written."""
+    db = MagicMock()
+    db.get_all_targets.return_value = []
+    broadcaster.blessing_db = db
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.PEACE,
+        target_count=3,
+        duration_seconds=0.0,
+        scalar_intensity=0.5,
+        frequency_hz=None,
+        mantra="Om",
+    )
+
+    broadcaster.broadcast_to_targets(cfg)
+    broadcaster.broadcast_to_targets(cfg)
+    assert db.get_all_targets.call_count == 1
+
+    broadcaster.invalidate_caches()
+    broadcaster.broadcast_to_targets(cfg)
+    assert db.get_all_targets.call_count == 2
+
+    # Writing dedications invalidates the cache
+    target = MagicMock(identifier="t1")
+    target.name = "Target One"
+    db.get_all_targets.return_value = [target]
+    broadcaster.invalidate_caches()
+    broadcaster.broadcast_to_targets(cfg)
+    broadcaster.broadcast_to_targets(cfg)
+    assert db.get_all_targets.call_count == 4
+    # One batched dedication write per broadcast
+    assert db.record_dedications_batch.call_count == 2
+    assert db.record_dedications_batch.call_args.kwargs["target_identifiers"] == ["t1"]
+
+
+@pytest.mark.unit
+def test_target_listing_shows_first_five_and_a_remainder(broadcaster: IntegratedScalarRadionicsBroadcaster, capsys):
+    """The joined target listing keeps one line per shown target plus the '... and N more' line."""
+    targets = []
+    for i in range(7):
+        target = MagicMock(identifier=f"t{i}")
+        target.name = f"Target {i}"
+        targets.append(target)
+    broadcaster.blessing_db = MagicMock()
+    broadcaster.blessing_db.get_all_targets.return_value = targets
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.LOVE,
+        target_count=7,
+        duration_seconds=0.0,
+        scalar_intensity=0.5,
+        frequency_hz=None,
+        mantra="Om",
+    )
+
+    broadcaster.broadcast_to_targets(cfg)
+
+    out = capsys.readouterr().out
+    assert "📡 Broadcasting to 7 targets\n   • Target 0\n" in out
+    assert "   • Target 4\n   ... and 2 more\n" in out
+    assert "Target 5" not in out
+
+
+@pytest.mark.unit
+def test_broadcast_report_goes_to_the_given_stream(broadcaster: IntegratedScalarRadionicsBroadcaster, capsys):
+    """An explicit ``out`` receives the whole report; redirected stdout gets it in a single write."""
+    import io
+    import sys
+
+    cfg = BroadcastConfiguration(
+        intention=IntentionType.WISDOM,
+        target_count=1,
+        duration_seconds=0.0,
+        scalar_intensity=0.5,
+        frequency_hz=None,
+        mantra="Om",
+    )
+    sink = io.StringIO()
+    broadcaster.broadcast_to_targets(cfg, out=sink)
+    assert "BROADCAST COMPLETE" in sink.getvalue()
+    assert capsys.readouterr().out == ""
+
+    writes = []
+    stdout = MagicMock()
+    stdout.isatty.return_value = False
+    stdout.write.side_effect = writes.append
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(sys, "stdout", stdout)
+        broadcaster.broadcast_to_targets(cfg)
+    assert len(writes) == 1
+    assert writes[0] == sink.getvalue()